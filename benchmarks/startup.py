@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+'''
+    Guards time to first output of fviz command line, which is invoked
+    from batch scripts many times over, so importing `fviz.main` must
+    not pull in plotting stack ( matplotlib, seaborn, pandas, scipy )
+
+    $ python benchmarks/startup.py [ --runs N ] [ --budget SECONDS ]
+
+    Exits with non-zero status, when median startup time of any
+    scenario exceeds budget, or plotting stack gets imported eagerly
+'''
+
+from argparse import ArgumentParser
+from subprocess import run, PIPE
+from statistics import median
+from time import perf_counter
+from os.path import abspath, dirname
+from typing import List
+import sys
+
+_ROOT = dirname(dirname(abspath(__file__)))
+
+# modules, which must only be imported while rendering
+_PLOTTING = ('matplotlib', 'seaborn', 'pandas', 'scipy')
+
+# command line invocations, which are expected to answer right away
+_SCENARIOS = (
+    ('help', ['--help']),
+    ('bad args', ['missing.zip', 'plots']),
+    ('unknown plot', ['missing.zip', 'plots', '--only', 'none'])
+)
+
+
+def _timeTaken(cmd: List[str]) -> float:
+    '''
+        Seconds taken by command, since being launched, till it exits
+    '''
+    _start = perf_counter()
+    run(cmd, cwd=_ROOT, stdout=PIPE, stderr=PIPE)
+    return perf_counter() - _start
+
+
+def _timeToFirstOutput(args: List[str]) -> float:
+    '''
+        Seconds taken by fviz, invoked with given arguments, where
+        each scenario writes its output only just before exiting
+    '''
+    return _timeTaken([sys.executable, '-m', 'fviz.main', *args])
+
+
+def _eagerImports() -> List[str]:
+    '''
+        Modules of plotting stack, imported along with `fviz.main`
+    '''
+    _probe = 'import sys, fviz.main; print(" ".join(sorted(sys.modules)))'
+    _modules = run([sys.executable, '-c', _probe], cwd=_ROOT, stdout=PIPE, text=True).stdout.split()
+
+    return sorted(set([i.split('.')[0] for i in _modules]) & set(_PLOTTING))
+
+
+def main() -> int:
+    parser = ArgumentParser()
+    parser.add_argument('--runs',
+                        type=int,
+                        default=10,
+                        help='Number of runs of each scenario')
+    parser.add_argument('--budget',
+                        type=float,
+                        default=.5,
+                        help='Allowed median time to first output, in seconds')
+    args = parser.parse_args()
+
+    _failed = False
+
+    _eager = _eagerImports()
+    if _eager:
+        print('[!] fviz.main imports {} eagerly'.format(', '.join(_eager)))
+        _failed = True
+
+    # for reference, cost of bare interpreter startup
+    print('[+] {:<14} median {:.3f} s'.format(
+        'interpreter',
+        median([_timeTaken([sys.executable, '-c', 'pass']) for _ in range(args.runs)])))
+
+    for name, _args in _SCENARIOS:
+        _times = [_timeToFirstOutput(_args) for _ in range(args.runs)]
+        _median = median(_times)
+
+        print('[{}] {:<14} median {:.3f} s, min {:.3f} s, max {:.3f} s'.format(
+            '+' if _median <= args.budget else '!',
+            name,
+            _median,
+            min(_times),
+            max(_times)))
+        _failed = _failed or _median > args.budget
+
+    return 1 if _failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
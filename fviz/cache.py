@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+
+from typing import List, Any
+from os import listdir, remove, replace, makedirs
+from os.path import join, exists, expanduser
+from hashlib import sha256
+from zipfile import ZipFile
+from fnmatch import fnmatch
+from pickle import dump, load, HIGHEST_PROTOCOL
+from re import sub
+from . import __version__
+from .extract import MEMBERS
+
+# default location of parsed export cache
+CACHE_DIR = join(expanduser('~'), '.cache', 'fviz')
+_SUFFIX = '.pickle'
+# bumped whenever pickled layout of models changes
+_FORMAT = 4
+_INDEX_SUFFIX = '.index'
+
+
+class Cache:
+    '''
+        On disk cache of parsed models of an export, so that
+        a rerun against same archive doesn't need to parse anything
+
+        Entries are keyed by digest of CRC & size of all members
+        fviz reads from archive ( taken from zip's central directory,
+        so no decompression required ) along with fviz version
+    '''
+
+    def __init__(self, root: str = CACHE_DIR):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, src: str, *extra: Any) -> str:
+        '''
+            Computes cache key of archive, where `extra` holds
+            options affecting representation of parsed models
+        '''
+        _digest = sha256('{}|{}|{}'.format(__version__, _FORMAT, extra).encode())
+
+        with ZipFile(src) as zf:
+            for i in sorted(zf.infolist(), key=lambda e: e.filename):
+                if not any(fnmatch(i.filename, j) for j in MEMBERS):
+                    continue
+
+                _digest.update('{}|{}|{}\n'.format(i.filename,
+                                                   i.CRC,
+                                                   i.file_size).encode())
+
+        return _digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return join(self.root, key + _SUFFIX)
+
+    def load(self, key: str) -> Any:
+        '''
+            Returns cached models, None on miss
+        '''
+        try:
+            with open(self._path(key), mode='rb') as fd:
+                _models = load(fd)
+
+            self.hits += 1
+            return _models
+        except Exception:
+            self.misses += 1
+            return None
+
+    def _write(self, path: str, obj: Any) -> bool:
+        try:
+            makedirs(self.root, exist_ok=True)
+
+            # written to temporary file first, so that an interrupted
+            # run never leaves behind a half written entry
+            _tmp = path + '.tmp'
+            with open(_tmp, mode='wb') as fd:
+                dump(obj, fd, protocol=HIGHEST_PROTOCOL)
+
+            replace(_tmp, path)
+            return True
+        except Exception:
+            return False
+
+    def store(self, key: str, models: Any) -> bool:
+        return self._write(self._path(key), models)
+
+    def _remove(self, path: str) -> bool:
+        try:
+            remove(path)
+            return True
+        except Exception:
+            return False
+
+    def invalidate(self, key: str) -> bool:
+        return self._remove(self._path(key))
+
+    @property
+    def entries(self) -> List[str]:
+        if not exists(self.root):
+            return []
+
+        return [i[:-len(_SUFFIX)] for i in listdir(self.root) if i.endswith(_SUFFIX)]
+
+    def _indexPath(self, name: str) -> str:
+        return join(self.root, '{}{}'.format(sub(r'[^\w.-]', '_', name), _INDEX_SUFFIX))
+
+    def loadIndex(self, name: str) -> Any:
+        '''
+            Index is kept across different exports of same account,
+            under given name, returns None if there's none ( or it
+            was written with different pickled layout )
+        '''
+        try:
+            with open(self._indexPath(name), mode='rb') as fd:
+                _format, _index = load(fd)
+
+            return _index if _format == _FORMAT else None
+        except Exception:
+            return None
+
+    def storeIndex(self, name: str, index: Any) -> bool:
+        return self._write(self._indexPath(name), (_FORMAT, index))
+
+    def clear(self) -> int:
+        '''
+            Removes all cached entries & indices, returning
+            how many were removed
+        '''
+        _indices = [i for i in listdir(self.root) if i.endswith(_INDEX_SUFFIX)]\
+            if exists(self.root) else []
+
+        return [self.invalidate(i) for i in self.entries].count(True) +\
+            [self._remove(join(self.root, i)) for i in _indices].count(True)
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
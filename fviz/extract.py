@@ -1,8 +1,21 @@
 #!/usr/bin/python3
 
-from os.path import exists
+from typing import List, Dict, Tuple
+from os.path import exists, join, getsize
 from os import mkdir
 from zipfile import ZipFile
+from fnmatch import fnmatch
+from json import load, dump
+
+# members of export, which are read by fviz
+MEMBERS = [
+    'likes_and_reactions/*.json',
+    'friends/*.json',
+    'comments/*.json',
+    'messages/inbox/*/message_*.json'
+]
+# keeps record of what was extracted in sink directory
+MANIFEST = '.fviz-manifest.json'
 
 
 def makeDir(target: str) -> bool:
@@ -18,18 +31,59 @@ def makeDir(target: str) -> bool:
         return False
 
 
-def extractAll(src: str, sink: str) -> bool:
+def _readManifest(sink: str) -> Dict[str, Tuple[int, int]]:
+    '''
+        Reads manifest of last extraction into this directory,
+        mapping member name to its CRC & uncompressed size
+    '''
+    try:
+        with open(join(sink, MANIFEST), mode='r') as fd:
+            return dict([(k, tuple(v)) for k, v in load(fd).items()])
+    except Exception:
+        return {}
+
+
+def _writeManifest(sink: str, manifest: Dict[str, Tuple[int, int]]) -> bool:
+    try:
+        with open(join(sink, MANIFEST), mode='w') as fd:
+            dump(manifest, fd)
+
+        return True
+    except Exception:
+        return False
+
+
+def extractAll(src: str, sink: str, members: List[str] = MEMBERS) -> bool:
     '''
         Given path to target zip file, it'll extract all components
-        into given target directory
+        matching any of given member patterns into given target directory
+
+        Members already extracted by previous run, which are still
+        on disk and unchanged in archive, are skipped. Passing `None`
+        as patterns extracts whole archive.
     '''
     if not (exists(src) and src.endswith('.zip') and makeDir(sink)):
         return False
 
     try:
-        zf = ZipFile(src)
-        zf.extractall(path=sink)
-        return True
+        _manifest = _readManifest(sink)
+
+        with ZipFile(src) as zf:
+            for i in zf.infolist():
+                if i.is_dir():
+                    continue
+                if members is not None and not any(fnmatch(i.filename, j) for j in members):
+                    continue
+
+                _path = join(sink, i.filename)
+                if _manifest.get(i.filename) == (i.CRC, i.file_size) and\
+                        exists(_path) and getsize(_path) == i.file_size:
+                    continue
+
+                zf.extract(i, path=sink)
+                _manifest[i.filename] = (i.CRC, i.file_size)
+
+        return _writeManifest(sink, _manifest)
     except Exception:
         return False
 
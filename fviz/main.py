@@ -1,36 +1,56 @@
 #!/usr/bin/python3
 
-from argparse import ArgumentParser
-from typing import Tuple, List
-from os.path import exists, abspath, join
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from typing import Any, Callable, Dict, List, Tuple
+from os.path import exists, abspath, join, basename
 from .extract import (
     makeDir,
     extractAll
 )
+from .source import Source, DirSource, ZipSource
+from .cache import Cache, CACHE_DIR
+from .model.memo import stats as memoStats
 from .model.reactions import Reactions
 from .plot.reactions import (
     plotReactionCount,
     plotPeerToReactionCount,
+    prepareHeatMapData,
     plotReactionsOverTimeAsHeatMap,
+    prepareWeeklyReactionHeatMapData,
     plotWeeklyReactionHeatMap,
+    prepareDataForPlottingGroupedBarChartWithTopXPeers,
     plotTopXPeersByMonth,
+    prepareDataForPlottingLinePlot,
     plotAccumulatedUserActivityInEachMinuteOfDay
 )
 from .model.friends import Friends
-from .plot.friends import plotMonthlyFriendsCreated
+from .plot.friends import (
+    prepareDataForPlottingMonthlyFriendsCreated,
+    plotMonthlyFriendsCreated
+)
 from .model.comments import Comments
 from .plot.comments import plotTopXPeersWithMostCommentedPostsByUser
 from .plot.extra import (
+    prepareDataForPlottingLikeReactionCommentBasedActivities,
     plotWeeklyHeatMapWithLikesReactionsComments,
+    topXHighlyInteractedFacebookPeers,
     plotTopXHighlyInteractedFacebookPeers
 )
+from .render import Renderer
+from .pipeline import Pipeline
 from time import time
-from .messagePaths import getMessageFilePaths
+from functools import partial
+from datetime import datetime, timedelta
+from .messagePaths import groupMessageFilePaths
 from .model.messenger import Messenger
+from .model.events import EventLog
 from .plot.messages import (
     plotTopXBusyChats,
+    prepareDataForTopXPrivateChatsWithHighestContributonFromYou,
     plotTopXPrivateChatsWithHighestContributonFromYou,
+    prepareDataForTopChatThreadEachWeek,
     plotTopChatThreadEachWeek,
+    prepareDataForChatThreadsWithLowestContributonFromYou,
     plotPrivateChatThreadsWithLowestContributonFromYou
 )
 import warnings
@@ -52,16 +72,39 @@ def _calculateSuccess(arr: List[bool]) -> float:
     return (arr.count(True) / len(arr)) * 100
 
 
+def _parseDate(value: str) -> datetime:
+    '''
+        Parses date given as `YYYY-MM-DD` into local midnight of that day
+    '''
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def _parsePlotNames(value: str, known: List[str] = None) -> List[str]:
+    '''
+        Parses comma separated plot names, each of which must be known
+        ( by default, any of plots )
+    '''
+    known = known or [i[0] for i in _PLOTS]
+
+    _names = [i.strip() for i in value.split(',') if i.strip()]
+    _unknown = [i for i in _names if i not in known]
+    if _unknown:
+        raise ArgumentTypeError('Unknown plot(s) {}'.format(', '.join(_unknown)))
+
+    return _names
+
+
 def _getBanner():
     '''
         Prints banner of scipt
     '''
-    print('\x1b[1;6;36;49m[+]fviz v1.0.0 - Facebook data visualizer\x1b[0m\n\n\t\x1b[3;30;47m$ fviz `path-to-exported-facebook-data.zip` `path-for-zip-extraction`  `path-to-sink-directory`\x1b[0m\n\n[+]Author: Anjan Roy < anjanroy@yandex.com >\n[+]Source: https://github.com/itzmeanjan/fviz ( MIT Licensed )\n')
+    print('\x1b[1;6;36;49m[+]fviz v1.0.0 - Facebook data visualizer\x1b[0m\n\n\t\x1b[3;30;47m$ fviz `path-to-exported-facebook-data.zip` [ `path-for-zip-extraction` ] `path-to-sink-directory`\x1b[0m\n\n[+]Author: Anjan Roy < anjanroy@yandex.com >\n[+]Source: https://github.com/itzmeanjan/fviz ( MIT Licensed )\n')
 
 
-def _getCMD() -> Tuple[str, str, str]:
+def _getCMD() -> Namespace:
     '''
-        Parses command line args, passed while invoking script
+        Parses command line args, passed while invoking script,
+        returns None if they're not usable
     '''
     parser = ArgumentParser()
     parser.add_argument('src',
@@ -69,207 +112,500 @@ def _getCMD() -> Tuple[str, str, str]:
                         help='Exported compressed Facebook data as zip file')
     parser.add_argument('extractAt',
                         type=str,
-                        help='Extraction location of zip')
+                        nargs='?',
+                        help='Extraction location of zip, if not given data is read straight from zip')
     parser.add_argument('sink',
                         type=str,
                         help='Sink directory path, where plots to be placed')
+    parser.add_argument('--backend',
+                        choices=['thread', 'process'],
+                        default='process',
+                        help='Parse chat threads concurrently using threads or processes')
+    parser.add_argument('--workers',
+                        type=int,
+                        help='Number of workers used for parsing chat threads, defaults to CPU count')
+    parser.add_argument('--jobs',
+                        type=int,
+                        help='Number of worker processes used for rendering plots, defaults to CPU count, 1 renders them one after another')
+    parser.add_argument('--columnar',
+                        action='store_true',
+                        help='Keep chat messages in compact columnar form, instead of as objects')
+    parser.add_argument('--cache',
+                        type=str,
+                        default=CACHE_DIR,
+                        help='Directory where parsed data is cached, for skipping parsing on rerun')
+    parser.add_argument('--no-cache',
+                        dest='noCache',
+                        action='store_true',
+                        help='Neither use nor populate parsed data cache')
+    parser.add_argument('--clear-cache',
+                        dest='clearCache',
+                        action='store_true',
+                        help='Invalidate all cached parsed data, before running')
+    parser.add_argument('--incremental',
+                        action='store_true',
+                        help='Reparse only those chat threads, which changed since last run on export of same account ( matched by its owner )')
+    parser.add_argument('--since',
+                        type=_parseDate,
+                        help='Consider only activities on or after this date ( YYYY-MM-DD )')
+    parser.add_argument('--until',
+                        type=_parseDate,
+                        help='Consider only activities on or before this date ( YYYY-MM-DD )')
+    parser.add_argument('--only',
+                        type=_parsePlotNames,
+                        help='Comma separated names of plots to be generated, out of {}'.format(', '.join(i[0] for i in _PLOTS)))
+    parser.add_argument('--skip',
+                        type=_parsePlotNames,
+                        help='Comma separated names of plots not to be generated')
+    parser.add_argument('--raster',
+                        type=lambda e: _parsePlotNames(e, _HEATMAPS),
+                        default=[],
+                        help='Comma separated names of heatmap plots, out of {}, whose cells are to be drawn as rasterized image, keeping output size & rendering time bounded for long time spans'.format(', '.join(_HEATMAPS)))
+    parser.add_argument('--stats',
+                        action='store_true',
+                        help='Report hit/ miss count of memoized aggregates, for profiling')
     args = parser.parse_args()
 
-    if not (args.src and args.extractAt and args.sink):
-        return None, None, None
+    if not (args.src and args.sink):
+        return None
     if not (args.src.endswith('.zip') and exists(args.src) and makeDir(abspath(args.sink))):
-        return None, None, None
+        return None
+
+    args.src, args.extractAt, args.sink = map(lambda e: abspath(e) if e else None,
+                                              [args.src, args.extractAt, args.sink])
+    # until date is inclusive, so window is closed at next midnight
+    if args.until:
+        args.until += timedelta(days=1)
+
+    args.plots = [i[0] for i in _PLOTS
+                  if i[0] in (args.only or [i[0]]) and i[0] not in (args.skip or [])]
+    if not args.plots:
+        return None
+    return args
+
+
+def _openSource(args: Namespace, members: List[str]) -> Source:
+    '''
+        Extracts given members of zip ( if asked to ), returning
+        source data files are to be read from
+    '''
+    if args.extractAt:
+        if not extractAll(args.src, args.extractAt, members):
+            raise Exception('Failed to extract zip')
+
+        return DirSource(args.extractAt)
+
+    return ZipSource(args.src)
+
+
+def _parseReactions(args: Namespace, source: Source) -> Reactions:
+    reactions = Reactions.fromJSON(
+        'likes_and_reactions/posts_and_comments.json',
+        source)
+
+    if not reactions:
+        raise Exception('Failed to parse reactions')
+
+    return reactions
+
+
+def _parseFriends(args: Namespace, source: Source) -> Friends:
+    friends = Friends.fromJSON(
+        'friends/friends.json',
+        source)
+
+    if not friends:
+        raise Exception('Failed to parse friends data')
+
+    return friends
+
+
+def _parseComments(args: Namespace, source: Source) -> Comments:
+    comments = Comments.fromJSON(
+        'comments/comments.json',
+        source)
+
+    if not comments:
+        raise Exception('Failed to parse comments data')
+
+    return comments
+
+
+def _indexName(args: Namespace, paths: List[List[str]], source: Source) -> str:
+    '''
+        Name, incrementally parsed chat threads are kept under, i.e. owner of
+        export, so that it's shared by all exports of same account, falling back
+        to name of zip, when owner can't be found
+    '''
+    return Messenger.findOwner(paths, source) or basename(args.src)
+
+
+def _storeIndex(args: Namespace, results: Dict[str, Any]) -> bool:
+    '''
+        Keeps incrementally parsed chat threads, along with aggregates computed
+        over them while plotting, for next run on export of same account, unless
+        they were read from cache
+    '''
+    messenger, source = results.get('parsed.messenger'), results.get('source')
+    if not (args.incremental and messenger and source):
+        return True
+
+    _paths = groupMessageFilePaths('messages/inbox', source)
+    if not Cache(args.cache).storeIndex(_indexName(args, _paths, source),
+                                        {'messenger': messenger,
+                                         'aggregates': messenger.aggregates,
+                                         'signatures': Messenger.signatures(_paths, source)}):
+        print('[!] Failed to store index of chat threads')
+        return False
+
+    return True
+
+
+def _parseMessenger(args: Namespace, source: Source, headersOnly: bool = False) -> Messenger:
+    _paths = groupMessageFilePaths('messages/inbox', source)
+    _options = dict(backend=args.backend,
+                    workers=args.workers,
+                    columnar=args.columnar)
+
+    if headersOnly:
+        # only metadata of chat threads is required, while each
+        # of them still gets loaded, if anything else is asked of it
+        messenger = Messenger.scan(_paths,
+                                   source,
+                                   args.workers,
+                                   columnar=args.columnar)
+    elif args.incremental:
+        _index = Cache(args.cache).loadIndex(_indexName(args, _paths, source)) or {}
+        if _index.get('messenger'):
+            _index['messenger'].restore(_index['aggregates'])
+
+        messenger, _ = Messenger.ingest(_paths,
+                                        source,
+                                        _index.get('messenger'),
+                                        _index.get('signatures'),
+                                        **_options)
+    else:
+        messenger = Messenger.fromJSON(_paths, source, **_options)
+
+    if not messenger:
+        raise Exception('Failed to parse messages')
+
+    return messenger
+
+
+# data sources, in order they're cached, along with their parsers, members
+# of export they're parsed from & function finding actor ( i.e. owner of
+# export ) in parsed data, if source records it
+_SOURCES = (
+    ('reactions', _parseReactions, 'likes_and_reactions/*.json', lambda e: e.reactions[0].actor),
+    ('friends', _parseFriends, 'friends/*.json', None),
+    ('comments', _parseComments, 'comments/*.json', lambda e: e.actor),
+    ('messenger', _parseMessenger, 'messages/inbox/*/message_*.json', lambda e: e.owner)
+)
+
+# plots, in order of reporting, each with plot function, models it's plotted from
+# ( after applying time window ), function preparing plot data given actor & those
+# models, title & sink file name, where title may refer to actor & time frame
+#
+# `events:` models are event logs, merged from comma separated sources, each
+# built once, however many plots are drawn from it
+_PLOTS = (
+    ('reactionCount',
+     plotReactionCount,
+     ('reactions',),
+     lambda actor, reactions: dict(reactions.reactionTypeToCount),
+     'Reactions by {actor} [ {since} - {until} ]',
+     'reactionTypeToCountBy{}.png'),
+    ('peerToReactionCount',
+     plotPeerToReactionCount,
+     ('reactions',),
+     lambda actor, reactions: reactions.getTopXPeerToReactionCount(10),
+     'Top 10 profiles, whose posts were mostly reacted by {actor} [ {since} - {until} ]',
+     'top10ProfilesWithMostlyReactedPostsBy{}.png'),
+    ('reactionHeatMap',
+     plotReactionsOverTimeAsHeatMap,
+     ('reactions',),
+     lambda actor, reactions: prepareHeatMapData(reactions),
+     'Reaction HeatMap for {actor}',
+     'reactionHeatMapFor{}'),
+    ('weeklyReactionHeatMap',
+     plotWeeklyReactionHeatMap,
+     ('reactions',),
+     lambda actor, reactions: prepareWeeklyReactionHeatMapData(reactions),
+     'Weekly Accumulated Reaction HeatMap for {actor}',
+     'weeklyAccumulatedReactionHeatMapFor{}.svg'),
+    ('topPeersByMonth',
+     plotTopXPeersByMonth,
+     ('reactions',),
+     lambda actor, reactions: prepareDataForPlottingGroupedBarChartWithTopXPeers(reactions, x=3),
+     'Top 3 profiles with highest liked and reacted post by {actor}',
+     'top3ProfilesWithMonthlyMostReactedPostsBy{}.svg'),
+    ('activityInEachMinuteOfDay',
+     plotAccumulatedUserActivityInEachMinuteOfDay,
+     ('reactions',),
+     lambda actor, reactions: prepareDataForPlottingLinePlot(reactions),
+     'Accumulated Likes & Reactions in each minute of Day by {actor}',
+     'accumulatedAcivityInEachMinuteOfDayBy{}.svg'),
+    ('activityOnEachQuarterOfDay',
+     plotWeeklyHeatMapWithLikesReactionsComments,
+     ('events:reactions,comments',),
+     lambda actor, events: prepareDataForPlottingLikeReactionCommentBasedActivities(events),
+     'Facebook Activity on each Quarter of Day by {actor}',
+     'facebookActivityOnEachQuarterOfDayBy{}.svg'),
+    ('monthlyFriendingRate',
+     plotMonthlyFriendsCreated,
+     ('friends',),
+     lambda actor, friends: prepareDataForPlottingMonthlyFriendsCreated(friends),
+     'Monthly Friending Rate of {actor}',
+     'monthlyFriendingRateOf{}.svg'),
+    ('topCommentedPeers',
+     plotTopXPeersWithMostCommentedPostsByUser,
+     ('comments',),
+     lambda actor, comments: comments.topXPeersWithMostInvolvementInComments(),
+     'Top 10 Facebook Profiles, with whom {actor} mostly interacted in Facebook Comments',
+     'top10ProfilesWithMostlyCommentedPostsBy{}.svg'),
+    ('busiestChats',
+     plotTopXBusyChats,
+     ('messenger',),
+     lambda actor, messenger: messenger.topXBusiestChats(),
+     'Top 15 busiest Facebook Chats of {actor}',
+     'top15FacebookChatsWithMostMessages{}.svg'),
+    ('highestContributionChats',
+     plotTopXPrivateChatsWithHighestContributonFromYou,
+     ('messenger',),
+     lambda actor, messenger: prepareDataForTopXPrivateChatsWithHighestContributonFromYou(messenger, 10, actor),
+     'Top 10 Private Facebook Chats with highest contributions from {actor}',
+     'top10PrivateFacebookChatsWithHighestContributionFrom{}.svg'),
+    ('lowestContributionChats',
+     plotPrivateChatThreadsWithLowestContributonFromYou,
+     ('messenger',),
+     lambda actor, messenger: prepareDataForChatThreadsWithLowestContributonFromYou(messenger, 10, actor),
+     'Top 10 Private Facebook Chat Threads with lowest contribution from {actor}',
+     'top10PrivateFacebookChatThreadsWithLowestContributionFrom{}.svg'),
+    ('weeklyTopChat',
+     plotTopChatThreadEachWeek,
+     ('messenger',),
+     lambda actor, messenger: prepareDataForTopChatThreadEachWeek(messenger),
+     'Weekly Top Private Facebook Chat Thread for {actor}',
+     'weeklyTopPrivateFacebookChatThreadFor{}.svg'),
+    ('highlyInteractedPeers',
+     plotTopXHighlyInteractedFacebookPeers,
+     ('events:reactions,comments,messenger',),
+     lambda actor, events: topXHighlyInteractedFacebookPeers(events, [actor, 'self'], 10),
+     'Top 10 Highly Interacted with Facebook Profiles for {actor} [ {since} - {until} ]',
+     'topXHighlyInteractedFacebookProfilesFor{}.svg')
+)
 
-    return tuple(map(lambda e: abspath(e), [args.src, args.extractAt, args.sink]))
+
+# plots drawn as heatmaps, which can be rendered with rasterized cells
+_HEATMAPS = ('reactionHeatMap', 'weeklyReactionHeatMap', 'activityOnEachQuarterOfDay')
+
+# plots drawn from chat thread metadata only ( see `MessagesHeader` ), for
+# which chat threads are only scanned, when no other plot needs messages
+_HEADER_PLOTS = ('busiestChats',)
+
+
+def _sourcesOf(model: str) -> Tuple[str]:
+    '''
+        Data sources, given model is built from
+    '''
+    if model.startswith('events:'):
+        return tuple(model[len('events:'):].split(','))
+
+    return (model,)
+
+
+def _loadCached(args: Namespace) -> Tuple[Reactions, Friends, Comments, Messenger]:
+    '''
+        Returns parsed data sources, if this archive was
+        already parsed & cached earlier
+    '''
+    if args.noCache:
+        return None
+
+    cache = Cache(args.cache)
+    if args.clearCache:
+        print('[+]Invalidated {} cache entries'.format(cache.clear()))
+
+    key = cache.key(args.src, args.columnar)
+    models = cache.load(key)
+    if models:
+        print('[+]Cache hit, skipped parsing [ {} ]'.format(key[:16]))
+        return models
+
+    print('[+]Cache miss, parsing [ {} ]'.format(key[:16]))
+    return None
+
+
+def _storeCached(args: Namespace, cached: Tuple, *models: Any) -> bool:
+    '''
+        Caches parsed data sources, unless they were read from cache
+    '''
+    if args.noCache or cached:
+        return True
+
+    cache = Cache(args.cache)
+    if not cache.store(cache.key(args.src, args.columnar), models):
+        print('[!] Failed to cache parsed data')
+        return False
+
+    return True
+
+
+def _window(args: Namespace, name: str) -> Callable[[Any], Any]:
+    '''
+        Restricts data source to time window asked for, if any
+    '''
+    def _apply(model: Any) -> Any:
+        if not (args.since or args.until):
+            return model
+
+        model = model.between(args.since, args.until)
+        if name == 'reactions' and not model.count:
+            raise Exception('No reactions found in given time window')
+
+        return model
+
+    return _apply
+
+
+def _buildPipeline(args: Namespace, renderer: Renderer, plots: List[str]) -> Tuple[Pipeline, List[str]]:
+    '''
+        Data sources are parsed ( or read from cache ) concurrently, while
+        aggregates shared among plots are computed once, and each plot is
+        rendered as soon as models it's plotted from are ready
+
+        Returns pipeline along with tasks to be run for rendering given plots,
+        where only those data sources, selected plots depend on, are
+        extracted & parsed, while they're cached only when all are parsed
+
+        Each plot depends only on sources it's drawn from, taking actor from
+        one of them too, so that failure of any other source doesn't affect it
+    '''
+    pipeline = Pipeline()
+    _members = []
+    # time window is applied over messages, so they're required then, while
+    # incremental parsing keeps fully parsed chat threads for next run
+    _headersOnly = not (args.since or args.until or args.incremental) and\
+        all(i[0] in _HEADER_PLOTS for i in _PLOTS if i[0] in plots and
+            any('messenger' in _sourcesOf(j) for j in i[2]))
+
+    pipeline.add('cached', lambda: _loadCached(args))
+    pipeline.add('source',
+                 lambda cached: None if cached else _openSource(args, _members),
+                 'cached')
+
+    for i, (name, parse, _, actor) in enumerate(_SOURCES):
+        if name == 'messenger':
+            parse = partial(parse, headersOnly=_headersOnly)
+
+        pipeline.add('parsed.{}'.format(name),
+                     lambda cached, source, i=i, parse=parse: cached[i] if cached else parse(args, source),
+                     'cached',
+                     'source')
+        pipeline.add(name,
+                     _window(args, name),
+                     'parsed.{}'.format(name))
+        if actor:
+            pipeline.add('actor.{}'.format(name),
+                         lambda model, actor=actor: actor(model),
+                         'parsed.{}'.format(name))
+
+    pipeline.add('store',
+                 lambda *e: _storeCached(args, *e),
+                 'cached',
+                 *['parsed.{}'.format(i[0]) for i in _SOURCES])
+
+    # time frame, used in plot titles
+    pipeline.add('timeFrame',
+                 lambda reactions: [i.strftime('%d %b, %Y') for i in reactions.getTimeFrame],
+                 'reactions')
+
+    # sources having actor, first of those selected ones, falling back to first of all
+    _withActor = [i[0] for i in _SOURCES if i[3]]
+    _selected = set([k for i in _PLOTS if i[0] in plots for j in i[2] for k in _sourcesOf(j)])
+    _fallback = ([i for i in _withActor if i in _selected] or _withActor)[0]
+
+    def _actorOf(models: Tuple[str]) -> str:
+        '''
+            Task giving actor of plot, drawn from given models, taken from first
+            of them having one, so that plot doesn't depend on any other source
+        '''
+        _sources = [j for i in models for j in _sourcesOf(i)]
+        return 'actor.{}'.format(next((i for i in _sources if i in _withActor), _fallback))
+
+    def _plot(plot: Callable[..., bool], prepare: Callable[..., Any], title: str, sink: str, timed: bool, *extra: Any) -> Callable[..., bool]:
+        def _render(actor: str, *models: Any) -> bool:
+            _since, _until = models[0] if timed else (None, None)
+            models = models[1:] if timed else models
+
+            return renderer.render(plot,
+                                   prepare(actor, *models),
+                                   title.format(actor=actor,
+                                                since=_since,
+                                                until=_until),
+                                   join(args.sink,
+                                        sink.format(_splitAndJoinActorName(actor))),
+                                   *extra)
+
+        return _render
+
+    # event logs shared among plots, built from windowed sources
+    for i in sorted(set([j for i in _PLOTS for j in i[2] if j.startswith('events:')])):
+        _sources = _sourcesOf(i)
+        pipeline.add(i,
+                     lambda *models, _sources=_sources: EventLog.fromModels(**dict(zip(_sources, models))),
+                     *_sources)
+
+    for name, plot, models, prepare, title, sink in _PLOTS:
+        # only titles showing time frame depend on it
+        _timed = '{since}' in title or '{until}' in title
+        pipeline.add(name,
+                     _plot(plot, prepare, title, sink, _timed,
+                           *([True] if name in args.raster else [])),
+                     _actorOf(models),
+                     *(['timeFrame'] if _timed else []),
+                     *models)
+
+    _targets = list(plots)
+    _required = pipeline.required(_targets)
+    _members.extend([i[2] for i in _SOURCES
+                     if 'parsed.{}'.format(i[0]) in _required])
+    # scanned chat threads still refer to export, so they're never cached
+    if len(_members) == len(_SOURCES) and not _headersOnly:
+        _targets.append('store')
+
+    return pipeline, _targets
 
 
 def main():
     _getBanner()
 
     try:
-        src, extractAt, sink = _getCMD()
-        if not (src and extractAt and sink):
+        args = _getCMD()
+        if not args:
             raise Exception('Bad CMD args')
 
-        if not extractAll(src, extractAt):
-            raise Exception('Failed to extract zip')
-
         print('[+]Working ...')
         _starTm = time()
-        reactions = Reactions.fromJSON(
-            join(extractAt,
-                 'likes_and_reactions/posts_and_comments.json'))
-
-        if not reactions:
-            raise Exception('Failed to parse reactions')
-
-        friends = Friends.fromJSON(
-            join(extractAt,
-                 'friends/friends.json'
-                 )
-        )
-
-        if not friends:
-            raise Exception('Failed to parse friends data')
-
-        comments = Comments.fromJSON(
-            join(extractAt,
-                 'comments/comments.json'
-                 )
-        )
-
-        if not comments:
-            raise Exception('Failed to parse comments data')
-
-        messenger = Messenger.fromJSON(
-            getMessageFilePaths(
-                join(
-                    extractAt,
-                    'messages/inbox')))
-
-        if not messenger:
-            raise Exception('Failed to parse messages')
-
-        _success = [
-            plotReactionCount(
-                reactions.reactionTypeToCount,
-                'Reactions by {} [ {} - {} ]'.format(
-                    reactions.reactions[0].actor,
-                    *[i.strftime('%d %b, %Y') for i in reactions.getTimeFrame]
-                ),
-                join(
-                    sink,
-                    'reactionTypeToCountBy{}.png'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)
-                    ))),
-            plotPeerToReactionCount(
-                reactions.getTopXPeerToReactionCount(10),
-                'Top 10 profiles, whose posts were mostly reacted by {} [ {} - {} ]'.format(
-                    reactions.reactions[0].actor,
-                    *[i.strftime('%d %b, %Y') for i in reactions.getTimeFrame]
-                ),
-                join(
-                    sink,
-                    'top10ProfilesWithMostlyReactedPostsBy{}.png'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)
-                    ))),
-            plotReactionsOverTimeAsHeatMap(
-                reactions,
-                'Reaction HeatMap for {}'.format(reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'reactionHeatMapFor{}'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)
-                    ))),
-            plotWeeklyReactionHeatMap(
-                reactions,
-                'Weekly Accumulated Reaction HeatMap for {}'.format(
-                    reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'weeklyAccumulatedReactionHeatMapFor{}.svg'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)
-                    ))),
-            plotTopXPeersByMonth(
-                reactions,
-                'Top 3 profiles with highest liked and reacted post by {}'.format(
-                    reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'top3ProfilesWithMonthlyMostReactedPostsBy{}.svg'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)
-                    ))),
-            plotAccumulatedUserActivityInEachMinuteOfDay(
-                reactions,
-                'Accumulated Likes & Reactions in each minute of Day by {}'.format(
-                    reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'accumulatedAcivityInEachMinuteOfDayBy{}.svg'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)
-                    ))),
-            plotWeeklyHeatMapWithLikesReactionsComments(
-                reactions,
-                comments,
-                'Facebook Activity on each Quarter of Day by {}'.format(
-                    reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'facebookActivityOnEachQuarterOfDayBy{}.svg'.format(
-                        _splitAndJoinActorName(
-                            reactions.reactions[0].actor)
-                    ))),
-            plotMonthlyFriendsCreated(
-                friends,
-                'Monthly Friending Rate of {}'.format(
-                    reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'monthlyFriendingRateOf{}.svg'.format(
-                        _splitAndJoinActorName(
-                            reactions.reactions[0].actor)
-                    ))),
-            plotTopXPeersWithMostCommentedPostsByUser(
-                comments,
-                'Top 10 Facebook Profiles, with whom {} mostly interacted in Facebook Comments'.format(
-                    reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'top10ProfilesWithMostlyCommentedPostsBy{}.svg'.format(
-                        _splitAndJoinActorName(
-                            reactions.reactions[0].actor)
-                    ))),
-            plotTopXBusyChats(
-                messenger.topXBusiestChats(),
-                'Top 15 busiest Facebook Chats of {}'
-                .format(reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'top15FacebookChatsWithMostMessages{}.svg'.format(
-                        _splitAndJoinActorName(
-                            reactions.reactions[0].actor)
-                    ))),
-            plotTopXPrivateChatsWithHighestContributonFromYou(
-                messenger,
-                10,
-                reactions.reactions[0].actor,
-                'Top 10 Private Facebook Chats with highest contributions from {}'
-                .format(reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'top10PrivateFacebookChatsWithHighestContributionFrom{}.svg'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)))),
-            plotPrivateChatThreadsWithLowestContributonFromYou(
-                messenger,
-                10,
-                reactions.reactions[0].actor,
-                'Top 10 Private Facebook Chat Threads with lowest contribution from {}'
-                .format(reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'top10PrivateFacebookChatThreadsWithLowestContributionFrom{}.svg'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)))),
-            plotTopChatThreadEachWeek(
-                messenger,
-                'Weekly Top Private Facebook Chat Thread for {}'
-                .format(reactions.reactions[0].actor),
-                join(
-                    sink,
-                    'weeklyTopPrivateFacebookChatThreadFor{}.svg'.format(
-                        _splitAndJoinActorName(reactions.reactions[0].actor)))),
-            plotTopXHighlyInteractedFacebookPeers(
-                reactions, comments, messenger,
-                [reactions.reactions[0].actor, 'self'], 10,
-                'Top 10 Highly Interacted with Facebook Profiles for {} [ {} - {} ]'
-                .format(reactions.reactions[0].actor,
-                        *[i.strftime('%d %b, %Y') for i in reactions.getTimeFrame]),
-                join(sink,
-                     'topXHighlyInteractedFacebookProfilesFor{}.svg'.format(
-                         _splitAndJoinActorName(reactions.reactions[0].actor))))
-        ]
+
+        with Renderer(args.jobs) as renderer:
+            _pipeline, _targets = _buildPipeline(args, renderer, args.plots)
+            _results, _errors = _pipeline.run(_targets)
+
+        _storeIndex(args, _results)
+
+        for k, v in _errors.items():
+            print('[!] {}: {}'.format(k, v))
+
+        _success = [bool(_results.get(i)) for i in args.plots]
         print('[+]Completed in \x1b[1;6;35;48m{} s\x1b[0m with \x1b[1;6;35;48m{}%\x1b[0m success'.format(
             time() - _starTm,
             _calculateSuccess(_success)))
+
+        if args.stats:
+            for k, v in sorted(memoStats().items()):
+                print('[+]{} : {} hits, {} misses'.format(k, *v))
     except KeyboardInterrupt:
         print('\n[!] Terminated')
     except Exception as e:
@@ -3,12 +3,25 @@
 from typing import List
 from os import walk
 from os.path import join, abspath
+from posixpath import basename, dirname
+from re import compile as regCompile
+from .source import Source
 
+# N in `message_N.json`, which orders parts of a chat thread
+_partNumber = regCompile(r'(\d+)\.json$')
 
-def getMessageFilePaths(begin: str) -> List[str]:
+
+def getMessageFilePaths(begin: str, source: Source = None) -> List[str]:
     '''
         Returns all those file paths holding chats
+
+        If source is specified, member names ( under `begin` )
+        holding chats in that source are returned
     '''
+    if source:
+        return [i for i in source.members('{}/*'.format(begin.rstrip('/')))
+                if basename(i).startswith('message') and i.endswith('.json')]
+
     _buffer = []
 
     for root, _, files in walk(begin):
@@ -22,5 +35,23 @@ def getMessageFilePaths(begin: str) -> List[str]:
     return _buffer
 
 
+def groupMessageFilePaths(begin: str, source: Source = None) -> List[List[str]]:
+    '''
+        Same as `getMessageFilePaths`, but file paths are grouped
+        by chat thread ( i.e. directory holding them ), where parts
+        of a thread are ordered as `message_1.json`, `message_2.json` ...
+    '''
+    def _part(path: str) -> int:
+        _match = _partNumber.search(basename(path))
+        return int(_match.group(1)) if _match else 0
+
+    _buffer = {}
+
+    for i in getMessageFilePaths(begin, source):
+        _buffer.setdefault(dirname(i.replace('\\', '/')), []).append(i)
+
+    return [sorted(v, key=_part) for v in _buffer.values()]
+
+
 if __name__ == '__main__':
     print('It\'s not supposed to be used this way !')
@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+
+from typing import Tuple, List, Dict, Any, Callable
+from datetime import date, time, datetime
+from time import localtime
+import numpy as np
+
+# labels of four quarters of day, in order
+QUARTERS = ('00:00 - 05:59', '06:00 - 11:59', '12:00 - 17:59', '18:00 - 23:59')
+
+
+def localSeconds(timestamps: np.ndarray) -> np.ndarray:
+    '''
+        Converts UTC epoch timestamps ( in milliseconds ) into
+        seconds shifted by local UTC offset in effect at that moment,
+        so that calendar fields derived from them match those of
+        `datetime.fromtimestamp`
+
+        Offsets are looked up once per distinct hour, not per timestamp
+    '''
+    _secs = np.floor_divide(np.asarray(timestamps, dtype=np.int64), 1000)
+    _hours, _inverse = np.unique(_secs // 3600, return_inverse=True)
+    _offsets = np.array([localtime(int(i) * 3600).tm_gmtoff for i in _hours],
+                        dtype=np.int64)
+
+    return _secs + _offsets[_inverse.reshape(-1)]
+
+
+def weekOfYear(secs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+        Given local epoch seconds, returns year and week number
+        of year ( `%W` i.e. Monday as first day of week ) for each of them
+    '''
+    _days = secs // 86400
+    _years = _days.astype('datetime64[D]').astype('datetime64[Y]')
+    _yday = _days - _years.astype('datetime64[D]').astype(np.int64)
+    # 1st Jan, 1970 was a Thursday, Monday being 0
+    _wday = (_days + 3) % 7
+
+    return _years.astype(np.int64) + 1970, (_yday + 7 - _wday) // 7
+
+
+def weekSpan(lo: int, hi: int) -> np.ndarray:
+    '''
+        Chronologically ordered week ordinals ( see `TimeBuckets.weeks` ),
+        covering all days in [lo, hi]
+    '''
+    _years, _weeks = weekOfYear(np.arange(lo, hi + 1, dtype=np.int64) * 86400)
+
+    return np.unique(_years * 100 + _weeks)
+
+
+class TimeBuckets:
+    '''
+        Maps timestamps of events onto integer bucket ordinals
+        ( day, week, month, quarter of day, minute of day ), all in
+        local time, using NumPy datetime arithmetic
+
+        Bucket ordinals are turned into labels only when asked for,
+        once per distinct bucket, using `*Label` functions of this module
+    '''
+
+    def __init__(self, timestamps: np.ndarray):
+        self.seconds = localSeconds(timestamps)
+        self._cache = {}
+
+    def _get(self, name: str, fn: Callable[[], np.ndarray]) -> np.ndarray:
+        if name not in self._cache:
+            self._cache[name] = fn()
+
+        return self._cache[name]
+
+    @property
+    def days(self) -> np.ndarray:
+        '''
+            Days since epoch
+        '''
+        return self._get('days', lambda: self.seconds // 86400)
+
+    @property
+    def weeks(self) -> np.ndarray:
+        '''
+            Week ordinals, encoded as `year * 100 + %W`
+        '''
+        def _weeks() -> np.ndarray:
+            _years, _weeks = weekOfYear(self.seconds)
+            return _years * 100 + _weeks
+
+        return self._get('weeks', _weeks)
+
+    @property
+    def weekDays(self) -> np.ndarray:
+        '''
+            Day of week, same as `%w` i.e. Sunday being 0
+        '''
+        return self._get('weekDays', lambda: (self.days + 4) % 7)
+
+    @property
+    def months(self) -> np.ndarray:
+        '''
+            Months since epoch
+        '''
+        return self._get('months',
+                         lambda: self.days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64))
+
+    @property
+    def quarters(self) -> np.ndarray:
+        '''
+            Quarter of day, in 0..3
+        '''
+        return self._get('quarters', lambda: (self.seconds % 86400) // 21600)
+
+    @property
+    def minutes(self) -> np.ndarray:
+        '''
+            Minute of day, in 0..1439
+        '''
+        return self._get('minutes', lambda: (self.seconds % 86400) // 60)
+
+
+def dayLabel(ordinal: int) -> date:
+    return date.fromordinal(date(1970, 1, 1).toordinal() + int(ordinal))
+
+
+def weekLabel(ordinal: int) -> str:
+    return 'Week {}, {}'.format(int(ordinal) % 100 + 1, int(ordinal) // 100)
+
+
+def monthLabel(ordinal: int) -> str:
+    return datetime(1970 + int(ordinal) // 12, int(ordinal) % 12 + 1, 1).strftime('%b, %Y')
+
+
+def quarterLabel(ordinal: int) -> str:
+    return QUARTERS[int(ordinal)]
+
+
+def minuteLabel(ordinal: int) -> time:
+    return time(int(ordinal) // 60, int(ordinal) % 60)
+
+
+def firstAppearance(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+        Distinct keys in order of their first appearance, along with
+        count of each and bucket index of each element
+    '''
+    _keys, _first, _inverse, _counts = np.unique(keys,
+                                                 return_index=True,
+                                                 return_inverse=True,
+                                                 return_counts=True)
+    _order = np.argsort(_first, kind='stable')
+    _rank = np.empty_like(_order)
+    _rank[_order] = np.arange(len(_order))
+
+    return _keys[_order], _counts[_order], _rank[_inverse.reshape(-1)]
+
+
+def groupBy(keys: np.ndarray, label: Callable[[int], Any]) -> Dict[Any, List[int]]:
+    '''
+        Groups element indices by their bucket, where buckets
+        are labelled & ordered by their first appearance
+    '''
+    _keys, _counts, _rank = firstAppearance(keys)
+    _indices = np.split(np.argsort(_rank, kind='stable'),
+                        np.cumsum(_counts)[:-1])
+
+    return dict([(label(k), v.tolist()) for k, v in zip(_keys, _indices)])
+
+
+def countBy(keys: np.ndarray, label: Callable[[int], Any]) -> Dict[Any, int]:
+    '''
+        Counts elements falling in each bucket, where buckets
+        are labelled & ordered by their first appearance
+    '''
+    _keys, _counts, _ = firstAppearance(keys)
+
+    return dict([(label(k), int(v)) for k, v in zip(_keys, _counts)])
+
+
+def countBy2D(outer: np.ndarray, inner: np.ndarray, outerLabel: Callable[[int], Any], innerLabel: Callable[[int], Any]) -> Dict[Any, Dict[Any, int]]:
+    '''
+        Counts elements falling in each pair of outer & inner
+        buckets, as nested mapping, ordered by first appearance
+    '''
+    _width = int(inner.max()) + 1 if len(inner) else 1
+    _keys, _counts, _ = firstAppearance(outer * _width + inner)
+
+    _buffer = {}
+    for k, v in zip(_keys, _counts):
+        _buffer.setdefault(outerLabel(k // _width), {})[innerLabel(k % _width)] = int(v)
+
+    return _buffer
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -0,0 +1,198 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import List, Tuple, Dict, Any, Callable, Union
+from array import array
+from itertools import chain
+from sys import intern
+import numpy as np
+from .message import Message
+
+
+class MessageColumns:
+    '''
+        Column wise ( structure of arrays ) store for all messages
+        of a chat thread, where timestamps are kept in milliseconds,
+        senders & message types as integer codes into respective
+        name tables
+
+        Message contents are concatenated into single string, sliced
+        using offsets, which can be loaded lazily, when asked for
+    '''
+
+    def __init__(self, timestamps: np.ndarray, senders: np.ndarray, names: Tuple[str], types: np.ndarray, typeNames: Tuple[str], loader: Callable[[], List[str]] = None):
+        self.timestamps = timestamps
+        self.senders = senders
+        self.names = names
+        self.types = types
+        self.typeNames = typeNames
+        self._loader = loader
+        self._text = None
+        self._offsets = None
+        self._nulls = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _setContents(self, contents: List[str]):
+        self._nulls = np.array([i is None for i in contents], dtype=np.bool_)
+        self._offsets = np.zeros(len(contents) + 1, dtype=np.int64)
+        np.cumsum([len(i) if i else 0 for i in contents],
+                  out=self._offsets[1:])
+        self._text = ''.join([i for i in contents if i])
+
+    def content(self, idx: int) -> str:
+        '''
+            Content of message at index, loading all
+            contents on first access
+        '''
+        if self._text is None:
+            if not self._loader:
+                return None
+            self._setContents(self._loader())
+
+        if self._nulls[idx]:
+            return None
+        return self._text[self._offsets[idx]: self._offsets[idx + 1]]
+
+    def message(self, idx: int) -> Message:
+        return Message(self.names[self.senders[idx]],
+                       int(self.timestamps[idx]) / 1000,
+                       self.content(idx),
+                       self.typeNames[self.types[idx]])
+
+    def take(self, indices: Union[range, np.ndarray]) -> MessageColumns:
+        '''
+            Columns of messages at given indices, where for contiguous
+            range of indices, columns are views over these ones, not copies
+        '''
+        _idx = slice(indices.start, indices.stop) if isinstance(indices, range) else indices
+        _lazy = self._text is None and self._loader
+
+        _columns = MessageColumns(self.timestamps[_idx],
+                                  self.senders[_idx],
+                                  self.names,
+                                  self.types[_idx],
+                                  self.typeNames,
+                                  _TakeLoader(self._loader, indices) if _lazy else None)
+        if self._text is not None:
+            _columns._setContents([self.content(i) for i in indices])
+
+        return _columns
+
+    @staticmethod
+    def fromMessages(messages: List[Message]) -> MessageColumns:
+        '''
+            Builds columns from already objectified messages, where
+        contents are copied over only when asked for
+        '''
+        _builder = MessageColumnsBuilder()
+
+        for i in messages:
+            _builder.add(i.sender, round(i._timestamp * 1000), i.type)
+
+        return _builder.build(_MessageLoader(messages))
+
+    @staticmethod
+    def concat(parts: List[MessageColumns]) -> MessageColumns:
+        '''
+            Concatenates columns of several parts of same chat thread,
+            in given order, re-coding senders & types into common name tables
+        '''
+        _names = {}
+        _typeNames = {}
+        _senders = []
+        _types = []
+
+        for i in parts:
+            _senders.append(np.array([_names.setdefault(j, len(_names)) for j in i.names],
+                                     dtype=np.int32)[i.senders])
+            _types.append(np.array([_typeNames.setdefault(j, len(_typeNames)) for j in i.typeNames],
+                                   dtype=np.int8)[i.types])
+
+        _lazy = all(i._text is None and i._loader for i in parts)
+        _columns = MessageColumns(np.concatenate([i.timestamps for i in parts]),
+                                  np.concatenate(_senders),
+                                  tuple(_names),
+                                  np.concatenate(_types),
+                                  tuple(_typeNames),
+                                  _ConcatLoader([i._loader for i in parts]) if _lazy else None)
+        if not _lazy:
+            _columns._setContents([j.content(k) for j in parts for k in range(len(j))])
+
+        return _columns
+
+
+class _MessageLoader:
+    '''
+        Reads contents of already objectified messages
+    '''
+
+    def __init__(self, messages: List[Message]):
+        self.messages = messages
+
+    def __call__(self) -> List[str]:
+        return [i.content for i in self.messages]
+
+
+class _ConcatLoader:
+    '''
+        Loads contents of multi part chat thread, part by part
+    '''
+
+    def __init__(self, loaders: List[Callable[[], List[str]]]):
+        self.loaders = loaders
+
+    def __call__(self) -> List[str]:
+        return list(chain.from_iterable(i() for i in self.loaders))
+
+
+class _TakeLoader:
+    '''
+        Loads contents of subset of messages of a chat thread
+    '''
+
+    def __init__(self, loader: Callable[[], List[str]], indices: Union[range, np.ndarray]):
+        self.loader = loader
+        self.indices = indices
+
+    def __call__(self) -> List[str]:
+        _contents = self.loader()
+        return [_contents[i] for i in self.indices]
+
+
+class MessageColumnsBuilder:
+    '''
+        Accumulates messages into compact typed arrays, as they're
+        being parsed, interning sender names & message types on the fly
+    '''
+
+    def __init__(self):
+        self._timestamps = array('q')
+        self._senders = array('i')
+        self._types = array('b')
+        self._names = {}
+        self._typeNames = {}
+
+    def add(self, sender: str, timestamp: int, _type: str):
+        self._timestamps.append(timestamp)
+        self._senders.append(self._names.setdefault(sender, len(self._names)))
+        self._types.append(self._typeNames.setdefault(_type, len(self._typeNames)))
+
+    def append(self, data: Dict[str, Any]):
+        '''
+            Adds a message, as found in JSON export
+        '''
+        self.add(data['sender_name'], data['timestamp_ms'], data.get('type'))
+
+    def build(self, loader: Callable[[], List[str]] = None) -> MessageColumns:
+        return MessageColumns(np.frombuffer(self._timestamps, dtype=np.int64).copy(),
+                              np.frombuffer(self._senders, dtype=np.int32).copy(),
+                              tuple(map(intern, self._names)),
+                              np.frombuffer(self._types, dtype=np.int8).copy(),
+                              tuple(self._typeNames),
+                              loader)
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
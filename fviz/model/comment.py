@@ -1,17 +1,52 @@
 #!/usr/bin/python3
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
-from re import compile as regCompile, I as regI, Match
+from sys import intern
+from re import compile as regCompile, I as regI
+
+_pattern = regCompile(
+    r'((commented\son|replied\sto)\s(.+)\s(.+)\.)',
+    flags=regI)
+
+
+def _parseTitle(title: str) -> Tuple[str, str, bool]:
+    '''
+        Extracts peer, content type & whether it's part of a
+        comment based conversation, from title of comment
+    '''
+    _match = _pattern.search(title) if title else None
+
+    if not _match:
+        return None, None, False
+
+    _peer = _match.group(3)[:-2]\
+        if _match.group(3).endswith('\'s') else\
+        (None if _match.group(3) == 'a'
+         else 'self')
+
+    return intern(_peer) if _peer else _peer,\
+        intern(_match.group(4)),\
+        _match.group(2) == 'replied to' and _match.group(4) == 'comment'
 
 
 class Comment:
+    '''
+        Comment made by this user, where title is
+        parsed only once, while objectifying
+    '''
+
+    __slots__ = ('_title', '_time', '_data', '_peer',
+                 '_contentType', '_isConversation')
+
     def __init__(self, title: str, timestamp: int, data: List[Dict[str, Dict[str, Any]]]):
         self._title = title
         self._time = timestamp
         if data:
             self._data = data
 
+        self._peer, self._contentType, self._isConversation = _parseTitle(title)
+
     @property
     def time(self) -> datetime:
         return datetime.fromtimestamp(self._time)
@@ -20,41 +55,29 @@ class Comment:
     def title(self) -> str:
         return self._title
 
-    @property
-    def _getRegex(self) -> Match:
-        regex = regCompile(
-            r'((commented\son|replied\sto)\s(.+)\s(.+)\.)',
-            flags=regI)
-
-        return regex.search(self._title)
-
     @property
     def peer(self) -> str:
-        _match = self._getRegex
-
-        if not _match:
-            return None
-        return _match.group(3)[:-2]\
-            if _match.group(3).endswith('\'s') else\
-            (None if _match.group(3) == 'a'
-             else 'self')
+        return self._peer
 
     @property
     def contentType(self) -> str:
-        _match = self._getRegex
-
-        if not _match:
-            return None
-        return _match.group(4)
+        return self._contentType
 
     @property
     def isConversation(self) -> bool:
-        _match = self._getRegex
+        return self._isConversation
 
-        if not _match:
-            return False
-
-        return _match.group(2) == 'replied to' and _match.group(4) == 'comment'
+    @property
+    def author(self) -> str:
+        '''
+            Author of comment i.e. this user, None if it's not recorded
+        '''
+        for i in getattr(self, '_data', None) or ():
+            _author = (i.get('comment') or {}).get('author')
+            if _author:
+                return _author
+
+        return None
 
 
 if __name__ == '__main__':
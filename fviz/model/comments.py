@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 from typing import List, Tuple, Dict
-from os.path import exists
-from json import load
 from .comment import Comment
-from collections import Counter
-from datetime import time
+from ..source import Source, DirSource
+from .memo import Memoized, memoized
+from .timeindex import TimeIndex, Window
+from .buckets import TimeBuckets, groupBy, countBy2D, weekLabel, quarterLabel
+from .topk import topK
+from .delays import Delays
+from datetime import datetime
+import numpy as np
+
+
+class Comments(Memoized):
+    '''
+        Holds all comments made by this user, where aggregates
+        are computed once and returned as read only views
+    '''
 
-
-class Comments:
     def __init__(self, comments: List[Comment]):
         self._comments = comments
 
@@ -27,6 +36,49 @@ class Comments:
         '''
         return len(self._comments)
 
+    @property
+    def actor(self) -> str:
+        '''
+            Name of this user, as author of first comment having one
+        '''
+        return next(filter(None, (i.author for i in self.comments)), None)
+
+    @memoized('_comments')
+    def timestamps(self) -> np.ndarray:
+        '''
+            Timestamps of all comments ( in milliseconds ), in order
+        '''
+        return np.fromiter((i._time for i in self.comments),
+                           dtype=np.int64, count=self.count) * 1000
+
+    @memoized('_comments')
+    def buckets(self) -> TimeBuckets:
+        '''
+            Time bucket ordinals of all comments, in order
+        '''
+        return TimeBuckets(self.timestamps)
+
+    @memoized('_comments')
+    def delays(self) -> Delays:
+        '''
+            Statistics of delays in between consecutive comments
+        '''
+        return Delays(self.timestamps)
+
+    @memoized('_comments')
+    def index(self) -> TimeIndex:
+        '''
+            Sorted timestamp index over all comments
+        '''
+        return TimeIndex(self.timestamps)
+
+    def between(self, since: datetime = None, until: datetime = None) -> Comments:
+        '''
+            Comments made in [since, until), as view over
+            this object's comments i.e. nothing gets copied
+        '''
+        return Comments(Window(self._comments, self.index.between(since, until)))
+
     def byIndex(self, _idx: int) -> Comment:
         '''
             Retrieves comment by its index
@@ -44,16 +96,9 @@ class Comments:
             comments where it's a reply to another comment i.e.
             part of a comment based conversation
         '''
-        buffer = {}
-
-        for i in self.comments:
-            _peer = i.peer
-            if _peer:
-                buffer[_peer] = buffer.get(_peer, 0) + 1
-
-        return Counter(buffer).most_common(x)
+        return topK(self.peerToCommentCount.items(), x, key=lambda e: e[1])
 
-    @property
+    @memoized('_comments')
     def peerToCommentCount(self) -> Dict[str, int]:
         '''
             Keeps count for which peer ( facebook profile ) is 
@@ -71,19 +116,20 @@ class Comments:
         return _buffer
 
     @staticmethod
-    def fromJSON(src: str) -> Comments:
+    def fromJSON(src: str, source: Source = None) -> Comments:
         '''
             Given a JSON data file, holding all comments by this
             facebook user, we'll form a Comments obj, for performing several interesting ops
             on it
+
+            If source is specified, `src` is considered to be member name
+            in that source ( may be a zip archive )
         '''
-        if not exists(src):
+        source = source or DirSource()
+        if not source.exists(src):
             return None
 
-        _buffer = []
-
-        with open(src, mode='r') as fd:
-            _buffer = load(fd)
+        _buffer = source.load(src)
         if 'comments' not in _buffer:
             return None
 
@@ -97,29 +143,16 @@ class Comments:
 
         return _comments
 
-    @property
+    @memoized('_comments')
     def groupByWeek(self) -> Dict[str, List[int]]:
         '''
             Groups all comments you made by its
             week of happening where week is specified as
             `Week %W, %Y`
         '''
-        buffer = {}
+        return groupBy(self.buckets.weeks, weekLabel)
 
-        for i, j in enumerate(self.comments):
-            _dt = j.time.date()
-            _week = 'Week {}, {}'.format(
-                int(_dt.strftime('%W'), base=10) + 1,
-                _dt.strftime('%Y'))
-
-            if _week not in buffer:
-                buffer[_week] = [i]
-            else:
-                buffer[_week].append(i)
-
-        return buffer
-
-    @property
+    @memoized('_comments')
     def weekToQuarterOfDayAndCount(self) -> Dict[str, Dict[str, int]]:
         '''
             Mapping all comemnts ( you made on facebook ) into their corresponding week of 
@@ -130,36 +163,8 @@ class Comments:
             Gives an idea about how you spent your week on facebook ( commenting on posts/ photos/ videos etc )
             on which quarter you were mostly active/ inactive and how did that change over time.
         '''
-        def mapIntoQuarters(_data: List[int]) -> Dict[str, int]:
-            _mappedIntoQuarters = {}
-
-            _06hr = time(6, 0, 0)
-            _12hr = time(12, 0, 0)
-            _18hr = time(18, 0, 0)
-
-            for i in _data:
-                _tm = self.byIndex(i).time.time()
-
-                if _tm < _06hr:
-                    _mappedIntoQuarters['00:00 - 05:59'] =\
-                        _mappedIntoQuarters.get('00:00 - 06:00',
-                                                0) + 1
-                elif _tm >= _06hr and _tm < _12hr:
-                    _mappedIntoQuarters['06:00 - 11:59'] =\
-                        _mappedIntoQuarters.get('06:00 - 11:59',
-                                                0) + 1
-                elif _tm >= _12hr and _tm < _18hr:
-                    _mappedIntoQuarters['12:00 - 17:59'] =\
-                        _mappedIntoQuarters.get('12:00 - 17:59',
-                                                0) + 1
-                else:
-                    _mappedIntoQuarters['18:00 - 23:59'] =\
-                        _mappedIntoQuarters.get('18:00 - 23:59',
-                                                0) + 1
-
-            return _mappedIntoQuarters
-
-        return dict([(k, mapIntoQuarters(v)) for k, v in self.groupByWeek.items()])
+        return countBy2D(self.buckets.weeks, self.buckets.quarters,
+                         weekLabel, quarterLabel)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+
+from typing import List
+from datetime import timedelta
+import numpy as np
+
+
+class Delays:
+    '''
+        Statistics of delays in between consecutive events, given
+        their timestamps ( in milliseconds ) in order of occurance
+
+        Delays are computed once, as int64 milliseconds, and
+        sorted only once, on first access of any order statistic
+
+        With less than 2 timestamps ( say a chat thread with single
+        message ) there's no delay, when statistics are `nan`
+    '''
+
+    def __init__(self, timestamps: np.ndarray):
+        self.delays = np.abs(np.diff(np.asarray(timestamps, dtype=np.int64)))
+        self._sorted = None
+        self._cumulative = None
+
+    def __len__(self) -> int:
+        return len(self.delays)
+
+    @property
+    def sorted(self) -> np.ndarray:
+        '''
+            Delays in ascending order
+        '''
+        if self._sorted is None:
+            self._sorted = np.sort(self.delays)
+
+        return self._sorted
+
+    @property
+    def cumulative(self) -> np.ndarray:
+        '''
+            Cumulative sum of ascendingly sorted delays
+        '''
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.sorted)
+
+        return self._cumulative
+
+    @property
+    def cumulativePercentage(self) -> np.ndarray:
+        '''
+            Cumulative sum of ascendingly sorted delays, as
+            percentage of sum of all delays
+        '''
+        if not len(self):
+            return np.empty(0, dtype=np.float64)
+
+        return self.cumulative / self.cumulative[-1] * 100
+
+    @property
+    def total(self) -> int:
+        return int(self.cumulative[-1]) if len(self) else 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self) if len(self) else float('nan')
+
+    @property
+    def median(self) -> float:
+        return self.percentile(50)
+
+    def percentile(self, q: float) -> float:
+        '''
+            Delay at q-th percentile, linearly interpolated
+            between closest ranks ( same as `np.percentile` )
+        '''
+        if not len(self):
+            return float('nan')
+
+        _rank = (len(self) - 1) * q / 100
+        _lo = int(np.floor(_rank))
+        _hi = min(_lo + 1, len(self) - 1)
+
+        return float(self.sorted[_lo] + (self.sorted[_hi] - self.sorted[_lo]) * (_rank - _lo))
+
+
+def asTimedeltas(delays: np.ndarray) -> List[timedelta]:
+    return [timedelta(milliseconds=i) for i in delays.tolist()]
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+from .reactions import Reactions
+from .comments import Comments
+from .messenger import Messenger
+from .friends import Friends
+from .buckets import TimeBuckets
+from .memo import Memoized, memoized
+from .peers import PeerIndex, REACTION, COMMENT, MESSAGE, FRIEND
+
+
+class _Names:
+    '''
+        Interns names into integer codes, in order of registration
+    '''
+
+    def __init__(self):
+        self._codes = {}
+
+    def code(self, name: str) -> int:
+        if name is None:
+            return -1
+
+        return self._codes.setdefault(name, len(self._codes))
+
+    def codes(self, names: List[str]) -> np.ndarray:
+        '''
+            Codes of given names, followed by -1, so that indexing
+            it with -1 ( i.e. missing name ) yields -1
+        '''
+        return np.array([self.code(i) for i in names] + [-1], dtype=np.int32)
+
+    @property
+    def names(self) -> Tuple[str]:
+        return tuple(self._codes)
+
+
+class EventLog(Memoized):
+    '''
+        All facebook activities ( likes & reactions, comments, messages,
+        friending ) as single chronologically ascending, columnar table of events
+
+        Each event has timestamp ( in milliseconds ), source kind, peer, sub-type
+        ( reaction type, commented content type, message type ) & chat thread
+        ( index into messenger inbox ) columns, where peers are kept as ids
+        of shared peer index & sub-types as integer codes into name table,
+        -1 when there's none
+
+        Peer index & peer column are built only on first access, as
+        not every analysis over events is concerned with peers
+    '''
+
+    def __init__(self, timestamps: np.ndarray, kinds: np.ndarray, subtypes: np.ndarray, subtypeNames: Tuple[str], threads: np.ndarray, peers: Callable[[], Tuple[PeerIndex, np.ndarray]]):
+        self.timestamps = timestamps
+        self.kinds = kinds
+        self.subtypes = subtypes
+        self.subtypeNames = subtypeNames
+        self.threads = threads
+        self._peers = peers
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @memoized('timestamps')
+    def _peerColumn(self) -> Tuple[PeerIndex, np.ndarray]:
+        return self._peers()
+
+    @property
+    def peerIndex(self) -> PeerIndex:
+        return self._peerColumn[0]
+
+    @property
+    def peers(self) -> np.ndarray:
+        '''
+            Peer id of each event, -1 when there's none
+        '''
+        return self._peerColumn[1]
+
+    @memoized('timestamps')
+    def buckets(self) -> TimeBuckets:
+        '''
+            Time bucket ordinals of all events, in order
+        '''
+        return TimeBuckets(self.timestamps)
+
+    def mask(self, *kinds: int) -> np.ndarray:
+        '''
+            Marks events of given source kinds
+        '''
+        return np.isin(self.kinds, kinds)
+
+    def peerCounts(self, kinds: Tuple[int], exclude: List[str] = ()) -> Dict[str, int]:
+        '''
+            Number of events of given source kinds, involving each peer,
+            leaving out excluded peers & those having no such event
+        '''
+        _peers = self.peers[self.mask(*kinds)]
+        _counts = np.bincount(_peers[_peers >= 0], minlength=len(self.peerIndex))
+
+        _excluded = set([self.peerIndex.id(i) for i in exclude])
+        return dict([(self.peerIndex.name(k), v) for k, v in enumerate(_counts.tolist())
+                     if v and k not in _excluded])
+
+    @staticmethod
+    def fromModels(reactions: Reactions = None, comments: Comments = None, messenger: Messenger = None, friends: Friends = None, peerIndex: PeerIndex = None) -> EventLog:
+        '''
+            Builds event log, by merging events of given sources, each of
+            them already sorted chronologically ( by its timestamp index )
+
+            Sources left out contribute no event, so that only those
+            a plot needs, are to be parsed
+        '''
+        _subtypes = _Names()
+        _parts = []
+        # peer ids of each part, given peer index, along with order of its events
+        _peerParts = []
+
+        def _add(timestamps: np.ndarray, order: np.ndarray, kind: int, peers: Callable[[PeerIndex], np.ndarray], subtypes: np.ndarray, thread: int = -1):
+            _parts.append((timestamps[order],
+                           np.full(len(order), kind, dtype=np.int8),
+                           subtypes[order],
+                           np.full(len(order), thread, dtype=np.int32)))
+            _peerParts.append((peers, order))
+
+        if reactions:
+            _reactionCodes, _reactionNames = reactions.reactionCodes
+            _add(reactions.timestamps,
+                 reactions.index.order,
+                 REACTION,
+                 lambda e: e.ids[REACTION],
+                 _subtypes.codes(_reactionNames)[_reactionCodes])
+
+        if comments:
+            _add(comments.timestamps,
+                 comments.index.order,
+                 COMMENT,
+                 lambda e: e.ids[COMMENT],
+                 np.array([_subtypes.code(i.contentType) for i in comments.comments], dtype=np.int32))
+
+        if messenger:
+            for i, j in enumerate(messenger.inbox):
+                _columns = j.columns
+                _add(_columns.timestamps,
+                     j.index.order,
+                     MESSAGE,
+                     lambda e, _columns=_columns: e.codes(_columns.names)[_columns.senders],
+                     _subtypes.codes(_columns.typeNames)[_columns.types],
+                     thread=i)
+
+        if friends:
+            _add(friends.timestamps,
+                 friends.index.order,
+                 FRIEND,
+                 lambda e: e.ids[FRIEND],
+                 np.full(len(friends.friends), -1, dtype=np.int32))
+
+        _columns = [np.concatenate(i) for i in zip(*_parts)] if _parts\
+            else [np.zeros(0, dtype=i) for i in (np.int64, np.int8, np.int32, np.int32)]
+        # stable sort ( timsort ) merges already sorted runs, one
+        # per source, so this is a k-way merge in effect
+        _order = np.argsort(_columns[0], kind='stable')
+        _columns = [i[_order] for i in _columns]
+
+        def _peerColumn() -> Tuple[PeerIndex, np.ndarray]:
+            _index = peerIndex or PeerIndex.fromModels(reactions,
+                                                       comments,
+                                                       messenger,
+                                                       friends)
+            _ids = np.concatenate([i(_index)[j] for i, j in _peerParts]) if _peerParts\
+                else np.zeros(0, dtype=np.int32)
+
+            return _index, _ids[_order]
+
+        return EventLog(_columns[0],
+                        _columns[1],
+                        _columns[2],
+                        _subtypes.names,
+                        _columns[3],
+                        _peerColumn)
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from dataclasses import dataclass
+from sys import intern
 
 
 @dataclass
@@ -10,9 +11,14 @@ class Friend:
         Data class for holding information related to a facebook friend
         i.e. friend name and when these two became friend
     '''
+    __slots__ = ('name', '_time')
+
     name: str
     _time: int
 
+    def __post_init__(self):
+        self.name = intern(self.name) if self.name else self.name
+
     @property
     def time(self) -> datetime:
         return datetime.fromtimestamp(self._time)
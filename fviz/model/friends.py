@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 from typing import List, Dict, Tuple
-from os.path import exists
-from json import load
 from datetime import datetime
 from .friend import Friend
+from ..source import Source, DirSource
+from .memo import Memoized, memoized
+from .timeindex import TimeIndex, Window
+from .buckets import TimeBuckets, countBy, monthLabel
+import numpy as np
 
 
-class Friends:
+class Friends(Memoized):
     '''
         Data holder class for all friends,
         with their corresponding name
@@ -22,6 +25,42 @@ class Friends:
     def friends(self) -> List[Friend]:
         return self._friends
 
+    @property
+    def count(self) -> int:
+        '''
+            Count of all friends
+        '''
+        return len(self._friends)
+
+    @memoized('_friends')
+    def timestamps(self) -> np.ndarray:
+        '''
+            Timestamps of becoming friends ( in milliseconds ), in order
+        '''
+        return np.fromiter((i._time for i in self.friends),
+                           dtype=np.int64, count=self.count) * 1000
+
+    @memoized('_friends')
+    def buckets(self) -> TimeBuckets:
+        '''
+            Time bucket ordinals of becoming friends, in order
+        '''
+        return TimeBuckets(self.timestamps)
+
+    @memoized('_friends')
+    def index(self) -> TimeIndex:
+        '''
+            Sorted timestamp index over all friends
+        '''
+        return TimeIndex(self.timestamps)
+
+    def between(self, since: datetime = None, until: datetime = None) -> Friends:
+        '''
+            Friends made in [since, until), as view over
+            this object's friends i.e. nothing gets copied
+        '''
+        return Friends(Window(self._friends, self.index.between(since, until)))
+
     def getByIndex(self, idx: int) -> Friend:
         '''
             Returns friend by index of holding list
@@ -39,40 +78,32 @@ class Friends:
         '''
         return self.friends[-1].time, self.friends[0].time
 
-    @property
+    @memoized('_friends')
     def monthToFriendCount(self) -> Dict[str, int]:
         '''
             Groups time of becoming friends by month and year of occurance,
             returning a count of how many friends were made in a certain month
         '''
-        _buffer = {}
-
-        for i in self.friends:
-            _month = i.time.strftime('%b, %Y')
-
-            if _month not in _buffer:
-                _buffer[_month] = 1
-            else:
-                _buffer[_month] += 1
-
-        return _buffer
+        return countBy(self.buckets.months, monthLabel)
 
     @staticmethod
-    def fromJSON(src: str) -> Friends:
+    def fromJSON(src: str, source: Source = None) -> Friends:
         '''
             Given path to JSON data file, returns 
             object holding all friends with their name
             and time when they became friend
+
+            If source is specified, `src` is considered to be member name
+            in that source ( may be a zip archive )
         '''
         _obj = None
+        source = source or DirSource()
         try:
 
-            if not exists(src):
+            if not source.exists(src):
                 raise Exception('File doesn\'t exist !')
 
-            _data = {}
-            with open(src, mode='r') as fd:
-                _data = load(fd)
+            _data = source.load(src)
 
             _obj = Friends(
                 [Friend(i['name'], i['timestamp'])
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Callable, List
+import numpy as np
+
+
+class Axis:
+    '''
+        Integer indexed axis of histogram, holding sorted bucket ordinals,
+        where tick label of a bucket is formatted only when asked for
+    '''
+
+    def __init__(self, ordinals: np.ndarray, label: Callable[[int], Any] = int):
+        self.ordinals = np.asarray(ordinals, dtype=np.int64)
+        self._label = label
+        self._labels = {}
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def index(self, values: np.ndarray) -> np.ndarray:
+        '''
+            Position of each bucket ordinal on this axis, where
+            ordinals not present on axis are marked with -1
+        '''
+        if not len(self):
+            return np.full(len(values), -1, dtype=np.int64)
+
+        _idx = np.searchsorted(self.ordinals, values)
+        _idx[_idx == len(self)] = 0
+        _idx[self.ordinals[_idx] != values] = -1
+
+        return _idx
+
+    def label(self, idx: int) -> Any:
+        if idx not in self._labels:
+            self._labels[idx] = self._label(self.ordinals[idx])
+
+        return self._labels[idx]
+
+    def labels(self, _frm: int = 0, _to: int = None) -> List[Any]:
+        '''
+            Tick labels of buckets in [_frm, _to)
+        '''
+        return [self.label(i) for i in range(*slice(_frm, _to).indices(len(self)))]
+
+    @staticmethod
+    def span(lo: int, hi: int, label: Callable[[int], Any] = int) -> Axis:
+        '''
+            Axis holding all buckets in [lo, hi]
+        '''
+        return Axis(np.arange(lo, hi + 1), label)
+
+    @staticmethod
+    def distinct(values: np.ndarray, label: Callable[[int], Any] = int) -> Axis:
+        '''
+            Axis holding only those buckets, which are present in given values
+        '''
+        return Axis(np.unique(values), label)
+
+
+def histogram2D(rows: np.ndarray, rowAxis: Axis, columns: np.ndarray, columnAxis: Axis) -> np.ndarray:
+    '''
+        Bins events, given as pair of bucket ordinals, into dense
+        count matrix of shape ( len(rowAxis), len(columnAxis) )
+
+        Events falling outside of either axis are dropped
+    '''
+    _rows = rowAxis.index(rows)
+    _columns = columnAxis.index(columns)
+    _valid = (_rows >= 0) & (_columns >= 0)
+
+    return np.bincount(_rows[_valid] * len(columnAxis) + _columns[_valid],
+                       minlength=len(rowAxis) * len(columnAxis)).reshape(len(rowAxis), len(columnAxis))
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
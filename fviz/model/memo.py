@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+
+from typing import Any, Callable, Dict, Tuple
+from types import MappingProxyType
+from functools import wraps
+from threading import RLock
+
+# qualified name of memoized aggregate -> [ hits, misses ]
+_stats = {}
+
+
+class Memoized:
+    '''
+        Base for models, whose aggregates are computed once & kept
+        until underlying record list changes
+
+        Memoized aggregates never cross process/ pickle boundaries
+
+        Aggregates may be asked for from several threads at once,
+        still each of them gets computed only once
+    '''
+
+    @property
+    def _lock(self) -> RLock:
+        '''
+            Reentrant lock guarding aggregates of this object, both
+            memoized ones & those kept by subclass itself
+        '''
+        return self.__dict__.setdefault('_memoLock', RLock())
+
+    def invalidate(self):
+        '''
+            Drops all memoized aggregates of this object
+        '''
+        self.__dict__.pop('_memo', None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        _state = self.__dict__.copy()
+        _state.pop('_memo', None)
+        _state.pop('_memoLock', None)
+        return _state
+
+
+def _freeze(value: Any) -> Any:
+    '''
+        Converts aggregate into read only view, so that
+        callers can't modify memoized value, shared among them
+    '''
+    if isinstance(value, dict):
+        return MappingProxyType(dict([(k, _freeze(v)) for k, v in value.items()]))
+    if isinstance(value, list):
+        return tuple(map(_freeze, value))
+    if isinstance(value, set):
+        return frozenset(value)
+    if hasattr(value, 'setflags'):
+        # NumPy arrays
+        value.setflags(write=False)
+
+    return value
+
+
+def memoized(records: str) -> Callable[[Callable[[Memoized], Any]], property]:
+    '''
+        Turns method into property, which is computed on first access
+        and returned as read only view afterwards, as long as
+        record list held under attribute `records` stays same
+        ( i.e. neither replaced nor grown/ shrunk )
+    '''
+    def _decorator(fn: Callable[[Memoized], Any]) -> property:
+        _name = fn.__qualname__
+
+        @wraps(fn)
+        def _wrapper(self: Memoized) -> Any:
+            _records = getattr(self, records)
+            _stamp = (id(_records), len(_records))
+            _memo = self.__dict__.setdefault('_memo', {})
+            _counter = _stats.setdefault(_name, [0, 0])
+
+            _entry = _memo.get(_name)
+            if _entry and _entry[0] == _stamp:
+                _counter[0] += 1
+                return _entry[1]
+
+            # reentrant, as aggregates are often built on other
+            # aggregates of same object
+            with self._lock:
+                _entry = _memo.get(_name)
+                if _entry and _entry[0] == _stamp:
+                    _counter[0] += 1
+                    return _entry[1]
+
+                _counter[1] += 1
+                _value = _freeze(fn(self))
+                _memo[_name] = (_stamp, _value)
+
+            return _value
+
+        return property(_wrapper)
+
+    return _decorator
+
+
+def stats() -> Dict[str, Tuple[int, int]]:
+    '''
+        Hit & miss count of each memoized aggregate, since
+        process started ( or stats were reset )
+    '''
+    return dict([(k, tuple(v)) for k, v in _stats.items()])
+
+
+def resetStats():
+    _stats.clear()
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -3,19 +3,25 @@
 from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Any
+from sys import intern
 
 
 class Message:
     '''
         Data class for holding information about a certain message
         sent by a chat participant
+
+        Sender names & message types are interned, as they
+        repeat across lots of messages
     '''
 
+    __slots__ = ('sender', '_timestamp', 'content', 'type')
+
     def __init__(self, sender: str, timestamp: int, content: str, _type: str):
-        self.sender = sender
+        self.sender = intern(sender) if sender else sender
         self._timestamp = timestamp
         self.content = content
-        self.type = _type
+        self.type = intern(_type) if _type else _type
 
     @property
     def timestamp(self) -> datetime:
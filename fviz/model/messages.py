@@ -4,20 +4,98 @@ from __future__ import annotations
 from typing import List, Tuple, Dict, Any
 from .message import Message
 from functools import reduce
-from json import load
+from ..source import Source, DirSource
+from ..stream import streamObject
 from datetime import datetime
+from itertools import chain
+from .columns import MessageColumns, MessageColumnsBuilder
+from .buckets import TimeBuckets, weekLabel
+from .memo import Memoized, memoized
+from .timeindex import TimeIndex, Window
+from .delays import Delays
+import numpy as np
 
+# chat thread files larger than this many bytes are parsed incrementally
+STREAM_THRESHOLD = 1 << 25
 
-class Messages:
+
+class _ContentLoader:
+    '''
+        Reads back contents of all messages of a chat thread,
+        for columnar messages, when they're asked for
+    '''
+
+    def __init__(self, src: str, source: Source):
+        self.src = src
+        self.source = source
+
+    def __call__(self) -> List[str]:
+        _contents = []
+        with self.source.open(self.src) as fd:
+            streamObject(fd, {'messages': lambda e: _contents.append(e.get('content'))})
+
+        return _contents
+
+
+class Messages(Memoized):
     '''
         Holder for all messages in a chat ( private/ group )
     '''
 
-    def __init__(self, title: str, participants: Tuple[str], messages: List[Message], active: bool):
+    def __init__(self, title: str, participants: Tuple[str], messages: List[Message], active: bool, columns: MessageColumns = None, src: str = None):
+        '''
+            Messages can be given either as list of Message objects
+            or in columnar form, in which case `messages` is None
+
+            `src` is name of data file, this chat was read from
+        '''
         self.title = title
         self._participants = participants
         self._messages = messages
         self.active = active
+        self._columns = columns
+        self.src = src
+
+    def __getstate__(self) -> Dict[str, Any]:
+        '''
+            Messages are packed column wise, when crossing
+            process boundary, which keeps pickled form compact
+        '''
+        _state = super().__getstate__()
+        if self._messages is not None:
+            _state['_messages'] = tuple(zip(*[(i.sender, i._timestamp, i.content, i.type)
+                                              for i in self._messages]))
+            _state['_columns'] = None
+        return _state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        if state['_messages'] is not None:
+            state['_messages'] = [Message(*i)
+                                  for i in zip(*state['_messages'])]
+        self.__dict__.update(state)
+
+    @property
+    def isColumnar(self) -> bool:
+        return self._messages is None
+
+    @property
+    def columns(self) -> MessageColumns:
+        '''
+            Columnar view of messages, built on first access
+            ( or when messages changed ) when messages were objectified
+        '''
+        if self._columns is None or\
+                (not self.isColumnar and len(self._columns) != len(self._messages)):
+            self._columns = MessageColumns.fromMessages(self._messages)
+
+        return self._columns
+
+    @property
+    def _records(self) -> List[Any]:
+        '''
+            Underlying records, which memoized aggregates depend on
+        '''
+        return self._columns if self.isColumnar else self._messages
 
     @property
     def name(self) -> str:
@@ -25,11 +103,18 @@ class Messages:
 
     @property
     def messages(self) -> List[Message]:
+        '''
+            For columnar messages, Message objects
+            are created on each access
+        '''
+        if self.isColumnar:
+            return [self._columns.message(i) for i in range(self.count)]
+
         return self._messages
 
     @property
     def count(self) -> int:
-        return len(self._messages)
+        return len(self._columns) if self.isColumnar else len(self._messages)
 
     @property
     def participantCount(self) -> int:
@@ -40,7 +125,10 @@ class Messages:
         return self._participants
 
     def byIndex(self, _idx: int) -> Message:
-        return self._messages[_idx] if _idx >= 0 and _idx < self.count else None
+        if not (_idx >= 0 and _idx < self.count):
+            return None
+
+        return self._columns.message(_idx) if self.isColumnar else self._messages[_idx]
 
     @property
     def isGroupChat(self) -> bool:
@@ -50,16 +138,19 @@ class Messages:
         '''
         return self.participantCount > 2
 
-    @property
+    @memoized('_records')
     def groupByParticipant(self) -> Dict[str, int]:
         '''
             Grouping messages by sender, returns a list of sender
             names with their corresponding message contribution count
         '''
+        _columns = self.columns
         _buffer = dict([(i, 0) for i in self.participants])
 
-        for i in self.messages:
-            _buffer[i.sender] = _buffer.get(i.sender, 0) + 1
+        _counts = np.bincount(_columns.senders,
+                              minlength=len(_columns.names)).tolist()
+        for i, j in enumerate(_columns.names):
+            _buffer[j] = _counts[i]
 
         return _buffer
 
@@ -69,7 +160,7 @@ class Messages:
         '''
         return self.groupByParticipant.get(participant, 0)
 
-    @property
+    @memoized('_records')
     def getPercentageOfContribution(self) -> Dict[str, float]:
         '''
             Instead of returning number of messages each participant sent
@@ -83,58 +174,301 @@ class Messages:
         '''
         return self.getPercentageOfContribution.get(participant, 0.0)
 
-    @property
+    @memoized('_records')
     def timespan(self) -> Tuple[datetime, datetime]:
         '''
             Returns a 2-element tuple of datetime objects, where first one is
             start time and last one is end time of chat
         '''
-        _start, _end = self._messages[0].timestamp, self._messages[-1].timestamp
-        return (_start, _end) if _start < _end else (_end, _start)
+        _timestamps = self.columns.timestamps
+        return tuple(map(lambda e: datetime.fromtimestamp(int(e) / 1000),
+                         [_timestamps.min(), _timestamps.max()]))
 
-    @property
+    @memoized('_records')
+    def buckets(self) -> TimeBuckets:
+        '''
+            Time bucket ordinals of all messages, in order
+        '''
+        return TimeBuckets(self.columns.timestamps)
+
+    @memoized('_records')
+    def delays(self) -> Delays:
+        '''
+            Statistics of gaps in between consecutive messages of this chat thread
+        '''
+        return Delays(self.columns.timestamps)
+
+    @memoized('_records')
+    def index(self) -> TimeIndex:
+        '''
+            Sorted timestamp index over all messages
+        '''
+        return TimeIndex(self.columns.timestamps)
+
+    def between(self, since: datetime = None, until: datetime = None) -> Messages:
+        '''
+            Messages of this chat thread sent in [since, until), as
+            view over this object's messages i.e. nothing gets copied
+        '''
+        _indices = self.index.between(since, until)
+
+        if self.isColumnar:
+            return Messages(self.title,
+                            self.participants,
+                            None,
+                            self.active,
+                            columns=self._columns.take(_indices),
+                            src=self.src)
+
+        return Messages(self.title,
+                        self.participants,
+                        Window(self._messages, _indices),
+                        self.active,
+                        src=self.src)
+
+    @memoized('_records')
+    def weeklyCounts(self) -> Dict[int, Dict[str, int]]:
+        '''
+            Per participant message count in each week of occurance,
+            keyed by week ordinal ( see `TimeBuckets.weeks` ), in order
+            of first appearance of week in chat
+        '''
+        _columns = self.columns
+        _names = len(_columns.names)
+
+        _keys, _first, _inverse = np.unique(self.buckets.weeks,
+                                            return_index=True,
+                                            return_inverse=True)
+        # per week, per sender message count
+        _counts = np.bincount(_inverse.reshape(-1) * _names + _columns.senders,
+                              minlength=len(_keys) * _names).reshape(len(_keys), _names)
+
+        _buffer = {}
+        for i in np.argsort(_first, kind='stable'):
+            _week = dict([(j, 0) for j in self.participants])
+            for j in np.nonzero(_counts[i])[0]:
+                _week[_columns.names[j]] = int(_counts[i][j])
+
+            _buffer[int(_keys[i])] = _week
+
+        return _buffer
+
+    @memoized('_records')
     def groupByWeekOfOccurance(self) -> Dict[str, Dict[str, int]]:
         '''
             Grouping all messages in this chat thread by their
             week of occurance, where week is in this form: `Week X, Y`,
             X is week number ( starting with 1 ) in year Y
         '''
-        _buffer = {}
+        return dict([(weekLabel(k), v) for k, v in self.weeklyCounts.items()])
+
+    @staticmethod
+    def merge(parts: List[Messages]) -> Messages:
+        '''
+            Large chat threads are split across several data files,
+            given all those parts in order ( `message_1.json` first ),
+            merges them into single chat thread
 
-        for i in self.messages:
-            _tm = i.timestamp
-            _week = 'Week {}, {}'.format(int(_tm.strftime('%W'), base=10) + 1,
-                                         _tm.strftime('%Y'))
+            Merged thread is identified by its first part
+        '''
+        if len(parts) == 1:
+            return parts[0]
 
-            if _week not in _buffer:
-                _buffer[_week] = dict([(j, 1) if j == i.sender else (j, 0)
-                                       for j in self.participants])
-                continue
+        _participants = tuple(dict.fromkeys(chain.from_iterable(i.participants
+                                                                for i in parts)))
 
-            _buffer[_week][i.sender] = _buffer[_week].get(i.sender, 0) + 1
+        if all(i.isColumnar for i in parts):
+            return Messages(parts[0].title,
+                            _participants,
+                            None,
+                            parts[0].active,
+                            columns=MessageColumns.concat(
+                                [i.columns for i in parts]),
+                            src=parts[0].src)
 
-        return _buffer
+        return Messages(parts[0].title,
+                        _participants,
+                        list(chain.from_iterable(i.messages for i in parts)),
+                        parts[0].active,
+                        src=parts[0].src)
 
     @staticmethod
-    def fromJSON(src: str) -> Messages:
+    def fromJSON(src: str, source: Source = None, stream: bool = None, columnar: bool = False) -> Messages:
         '''
             Parse JSON data and build messages object, which will
             hold all messages in a chat
+
+            If source is specified, `src` is considered to be member name
+            in that source ( may be a zip archive )
+
+            With `stream` set, messages are objectified one by one while
+            walking through file, so that decoded JSON tree of whole thread
+            is never held in memory. By default it's done for large files only.
+
+            With `columnar` set, messages are accumulated straight into
+            compact columns, without objectifying them, while their contents
+            are read back from source only when asked for.
         '''
+        source = source or DirSource()
+        if not source.exists(src):
+            return None
 
-        def _getFileContent() -> Dict[str, Any]:
-            with open(src, mode='r') as fd:
-                return load(fd)
+        if stream is None:
+            stream = source.size(src) > STREAM_THRESHOLD
+
+        _messages = None
+        _builder = None
+        if columnar:
+            _builder = MessageColumnsBuilder()
+            _handler = _builder.append
+        else:
+            _messages = []
+            _handler = lambda e: _messages.append(Message.fromJSON(e))
+
+        if stream:
+            with source.open(src) as fd:
+                data = streamObject(fd, {'messages': _handler})
+        else:
+            data = source.load(src)
+            for i in data.pop('messages'):
+                _handler(i)
 
-        data = _getFileContent()
         if len(data['participants']) < 2:
             return None
 
         return Messages(
             data['title'],
             tuple([i['name'] for i in data['participants']]),
-            [Message.fromJSON(i) for i in data['messages']],
-            data['is_still_participant'])
+            _messages,
+            data['is_still_participant'],
+            columns=_builder.build(_ContentLoader(src, source)) if _builder else None,
+            src=src)
+
+
+class MessagesHeader:
+    '''
+        Metadata of a chat thread ( title, participants, message count,
+        time of first & last message ), scanned from its data files without
+        objectifying any of its messages
+
+        Anything else is answered by fully loaded chat thread, which is
+        parsed from source only on first such access
+    '''
+
+    def __init__(self, title: str, participants: Tuple[str], active: bool, count: int, first: int, last: int, parts: List[str], source: Source, stream: bool = None, columnar: bool = False):
+        self.title = title
+        self._participants = participants
+        self.active = active
+        self._count = count
+        self._first = first
+        self._last = last
+        self._parts = parts
+        self._source = source
+        self._options = {'stream': stream, 'columnar': columnar}
+        self._thread = None
+
+    def __getattr__(self, name: str) -> Any:
+        # private attributes are never delegated, which
+        # also keeps copying/ pickling from loading chat thread
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.thread, name)
+
+    @property
+    def src(self) -> str:
+        return self._parts[0]
+
+    @property
+    def name(self) -> str:
+        return self.title if self.isGroupChat else ' <-> '.join(self.participants)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def participantCount(self) -> int:
+        return len(self._participants)
+
+    @property
+    def participants(self) -> Tuple[str]:
+        return self._participants
+
+    @property
+    def isGroupChat(self) -> bool:
+        return self.participantCount > 2
+
+    @property
+    def timespan(self) -> Tuple[datetime, datetime]:
+        '''
+            Time of first & last message, None if there's no message
+        '''
+        if self._first is None:
+            return None
+
+        return tuple(map(lambda e: datetime.fromtimestamp(e / 1000),
+                         [self._first, self._last]))
+
+    @property
+    def isLoaded(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def thread(self) -> Messages:
+        '''
+            Fully loaded chat thread, parsed on first access
+        '''
+        if self._thread is None:
+            self._thread = Messages.merge(
+                [i for i in (Messages.fromJSON(j, self._source, **self._options)
+                             for j in self._parts) if i])
+
+        return self._thread
+
+    @staticmethod
+    def fromJSON(parts: List[str], source: Source = None, stream: bool = None, columnar: bool = False) -> MessagesHeader:
+        '''
+            Scans all data files of a chat thread ( `message_1.json` first ),
+            keeping only message count & time of first and last message,
+            where large files are walked through incrementally
+
+            `stream` & `columnar` are used when chat thread gets fully loaded
+        '''
+        source = source or DirSource()
+        _participants = []
+        _timestamps = []
+        data = None
+
+        for i in parts:
+            if not source.exists(i):
+                continue
+
+            if source.size(i) > STREAM_THRESHOLD:
+                with source.open(i) as fd:
+                    _data = streamObject(fd,
+                                         {'messages': lambda e: _timestamps.append(e['timestamp_ms'])})
+            else:
+                _data = source.load(i)
+                _timestamps.extend([j['timestamp_ms'] for j in _data.pop('messages')])
+
+            data = data or _data
+            _participants.extend([j['name'] for j in _data['participants']])
+
+        _participants = tuple(dict.fromkeys(_participants))
+        if not data or len(_participants) < 2:
+            return None
+
+        return MessagesHeader(data['title'],
+                              _participants,
+                              data['is_still_participant'],
+                              len(_timestamps),
+                              min(_timestamps, default=None),
+                              max(_timestamps, default=None),
+                              parts,
+                              source,
+                              stream,
+                              columnar)
 
 
 if __name__ == '__main__':
@@ -1,20 +1,33 @@
 #!/usr/bin/python3
 
 from __future__ import annotations
-from .messages import Messages
-from typing import List, Dict, Any, Tuple
+from .messages import Messages, MessagesHeader
+from .buckets import weekLabel
+from .topk import topK, bottomK
+from ..source import Source
+from ..pipeline import processContext
+from .memo import Memoized, memoized
+from typing import List, Dict, Any, Tuple, Union
 from json import load
 from functools import reduce
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from os import cpu_count
-from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime
 from itertools import chain
+from collections import Counter
 from operator import mul
 from math import ceil
 
 
-class Messenger:
+def _parseBatch(src: List[str], source: Source, stream: bool, columnar: bool) -> List[Messages]:
+    '''
+        Parses a batch of chat thread files, runs in worker process
+    '''
+    return list(filter(lambda e: e,
+                       map(lambda e: Messages.fromJSON(e, source, stream, columnar), src)))
+
+
+class Messenger(Memoized):
     '''
         This class holds all information related to all
         chat threads. Each message, with corrresponding particapting parties, along with timestamp
@@ -24,6 +37,43 @@ class Messenger:
 
     def __init__(self, inbox: List[Messages]):
         self._inbox = inbox
+        # aggregates over all chat threads, computed on first access
+        # and adjusted by delta, when chat threads get replaced, where
+        # each is built under lock & published only once complete
+        self._peerCounts = None
+        self._weekly = None
+        self._winners = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # like memoized ones, these aggregates never cross pickle
+        # boundaries on their own, see `aggregates`
+        _state = super().__getstate__()
+        _state.update(_peerCounts=None, _weekly=None, _winners=None)
+        return _state
+
+    @property
+    def aggregates(self) -> Tuple[Dict, Dict, Dict]:
+        '''
+            Snapshot of aggregates built so far ( those not built yet are None ),
+            which can be pickled along with this object & restored on it afterwards,
+            see `restore`
+        '''
+        with self._lock:
+            return (None if self._peerCounts is None
+                    else dict([(k, list(v)) for k, v in self._peerCounts.items()]),
+                    None if self._weekly is None
+                    else dict([(k, dict(v)) for k, v in self._weekly.items()]),
+                    None if self._winners is None else dict(self._winners))
+
+    def restore(self, aggregates: Tuple[Dict, Dict, Dict]) -> Messenger:
+        '''
+            Restores aggregates, snapshot of which was taken from this very
+            object ( before pickling it ), so that they can be adjusted by delta
+        '''
+        with self._lock:
+            self._peerCounts, self._weekly, self._winners = aggregates
+
+        return self
 
     @property
     def inbox(self) -> List[Messages]:
@@ -33,6 +83,15 @@ class Messenger:
     def count(self) -> int:
         return len(self._inbox)
 
+    @property
+    def owner(self) -> str:
+        '''
+            Name of this user i.e. participant of most chat threads ( all of
+            them, in fact ), None if inbox is empty
+        '''
+        _counts = Counter(chain.from_iterable(i.participants for i in self.inbox))
+        return _counts.most_common(1)[0][0] if _counts else None
+
     def byIndex(self, _idx: int) -> Messages:
         return self._inbox[_idx] if _idx >= 0 and _idx < self.count else None
 
@@ -43,20 +102,123 @@ class Messenger:
             all of facebook chat threads. Even includes count of messages by
             this actor, which can be removed in later phase of processing, if required.
         '''
-        _buffer = {}
+        if self._peerCounts is None:
+            with self._lock:
+                if self._peerCounts is None:
+                    _peerCounts = {}
+                    for i in self.inbox:
+                        self._accountPeers(_peerCounts, i, 1)
+
+                    self._peerCounts = _peerCounts
+
+        return dict([(k, v[0]) for k, v in self._peerCounts.items()])
 
-        for i in map(lambda e: e.groupByParticipant, self.inbox):
-            for k, v in i.items():
-                _buffer[k] = _buffer.get(k, 0) + v
+    @staticmethod
+    def _accountPeers(peerCounts: Dict[str, List[int]], thread: Messages, sign: int):
+        '''
+            Adds ( or removes, with negative sign ) message counts
+            of this chat thread to/ from peer counters, where along with count
+            #-of chat threads referring to peer is kept
+        '''
+        for k, v in thread.groupByParticipant.items():
+            _counter = peerCounts.setdefault(k, [0, 0])
+            _counter[0] += sign * v
+            _counter[1] += sign
 
-        return _buffer
+            if not _counter[1]:
+                del peerCounts[k]
+
+    @property
+    def weeklyBuckets(self) -> Dict[int, Dict[Messages, Dict[str, int]]]:
+        '''
+            Maps each week ordinal ( see `TimeBuckets.weeks` ) to private
+            chat threads active in that week, along with their per participant
+            message count in that week
+        '''
+        if self._weekly is None:
+            with self._lock:
+                if self._weekly is None:
+                    _weekly, _winners = {}, {}
+                    for i in self.inbox:
+                        self._accountWeeks(_weekly, _winners, i, 1)
+
+                    # winners first, as they're looked up once weekly buckets are seen
+                    self._winners = _winners
+                    self._weekly = _weekly
+
+        return self._weekly
+
+    @staticmethod
+    def _accountWeeks(weekly: Dict[int, Dict[Messages, Dict[str, int]]], winners: Dict[int, Tuple[int, Messages]], thread: Messages, sign: int):
+        if thread.isGroupChat:
+            return
+
+        for k, v in thread.weeklyCounts.items():
+            if sign > 0:
+                weekly.setdefault(k, {})[thread] = dict(v)
+                Messenger._elect(weekly, winners, k, thread)
+                continue
+
+            del weekly[k][thread]
+            if not weekly[k]:
+                del weekly[k]
+                del winners[k]
+            elif winners[k][1] is thread:
+                # top chat thread of this week is gone, so
+                # electing again among remaining ones
+                del winners[k]
+                for j in weekly[k]:
+                    Messenger._elect(weekly, winners, k, j)
+
+    @staticmethod
+    def _elect(weekly: Dict[int, Dict[Messages, Dict[str, int]]], winners: Dict[int, Tuple[int, Messages]], week: int, thread: Messages):
+        '''
+            Keeps track of top chat thread of week, in terms of product
+            of participant message counts, where one with smaller source path
+            wins on tie, so that winners don't depend on order of chat threads
+            ( which changes, as they get replaced )
+        '''
+        _score = reduce(mul, weekly[week][thread].values(), 1)
+
+        if week not in winners or _score > winners[week][0] or\
+                (_score == winners[week][0] and (thread.src or '') < (winners[week][1].src or '')):
+            winners[week] = (_score, thread)
+
+    def update(self, removed: List[Messages], added: List[Messages]) -> Messenger:
+        '''
+            Replaces chat threads, while adjusting already computed
+            aggregates by removed & added threads only, instead of
+            recomputing them over whole inbox
+        '''
+        with self._lock:
+            _removed = set(map(id, removed))
+            self._inbox = [i for i in self._inbox if id(i) not in _removed]
+            self._inbox.extend(added)
+
+            for _sign, _threads in ((-1, removed), (1, added)):
+                for i in _threads:
+                    if self._peerCounts is not None:
+                        self._accountPeers(self._peerCounts, i, _sign)
+                    if self._weekly is not None:
+                        self._accountWeeks(self._weekly, self._winners, i, _sign)
+
+        return self
+
+    def between(self, since: datetime = None, until: datetime = None) -> Messenger:
+        '''
+            Chat threads holding only messages sent in [since, until),
+            where threads with no message in that window are left out
+        '''
+        return Messenger([j for j in (i.between(since, until) for i in self._inbox)
+                          if j.count])
 
     def topXBusiestChats(self, x: int = 15) -> List[Tuple[str, int]]:
         '''
             Finds top X number of chats with highest number of messages
             transacted
         '''
-        return Counter(dict([(i.name, i.count) for i in self._inbox])).most_common(x)
+        return topK(dict([(i.name, i.count) for i in self._inbox]).items(),
+                    x, key=lambda e: e[1])
 
     def topXPrivateChatsWithHighestContributionFromParticipant(self, x: int, participant: str) -> List[Tuple[str, str, float, float]]:
         '''
@@ -68,60 +230,51 @@ class Messenger:
             return _participants if _participants[0] == participant \
                 else (_participants[1], _participants[0])
 
-        return list(
-            map(lambda e: (e[0], e[1], e[-1], 100 - e[-1]),
-                sorted(
-                sorted(
-                    map(
-                        lambda e: (*_organizeParticipants(e.participants),
-                                   e.count,
-                                   e.getPercentageOfContributionByParticipant(participant)),
-                        filter(lambda e: e.participantCount == 2,
-                               self._inbox)),
-                    key=lambda e: e[-2],
-                    reverse=True)[:x],
-                key=lambda e: e[-1],
-                reverse=True)))
+        _busiest = topK(filter(lambda e: e.participantCount == 2, self._inbox),
+                        x, key=lambda e: e.count)
+
+        return sorted(
+            map(lambda e: (*_organizeParticipants(e.participants),
+                           e.getPercentageOfContributionByParticipant(participant),
+                           100 - e.getPercentageOfContributionByParticipant(participant)),
+                _busiest),
+            key=lambda e: e[2],
+            reverse=True)
 
     def topXPrivateChatsWithLowestContributionFromParticipant(self, x: int, participant: str) -> List[Tuple[str, str, float, float]]:
         '''
             Returns a list ( top X ) of private chats where this
             participant ( yes it's you ) made lowest contribution
+
+            Only busier half ( at least X ) of private chats are considered
         '''
 
         def _organizeParticipants(_participants: Tuple[str, str]) -> Tuple[str, str]:
             return _participants if _participants[0] == participant \
                 else (_participants[1], _participants[0])
 
-        def _getOrderedParticipantsAlongWithContributions(_participants: Tuple[str, str], mObj: Messages) -> Tuple[str, str, int, int]:
-            return (*_participants,
-                    *tuple(map(mObj.getContributionCountByParticipant,
-                               _participants)))
-
-        def _getFirstHalfOfList(l: List[Tuple[str, str, int, int]]) -> List[Tuple[str, str, int, int]]:
-            if not l:
-                return []
+        def _getOrderedParticipantsAlongWithContributions(mObj: Messages) -> Tuple[str, str, int, int]:
+            _participants = _organizeParticipants(mObj.participants)
+            _counts = mObj.groupByParticipant
 
-            return l[:ceil(len(l) / 2) if x <= ceil(len(l) / 2) else x]
+            return (*_participants,
+                    *tuple(map(lambda e: _counts.get(e, 0), _participants)))
 
         def _calculatePercentageOfParticipation(_tuple: Tuple[str, str, int, int]) -> Tuple[str, str, float, float]:
             _total = sum(_tuple[2:])
 
             return (*_tuple[:2], *tuple(map(lambda e: (e / _total) * 100, _tuple[2:])))
 
-        return list(
-            map(_calculatePercentageOfParticipation,
-                sorted(
-                    _getFirstHalfOfList(
-                        sorted(
-                            map(lambda e: _getOrderedParticipantsAlongWithContributions(
-                                _organizeParticipants(e._participants), e),
-                                filter(lambda e: e.participantCount == 2, self._inbox)),
-                            key=lambda e: e[-1] + e[-2],
-                            reverse=True)),
-                    key=lambda e: e[-2])[:x]))
+        _private = list(map(_getOrderedParticipantsAlongWithContributions,
+                            filter(lambda e: e.participantCount == 2, self._inbox)))
+        _busier = topK(_private,
+                       max(ceil(len(_private) / 2), x),
+                       key=lambda e: e[-1] + e[-2])
 
-    @property
+        return list(map(_calculatePercentageOfParticipation,
+                        bottomK(_busier, x, key=lambda e: e[-2])))
+
+    @memoized('_inbox')
     def timespan(self) -> Tuple[datetime, datetime]:
         '''
             Life time of whole facebook messenger chat with starting & ending time
@@ -129,89 +282,167 @@ class Messenger:
         _all = list(chain.from_iterable([i.timespan for i in self.inbox]))
         return min(_all), max(_all)
 
-    @property
-    def _classifyMessagesByTheirWeekOfOccuranceAndParticipantContribution(self) -> Tuple[List[str], List[List[Dict[str, int]]]]:
-        '''
-            Classifies all chats in this user's messenger, by their week of occurance
-            and under each week which chat participant sent how many messages is also kept
-        '''
-        _data = list(filter(lambda e: e,
-                            map(lambda e: None if e.isGroupChat else e.groupByWeekOfOccurance,
-                                self.inbox)))
-
-        # chronologically ascending weeks
-        _weeks = []
-        # start and end datetime of all chats in messenger
-        _start, _end = self.timespan
-
-        while _start <= _end:
-            _week = 'Week {}, {}'.format(int(_start.strftime('%W'), base=10) + 1,
-                                         _start.strftime('%Y'))
-            if _week not in _weeks:
-                _weeks.append(_week)
-            _start += timedelta(days=7)
-
-        _buffer = []
-
-        for i in _weeks:
-
-            _tmp = []
-            for j in _data:
-                if i not in j:
-                    continue
-                _tmp.append(j[i])
-
-            _buffer.append(_tmp or None)
-
-        return _weeks, _buffer
-
-    @property
+    @memoized('_inbox')
     def topChatThreadPerWeek(self) -> List[Tuple[str, Dict[str, int]]]:
         '''
-            Top chat thread for each week, along with week identifier
-        '''
+            Top chat thread for each week ( chronologically ascending ), along with
+            week identifier, where it's top in terms of number of messages transferred
 
-        def _mostActiveChatThread(_data: List[Dict[str, int]]) -> Dict[str, int]:
-            '''
-                Finds top chat thread from all chat threads of a week, where it's top
-                in terms of number of messages transferred
-            '''
-            return max(_data,
-                       key=lambda e: reduce(
-                           lambda acc, cur: acc * cur,
-                           e.values(),
-                           1))
+            Top chat threads are elected while building weekly buckets, and
+            adjusted as chat threads get replaced
+        '''
+        _weekly = self.weeklyBuckets
 
-        return list(
-            map(
-                lambda e: (e[0], _mostActiveChatThread(e[1])),
-                filter(
-                    lambda e: e[1],
-                    zip(*self._classifyMessagesByTheirWeekOfOccuranceAndParticipantContribution))))
+        return [(weekLabel(k), _weekly[k][self._winners[k][1]])
+                for k in sorted(self._winners)]
 
     @staticmethod
-    def fromJSON(src: List[str]) -> Messenger:
+    def fromJSON(src: List[Union[str, List[str]]], source: Source = None, backend: str = 'thread', workers: int = None, stream: bool = None, columnar: bool = False) -> Messenger:
         '''
            Reads each JSON file content concurrently, holding messages
            and objectifies them, finally forming Messenger object,
            which can be manipulated later
+
+           If source is specified, each of `src` is considered to be member name
+           in that source ( may be a zip archive )
+
+           Chat thread split across several files can be given as ordered
+           list of its parts, which are parsed concurrently and then merged
+           into single chat thread
+
+           Parsing is CPU bound, so with `process` backend files are
+           split into batches, which are parsed in worker processes
+
+           `stream` & `columnar` are passed down to Messages.fromJSON, where
+           columnar threads are much cheaper to ship back from workers
         '''
         try:
             if not src:
                 raise Exception('No files specified')
 
-            with ThreadPoolExecutor(cpu_count() or 1) as _exec:
-                return Messenger(
-                    list(
+            _threads = [[i] if isinstance(i, str) else list(i) for i in src]
+            _files = list(chain.from_iterable(_threads))
+            workers = workers or cpu_count() or 1
+
+            if backend == 'process':
+                # a few batches per worker, so that uneven sized
+                # chat threads get spread out
+                _batches = [_files[i::workers * 4]
+                            for i in range(min(workers * 4, len(_files)))]
+
+                with ProcessPoolExecutor(workers, mp_context=processContext()) as _exec:
+                    _parsed = list(
+                        chain.from_iterable(
+                            map(lambda e: e.result(),
+                                as_completed(
+                                [_exec.submit(_parseBatch, i, source, stream, columnar)
+                                 for i in _batches]
+                            ))))
+            else:
+                with ThreadPoolExecutor(workers) as _exec:
+                    _parsed = list(
                         filter(lambda e: e,
                                map(lambda e: e.result(),
                                    as_completed(
-                                   [_exec.submit(Messages.fromJSON, src=i)
-                                    for i in src]
-                               )))))
+                                   [_exec.submit(Messages.fromJSON, src=i, source=source, stream=stream, columnar=columnar)
+                                    for i in _files]
+                               ))))
+
+            _parsed = dict([(i.src, i) for i in _parsed])
+            return Messenger(
+                [Messages.merge(i)
+                 for i in ([_parsed[k] for k in j if k in _parsed] for j in _threads)
+                 if i])
+        except Exception:
+            return None
+
+    @staticmethod
+    def scan(src: List[Union[str, List[str]]], source: Source = None, workers: int = None, **kwargs) -> Messenger:
+        '''
+            Builds Messenger out of chat thread headers only ( see
+            `MessagesHeader` ), scanning thread files concurrently, where
+            no message gets objectified
+
+            Metadata level analyses ( say, busiest chats ) are answered
+            right away, while a chat thread is fully parsed only when
+            anything else is asked of it, using keyword arguments,
+            `stream` & `columnar`, as in Messenger.fromJSON
+        '''
+        try:
+            if not src:
+                raise Exception('No files specified')
+
+            _threads = [[i] if isinstance(i, str) else list(i) for i in src]
+            with ThreadPoolExecutor(workers or cpu_count() or 1) as _exec:
+                _headers = list(_exec.map(lambda e: MessagesHeader.fromJSON(e, source, **kwargs),
+                                          _threads))
+
+            return Messenger([i for i in _headers if i])
         except Exception:
             return None
 
+    @staticmethod
+    def signatures(src: List[Union[str, List[str]]], source: Source) -> Dict[str, Tuple]:
+        '''
+            Signatures of data files of each chat thread, keyed by
+            its first part, which identifies chat thread
+        '''
+        return dict([(i[0], tuple(map(source.signature, i)))
+                     for i in ([i] if isinstance(i, str) else list(i) for i in src)])
+
+    @staticmethod
+    def findOwner(src: List[Union[str, List[str]]], source: Source) -> str:
+        '''
+            Name of this user, as only participant common to private chat threads,
+            found by reading as few of them as possible, smallest ones first
+
+            Returns None if it can't be told apart from other participants
+        '''
+        _owner = None
+        _parts = sorted([i if isinstance(i, str) else i[0] for i in src], key=source.size)
+
+        for i in _parts:
+            _names = set([j['name'] for j in (source.load(i) or {}).get('participants', [])])
+            if len(_names) != 2:
+                continue
+
+            _owner = _names if _owner is None else _owner & _names
+            if len(_owner) < 2:
+                break
+
+        return _owner.pop() if _owner and len(_owner) == 1 else None
+
+    @staticmethod
+    def ingest(src: List[Union[str, List[str]]], source: Source, previous: Messenger = None, signatures: Dict[str, Tuple] = None, **kwargs) -> Tuple[Messenger, Dict[str, Tuple]]:
+        '''
+            Incrementally ingests chat thread files, given Messenger
+            built from earlier export of same account, along with signatures
+            of data files it was built from
+
+            Only those chat threads, having any of their files new or changed, are
+            parsed, while rest of them are reused as is. Returns updated Messenger
+            along with current signatures, to be passed in next time.
+
+            Other keyword arguments are passed down to Messenger.fromJSON
+        '''
+        _threads = [[i] if isinstance(i, str) else list(i) for i in src]
+        _signatures = Messenger.signatures(_threads, source)
+        if not previous:
+            return Messenger.fromJSON(_threads, source, **kwargs), _signatures
+
+        signatures = signatures or {}
+        _reused = set([i.src for i in previous.inbox
+                       if i.src in _signatures and signatures.get(i.src) == _signatures[i.src]])
+
+        _pending = [i for i in _threads if i[0] not in _reused]
+        _parsed = Messenger.fromJSON(_pending, source, **kwargs)\
+            if _pending else Messenger([])
+        if not _parsed:
+            return None, _signatures
+
+        return previous.update([i for i in previous.inbox if i.src not in _reused],
+                               _parsed.inbox), _signatures
+
 
 if __name__ == '__main__':
     print('It\'s not supposed to be used this way !')
@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import List, Tuple, Union
+from itertools import chain
+from unicodedata import normalize as unicodeNormalize
+import numpy as np
+from .reactions import Reactions
+from .comments import Comments
+from .messenger import Messenger
+from .friends import Friends
+
+# source kinds of records, which refer to peers
+KINDS = ('reaction', 'comment', 'message', 'friend')
+REACTION, COMMENT, MESSAGE, FRIEND = range(len(KINDS))
+
+
+def normalize(name: str) -> str:
+    '''
+        Canonical form of peer name, used for matching same
+        person across sources, where names are compared
+        ignoring case, unicode form & extra whitespaces
+    '''
+    return ' '.join(unicodeNormalize('NFKC', name).split()).casefold()
+
+
+class PeerIndex:
+    '''
+        Assigns each distinct ( normalized ) peer name an integer id,
+        in order of first appearance in reactions, comments, messages
+        & friends, in this order
+
+        Keeps peer id of each reaction, comment & friend record, along with
+        postings of each peer i.e. which records ( chat threads, for messages )
+        of each source kind refer to that peer
+    '''
+
+    def __init__(self):
+        self._ids = {}
+        self._names = []
+        # peer id of each record, for sources where
+        # a record refers to at most one peer
+        self.ids = {}
+        # ( peer id, record index ) pairs of each source kind,
+        # turned into postings once all peers are registered
+        self._pairs = {}
+        self._postings = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize(name) in self._ids
+
+    @property
+    def names(self) -> Tuple[str]:
+        '''
+            Peer names, as first seen, indexed by peer id
+        '''
+        return tuple(self._names)
+
+    def name(self, _id: int) -> str:
+        return self._names[_id] if _id >= 0 and _id < len(self) else None
+
+    def id(self, name: str) -> int:
+        '''
+            Peer id of name, -1 if it's not known
+        '''
+        return self._ids.get(normalize(name), -1) if name else -1
+
+    def code(self, name: str) -> int:
+        '''
+            Peer id of name, registering it if it's not known yet
+        '''
+        if not name:
+            return -1
+
+        _key = normalize(name)
+        if _key not in self._ids:
+            self._ids[_key] = len(self._names)
+            self._names.append(name)
+
+        return self._ids[_key]
+
+    def codes(self, names: List[str]) -> np.ndarray:
+        '''
+            Peer ids of given names, followed by -1, so that indexing
+            it with -1 ( i.e. missing name ) yields -1
+        '''
+        return np.array([self.code(i) for i in names] + [-1], dtype=np.int32)
+
+    def _addRecords(self, kind: int, ids: np.ndarray):
+        self.ids[kind] = ids
+        _valid = np.flatnonzero(ids >= 0)
+        self._pairs[kind] = (ids[_valid], _valid)
+
+    def _finalize(self):
+        for k, (_ids, _records) in self._pairs.items():
+            _order = np.argsort(_ids, kind='stable')
+            _offsets = np.searchsorted(_ids[_order], np.arange(len(self) + 1))
+            self._postings[k] = (_records[_order], _offsets)
+
+        self._pairs = {}
+
+    def postings(self, peer: Union[str, int], kind: int) -> np.ndarray:
+        '''
+            Indices of records ( chat threads, for messages ) of given
+            source kind, referring to peer, given by name or id
+        '''
+        _id = self.id(peer) if isinstance(peer, str) else peer
+        if _id < 0 or kind not in self._postings:
+            return np.zeros(0, dtype=np.int64)
+
+        _records, _offsets = self._postings[kind]
+        return _records[_offsets[_id]:_offsets[_id + 1]]
+
+    def counts(self, kind: int) -> np.ndarray:
+        '''
+            Number of records of given source kind referring to each peer
+        '''
+        return np.diff(self._postings[kind][1]) if kind in self._postings\
+            else np.zeros(len(self), dtype=np.int64)
+
+    @staticmethod
+    def fromModels(reactions: Reactions = None, comments: Comments = None, messenger: Messenger = None, friends: Friends = None) -> PeerIndex:
+        '''
+            Indexes peers of given sources, those left out
+            having neither ids nor postings
+        '''
+        _index = PeerIndex()
+
+        if reactions:
+            _codes, _names = reactions.peerCodes
+            _index._addRecords(REACTION, _index.codes(_names)[_codes])
+
+        if comments:
+            _index._addRecords(COMMENT,
+                               np.array([_index.code(i.peer) for i in comments.comments],
+                                        dtype=np.int32))
+
+        if messenger:
+            _peers, _threads = [], []
+            for i, j in enumerate(messenger.inbox):
+                _ids = dict.fromkeys(_index.code(k)
+                                     for k in chain(j.groupByParticipant, j.columns.names))
+                _ids.pop(-1, None)
+                _peers.extend(_ids)
+                _threads.extend([i] * len(_ids))
+
+            _index._pairs[MESSAGE] = (np.array(_peers, dtype=np.int32),
+                                      np.array(_threads, dtype=np.int64))
+
+        if friends:
+            _index._addRecords(FRIEND,
+                               np.array([_index.code(i.name) for i in friends.friends],
+                                        dtype=np.int32))
+
+        _index._finalize()
+        return _index
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -1,23 +1,55 @@
 #!/usr/bin/python3
 
+from typing import Tuple
 from datetime import datetime
+from sys import intern
 from re import (
     compile as regCompile,
     I as regI
 )
 
+_likedPeer = regCompile(r'((likes|liked)\s(.+)\'s)', flags=regI)
+_reactedPeer = regCompile(r'(reacted\sto\s(.+)\'s)', flags=regI)
+_target = regCompile(r'(\'s\s(.+))$')
+
+
+def _parseTitle(title: str, reaction: str) -> Tuple[str, str]:
+    '''
+        Extracts peer & target of reaction from its title
+    '''
+    if not title:
+        return None, None
+
+    if reaction == 'LIKE':
+        _match = _likedPeer.search(title)
+        _peer = _match.group(3) if _match else None
+    else:
+        _match = _reactedPeer.search(title)
+        _peer = _match.group(2) if _match else None
+
+    _match = _target.search(title)
+
+    return intern(_peer) if _peer else _peer,\
+        _match.group(2)[:-1] if _match else None
+
 
 class ReactedContent:
     '''
         Holds information related to reaction,
         given by actor to some content on facebook
+
+        Title is parsed only once, while objectifying
     '''
 
+    __slots__ = ('_title', '_reaction', '_actor', '_timestamp',
+                 '_peer', '_target')
+
     def __init__(self, title: str, reaction: str, actor: str, timestamp: int):
         self._title = title
-        self._reaction = reaction
-        self._actor = actor
+        self._reaction = intern(reaction) if reaction else reaction
+        self._actor = intern(actor) if actor else actor
         self._timestamp = timestamp
+        self._peer, self._target = _parseTitle(title, self._reaction)
 
     @property
     def title(self) -> str:
@@ -41,18 +73,7 @@ class ReactedContent:
             Returns name of person, whose
             post/ comment/ photo liked by actor
         '''
-        if self.reaction == 'LIKE':
-            regex = regCompile(r'((likes|liked)\s(.+)\'s)', flags=regI)
-            match = regex.search(self.title)
-            if not match:
-                return None
-            return match.group(3)
-
-        regex = regCompile(r'(reacted\sto\s(.+)\'s)', flags=regI)
-        match = regex.search(self.title)
-        if not match:
-            return None
-        return match.group(2)
+        return self._peer
 
     @property
     def target(self) -> str:
@@ -67,13 +88,7 @@ class ReactedContent:
             Also includes information where this content
             was present, in case of groups [ i.e. group name ]
         '''
-        regex = regCompile(r'(\'s\s(.+))$')
-
-        match = regex.search(self.title)
-        if not match:
-            return None
-
-        return match.group(2)[:-1]
+        return self._target
 
 
 if __name__ == '__main__':
@@ -3,17 +3,32 @@
 from __future__ import annotations
 from typing import List, Tuple, Dict, Set
 from datetime import datetime, date, time, timedelta
-from os.path import exists
-from json import load
-from functools import reduce
+import numpy as np
 from .reactedContent import ReactedContent
-from operator import sub, add
-
-
-class Reactions:
+from ..source import Source, DirSource
+from .memo import Memoized, memoized
+from .timeindex import TimeIndex, Window
+from .topk import topKIndices
+from .delays import Delays, asTimedeltas
+from .buckets import (
+    TimeBuckets,
+    groupBy,
+    countBy,
+    countBy2D,
+    dayLabel,
+    weekLabel,
+    monthLabel,
+    quarterLabel,
+    minuteLabel
+)
+
+
+class Reactions(Memoized):
     '''
         Holds all reacted content realated information made by an actor
         in form of an ordered listed ( chronologically decreasing )
+
+        Aggregates are computed once and returned as read only views
     '''
 
     def __init__(self, reactions: List[ReactedContent]):
@@ -26,7 +41,36 @@ class Reactions:
         '''
         return self._reactions
 
-    @property
+    @memoized('_reactions')
+    def timestamps(self) -> np.ndarray:
+        '''
+            Timestamps of all reactions ( in milliseconds ), in order
+        '''
+        return np.fromiter((i._timestamp for i in self.reactions),
+                           dtype=np.int64, count=self.count) * 1000
+
+    @memoized('_reactions')
+    def buckets(self) -> TimeBuckets:
+        '''
+            Time bucket ordinals of all reactions, in order
+        '''
+        return TimeBuckets(self.timestamps)
+
+    @memoized('_reactions')
+    def index(self) -> TimeIndex:
+        '''
+            Sorted timestamp index over all reactions
+        '''
+        return TimeIndex(self.timestamps)
+
+    def between(self, since: datetime = None, until: datetime = None) -> Reactions:
+        '''
+            Reactions made in [since, until), as view over
+            this object's reactions i.e. nothing gets copied
+        '''
+        return Reactions(Window(self._reactions, self.index.between(since, until)))
+
+    @memoized('_reactions')
     def groupByPeers(self) -> Dict[str, List[int]]:
         '''
             Groups all rections by peer name i.e. whose content is
@@ -49,7 +93,7 @@ class Reactions:
 
         return buffer
 
-    @property
+    @memoized('_reactions')
     def peerToReactionCount(self) -> Dict[str, int]:
         '''
             Returns count of interactions made with each peer
@@ -66,16 +110,35 @@ class Reactions:
 
         return _buffer
 
+    @memoized('_reactions')
+    def peerCodes(self) -> Tuple[np.ndarray, Tuple[str]]:
+        '''
+            Peer of each reaction as integer code ( -1, when there's none ),
+            along with code to peer name table, in order of first appearance
+        '''
+        _names = {None: -1}
+        _codes = np.fromiter((_names.setdefault(i.peer, len(_names) - 1)
+                              for i in self.reactions),
+                             dtype=np.int64, count=self.count)
+        del _names[None]
+
+        return _codes, tuple(_names)
+
     def getTopXPeerToReactionCount(self, x: int) -> Dict[str, int]:
-        buffer = self.groupByPeers
+        '''
+            Top X peers by reaction count, in ascending order of
+            count, where later appearing peer wins on tie
+        '''
+        _codes, _names = self.peerCodes
+        _counts = np.bincount(_codes[_codes >= 0], minlength=len(_names))
 
-        if x >= len(buffer):
-            return dict([(k, len(v)) for k, v in buffer.items()])
+        if x >= len(_names):
+            return dict(zip(_names, _counts.tolist()))
 
-        return dict([(i, len(buffer[i]))
-                     for i in sorted(buffer.keys(), key=lambda e: len(buffer[e]))[-x:]])
+        _idx = len(_names) - 1 - topKIndices(_counts[::-1], x)
+        return dict([(_names[i], int(_counts[i])) for i in reversed(_idx)])
 
-    @property
+    @memoized('_reactions')
     def groupByReactions(self) -> Dict[str, List[int]]:
         '''
             Groups all reactions by their types i.e. HAHA, SAD, LIKE etc
@@ -95,7 +158,7 @@ class Reactions:
 
         return buffer
 
-    @property
+    @memoized('_reactions')
     def reactionTypeToCount(self) -> Dict[str, int]:
         '''
             Maps reaction types to their corresponding count
@@ -125,12 +188,9 @@ class Reactions:
             100 (approx, cause we're dealing with floats )
         '''
         _count = self.count
-        buffer = self.reactionTypeToCount
 
-        for k in buffer:
-            buffer[k] = (buffer[k] * 100) / _count
-
-        return buffer
+        return dict([(k, (v * 100) / _count)
+                     for k, v in self.reactionTypeToCount.items()])
 
     def getReactionByIndex(self, index: int) -> ReactedContent:
         '''
@@ -159,17 +219,19 @@ class Reactions:
         return self._reactions[-1].time, self._reactions[0].time
 
     @staticmethod
-    def fromJSON(src: str) -> Reactions:
+    def fromJSON(src: str, source: Source = None) -> Reactions:
         '''
             Given path to data file, returns instance of this class
             holding all reacted contents, by actor
+
+            If source is specified, `src` is considered to be member name
+            in that source ( may be a zip archive )
         '''
-        if not exists(src):
+        source = source or DirSource()
+        if not source.exists(src):
             return None
         try:
-            data = None
-            with open(src, 'r') as fd:
-                data = load(fd)
+            data = source.load(src)
 
             if not data:
                 return None
@@ -185,13 +247,25 @@ class Reactions:
         except Exception:
             return None
 
-    @property
+    @memoized('_reactions')
     def reactionTypes(self) -> Set[str]:
         '''
             Returns available reaction types
         '''
         return set([i.reaction for i in self.reactions])
 
+    @memoized('_reactions')
+    def reactionCodes(self) -> Tuple[np.ndarray, Tuple[str]]:
+        '''
+            Reaction type of each reaction as integer code, along
+            with code to reaction type table, which is sorted
+        '''
+        _names = tuple(sorted(self.reactionTypes))
+        _index = dict([(k, i) for i, k in enumerate(_names)])
+
+        return np.fromiter((_index[i.reaction] for i in self.reactions),
+                           dtype=np.int64, count=self.count), _names
+
     @property
     def reactionTypeToTimeStamps(self) -> Dict[str, List[datetime]]:
         '''
@@ -199,37 +273,22 @@ class Reactions:
             returns a mapping of reaction type to list of timestamps,
             when those reactions were made ( in chronological fashion )
         '''
-        buffer = self.groupByReactions
+        return dict([(k, [self.getReactionByIndex(i).time for i in v])
+                     for k, v in self.groupByReactions.items()])
 
-        for _, v in buffer.items():
-            for i, j in enumerate(v):
-                v[i] = self.getReactionByIndex(j).time
-
-        return buffer
-
-    @property
+    @memoized('_reactions')
     def dateToReactionTypeAndCount(self) -> Dict[date, Dict[str, int]]:
         '''
             Groups all reacted contents by their date of occurance
             and for each of them keeps track of count of different reactions
             happened on that date
         '''
-        buffer = {}
+        _codes, _names = self.reactionCodes
 
-        for i in self.reactions:
-            _dt = i.time.date()
+        return countBy2D(self.buckets.days, _codes,
+                         dayLabel, lambda e: _names[e])
 
-            if _dt not in buffer:
-                buffer[_dt] = {i.reaction: 1}
-            else:
-                if i.reaction not in buffer[_dt]:
-                    buffer[_dt][i.reaction] = 1
-                else:
-                    buffer[_dt][i.reaction] += 1
-
-        return buffer
-
-    @property
+    @memoized('_reactions')
     def weekToWeekDayAndReactionCount(self) -> Dict[str, Dict[int, int]]:
         '''
             Groups all reactions by week of happening ( where format 
@@ -237,50 +296,21 @@ class Reactions:
             and along side also keeps track of count of all reactions on 7 possible days
             in each of those weeks
         '''
-        buffer = {}
-
-        for i in self.reactions:
-            _dt = i.time.date()
-            _week = 'Week {}, {}'.format(
-                int(_dt.strftime('%W'), base=10) + 1,
-                _dt.strftime('%Y'))
-
-            if _week not in buffer:
-                buffer[_week] = {
-                    int(_dt.strftime('%w'), base=10): 1
-                }
-            else:
-                if int(_dt.strftime('%w'), base=10) not in buffer[_week]:
-                    buffer[_week][int(
-                        _dt.strftime('%w'),
-                        base=10)] = 1
-                else:
-                    buffer[_week][int(
-                        _dt.strftime('%w'),
-                        base=10)] += 1
-
-        return buffer
+        return countBy2D(self.buckets.weeks, self.buckets.weekDays,
+                         weekLabel, int)
 
-    @property
+    @memoized('_reactions')
     def groupByMonth(self) -> Dict[str, List[int]]:
         '''
             Groups all reactions into sublists by
             their month of occurance where month
             will be of form `%b, %Y`
         '''
-        buffer = {}
-
-        for i, j in enumerate(self.reactions):
-            _month = j.time.strftime('%b, %Y')
-
-            if _month not in buffer:
-                buffer[_month] = [i]
-            else:
-                buffer[_month].append(i)
+        buffer = groupBy(self.buckets.months, monthLabel)
 
         return dict([(k, buffer[k]) for k in reversed(buffer.keys())])
 
-    @property
+    @memoized('_reactions')
     def reactedContentTypeToCount(self) -> Dict[str, int]:
         '''
             Returns a mapping from reacted content type ( post, photo, comment )
@@ -298,7 +328,7 @@ class Reactions:
 
         return buffer
 
-    @property
+    @memoized('_reactions')
     def groupByMinuteInADay(self) -> Dict[time, int]:
         '''
             Maps all reactions into 1440 minutes possible in a day.
@@ -307,17 +337,14 @@ class Reactions:
             and considering only hour and minute part, keeping track of number of 
             events happened on that minute over time frame of dataset
         '''
-        buffer = {}
-
-        for i in self.reactions:
-            _tm = i.time.time().replace(second=0)
+        return countBy(self.buckets.minutes, minuteLabel)
 
-            if _tm not in buffer:
-                buffer[_tm] = 1
-            else:
-                buffer[_tm] += 1
-
-        return buffer
+    @memoized('_reactions')
+    def delays(self) -> Delays:
+        '''
+            Statistics of delays in between consecutive like/ reaction events
+        '''
+        return Delays(self.timestamps)
 
     @property
     def getInBetweenDelays(self) -> map:
@@ -328,11 +355,7 @@ class Reactions:
             For N number of like/ reaction events, N-1 number of timedeltas will
             be there
         '''
-        return map(lambda e: sub(
-            *sorted((
-                self.getReactionByIndex(e-1).time, self.getReactionByIndex(e).time),
-                reverse=True)),
-            range(1, self.count))
+        return map(lambda e: timedelta(milliseconds=e), self.delays.delays.tolist())
 
     @property
     def getCumulativeSumOfDelays(self) -> List[timedelta]:
@@ -340,76 +363,47 @@ class Reactions:
             Computes cumulative sum of all ascendingly 
             sorted like/ reaction delays 
         '''
-        _buffer = sorted(self.getInBetweenDelays)
-        _cumsum = []
-
-        for i, j in enumerate(_buffer):
-
-            if not i:
-                _cumsum.append(j)
-            else:
-                _cumsum.append(j + _cumsum[i-1])
-
-        return _cumsum
+        return asTimedeltas(self.delays.cumulative)
 
     @property
     def getCumSumPercentage(self) -> List[float]:
         '''
             Calculate percentage contribution from cum-sum time delays
         '''
-        _buffer = self.getCumulativeSumOfDelays
-        _percentages = []
-
-        for i in _buffer:
-            _percentages.append(i / _buffer[-1] * 100)
-
-        return _percentages
+        return self.delays.cumulativePercentage.tolist()
 
     @property
     def getMeanTimeDelay(self) -> timedelta:
         '''
-            Computes mean time delay of all likes/ reactions events
+            Computes mean time delay of all likes/ reactions events,
+            None if there're less than 2 of them
         '''
-        _buffer = list(self.getInBetweenDelays)
+        if not len(self.delays):
+            return None
 
-        return reduce(add, _buffer[1:], _buffer[0]) / len(_buffer)
+        return timedelta(milliseconds=self.delays.total) / len(self.delays)
 
     @property
     def getMedianTimeDelay(self) -> timedelta:
         '''
             Computes median delay for all like and reaction event
-            for this user
+            for this user, None if there're less than 2 of them
         '''
-        _buffer = sorted(self.getInBetweenDelays)
+        if not len(self.delays):
+            return None
 
-        if len(_buffer) % 2 == 0:
-            return (_buffer[(len(_buffer) // 2) - 1] + _buffer[len(_buffer) // 2]) / 2
-        else:
-            return _buffer[len(_buffer) // 2]
+        return timedelta(milliseconds=self.delays.median)
 
-    @property
+    @memoized('_reactions')
     def groupByWeek(self) -> Dict[str, List[int]]:
         '''
             Groups all like & reaction events by its
             week of happening where week is specified as
             `Week %W, %Y`
         '''
-        buffer = {}
-
-        for i, j in enumerate(self.reactions):
-            _dt = j.time.date()
-            _week = 'Week {}, {}'.format(
-                int(_dt.strftime('%W'), base=10) + 1,
-                _dt.strftime('%Y'))
-
-            if _week not in buffer:
-                buffer[_week] = [i]
-            else:
-                buffer[_week].append(i)
+        return groupBy(self.buckets.weeks, weekLabel)
 
-        return buffer
-
-    @property
+    @memoized('_reactions')
     def weekToQuarterOfDayAndCount(self) -> Dict[str, Dict[str, int]]:
         '''
             Mapping all likes and reactions into their corresponding week of 
@@ -420,41 +414,8 @@ class Reactions:
             Gives an idea about how you spent your week on facebook ( scrolling, liking, reacting etc. )
             on which quarter you were mostly active/ inactive and how did that change over time.
         '''
-        def mapIntoQuarters(_data: List[int]) -> Dict[str, int]:
-            _mappedIntoQuarters = {}
-
-            _06hr = time(6, 0, 0)
-            _12hr = time(12, 0, 0)
-            _18hr = time(18, 0, 0)
-
-            for i in _data:
-                _tm = self.getReactionByIndex(i).time.time()
-
-                if _tm < _06hr:
-                    _mappedIntoQuarters['00:00 - 05:59'] =\
-                        _mappedIntoQuarters.get('00:00 - 06:00',
-                                                0) + 1
-                elif _tm >= _06hr and _tm < _12hr:
-                    _mappedIntoQuarters['06:00 - 11:59'] =\
-                        _mappedIntoQuarters.get('06:00 - 11:59',
-                                                0) + 1
-                elif _tm >= _12hr and _tm < _18hr:
-                    _mappedIntoQuarters['12:00 - 17:59'] =\
-                        _mappedIntoQuarters.get('12:00 - 17:59',
-                                                0) + 1
-                else:
-                    _mappedIntoQuarters['18:00 - 23:59'] =\
-                        _mappedIntoQuarters.get('18:00 - 23:59',
-                                                0) + 1
-
-            return _mappedIntoQuarters
-
-        _buffer = {}
-
-        for k, v in self.groupByWeek.items():
-            _buffer[k] = mapIntoQuarters(v)
-
-        return _buffer
+        return countBy2D(self.buckets.weeks, self.buckets.quarters,
+                         weekLabel, quarterLabel)
 
 
 if __name__ == '__main__':
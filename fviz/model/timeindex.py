@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Sequence as SequenceType, Union
+from collections.abc import Sequence
+from datetime import datetime
+import numpy as np
+
+
+class TimeIndex:
+    '''
+        Sorted index over timestamps ( in milliseconds ) of records,
+        answering time range queries in O(log n), using binary search
+
+        Records are usually found in chronologically decreasing order
+        in export, in that case no sorting is required & range query
+        resolves to contiguous span of records
+    '''
+
+    def __init__(self, timestamps: np.ndarray):
+        _timestamps = np.asarray(timestamps, dtype=np.int64)
+        _diff = np.diff(_timestamps)
+
+        self._order = None
+        self._reversed = False
+        if (_diff <= 0).all():
+            self._reversed = True
+            self._sorted = _timestamps[::-1]
+        elif (_diff >= 0).all():
+            self._sorted = _timestamps
+        else:
+            self._order = np.argsort(_timestamps, kind='stable')
+            self._sorted = _timestamps[self._order]
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def order(self) -> np.ndarray:
+        '''
+            Indices of records, in chronologically ascending order
+        '''
+        if self._order is not None:
+            return self._order
+        if self._reversed:
+            return np.arange(len(self) - 1, -1, -1)
+
+        return np.arange(len(self))
+
+    def between(self, since: datetime = None, until: datetime = None) -> Union[range, np.ndarray]:
+        '''
+            Indices of records, with timestamp in [since, until),
+            in their original order, where missing bound is
+            considered to be open
+        '''
+        _lo = 0 if since is None else\
+            int(np.searchsorted(self._sorted, int(since.timestamp() * 1000), side='left'))
+        _hi = len(self) if until is None else\
+            int(np.searchsorted(self._sorted, int(until.timestamp() * 1000), side='left'))
+        _hi = max(_lo, _hi)
+
+        if self._order is not None:
+            return np.sort(self._order[_lo:_hi])
+        if self._reversed:
+            return range(len(self) - _hi, len(self) - _lo)
+
+        return range(_lo, _hi)
+
+
+class Window(Sequence):
+    '''
+        Read only view over subset of records ( say, falling in
+        some time window ), which doesn't copy them
+    '''
+
+    def __init__(self, records: SequenceType[Any], indices: Union[range, np.ndarray]):
+        self._records = records
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Any:
+        if isinstance(idx, slice):
+            return Window(self._records, self._indices[idx])
+
+        return self._records[int(self._indices[idx])]
+
+    def __iter__(self):
+        return map(self._records.__getitem__, map(int, self._indices))
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
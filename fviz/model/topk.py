@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
+from heapq import nlargest, nsmallest
+import numpy as np
+from .buckets import firstAppearance
+
+T = TypeVar('T')
+
+
+def topK(items: Iterable[T], k: int, key: Callable[[T], Any]) -> List[T]:
+    '''
+        K largest items by key, in descending order, where earlier
+        item wins on tie ( same as stable descending sort followed
+        by slicing ), in O(n log k)
+    '''
+    return nlargest(k, items, key=key)
+
+
+def bottomK(items: Iterable[T], k: int, key: Callable[[T], Any]) -> List[T]:
+    '''
+        K smallest items by key, in ascending order, where earlier
+        item wins on tie, in O(n log k)
+    '''
+    return nsmallest(k, items, key=key)
+
+
+def topKIndices(counts: np.ndarray, k: int) -> np.ndarray:
+    '''
+        Indices of K largest counts, in descending order of count, where
+        lower index wins on tie, using partial selection in O(n + k log k)
+    '''
+    counts = np.asarray(counts)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k >= len(counts):
+        return np.argsort(-counts, kind='stable')
+
+    _kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+    _above = np.flatnonzero(counts > _kth)
+    _tied = np.flatnonzero(counts == _kth)[:k - len(_above)]
+
+    _idx = np.sort(np.concatenate([_above, _tied]))
+    return _idx[np.argsort(-counts[_idx], kind='stable')]
+
+
+def groupedTopK(groups: np.ndarray, keys: np.ndarray, k: int) -> Dict[int, List[Tuple[int, int]]]:
+    '''
+        For each group, K most frequent keys along with their frequency,
+        in descending order, where key appearing earlier within group wins on tie
+    '''
+    if not len(keys):
+        return {}
+
+    _width = int(keys.max()) + 1
+    _pairs, _counts, _ = firstAppearance(groups * _width + keys)
+    _groups = _pairs // _width
+
+    # by group, then by descending frequency, then by first appearance
+    _order = np.lexsort((np.arange(len(_pairs)), -_counts, _groups))
+    _pairs, _counts, _groups = _pairs[_order], _counts[_order], _groups[_order]
+
+    _starts = np.flatnonzero(np.r_[True, _groups[1:] != _groups[:-1]])
+    _rank = np.arange(len(_pairs)) - np.repeat(_starts, np.diff(np.r_[_starts, len(_pairs)]))
+
+    _buffer = {}
+    for i in np.flatnonzero(_rank < k):
+        _buffer.setdefault(int(_groups[i]), []).append((int(_pairs[i] % _width),
+                                                        int(_counts[i])))
+
+    return _buffer
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
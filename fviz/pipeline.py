@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import get_context, get_all_start_methods
+from multiprocessing.context import BaseContext
+
+
+def processContext() -> BaseContext:
+    '''
+        Context for creating worker process pools, which are created from
+        pipeline's threads, where forking such multi-threaded process may leave
+        child stuck on locks held by other threads, so workers are started
+        from fresh process instead
+    '''
+    return get_context('forkserver' if 'forkserver' in get_all_start_methods() else 'spawn')
+
+
+class Pipeline:
+    '''
+        Directed acyclic graph of named tasks ( data sources, aggregates
+        computed out of them, plots rendered from those ), where each task
+        is given results of tasks it depends on, in order, as arguments
+
+        Tasks can only depend on already added ones, so graph is
+        acyclic by construction
+    '''
+
+    def __init__(self):
+        self._tasks = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tasks
+
+    def add(self, name: str, fn: Callable[..., Any], *deps: str) -> str:
+        if name in self._tasks:
+            raise ValueError('Task `{}` already added'.format(name))
+
+        _unknown = [i for i in deps if i not in self._tasks]
+        if _unknown:
+            raise ValueError('Task `{}` depends on unknown task(s) {}'.format(name, _unknown))
+
+        self._tasks[name] = (fn, deps)
+        return name
+
+    def required(self, targets: List[str]) -> Set[str]:
+        '''
+            Given tasks along with all those, they transitively depend on
+        '''
+        _required = set()
+        _stack = list(targets)
+        while _stack:
+            _name = _stack.pop()
+            if _name not in _required:
+                _required.add(_name)
+                _stack.extend(self._tasks[_name][1])
+
+        return _required
+
+    def run(self, targets: List[str] = None, workers: int = None) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        '''
+            Runs given tasks ( all, by default ) along with those they depend on, each only
+            once, concurrently in a pool of threads, where a task is started as soon as
+            all its dependencies are done
+
+            Returns results of tasks run successfully, along with exceptions
+            raised by failed ones, while tasks depending on a failed one are skipped
+        '''
+        _required = self.required(targets if targets is not None else list(self._tasks))
+        _pending = dict([(i, set(self._tasks[i][1])) for i in _required])
+        _dependents = dict([(i, []) for i in _required])
+        for i in _required:
+            for j in set(self._tasks[i][1]):
+                _dependents[j].append(i)
+
+        _results = {}
+        _errors = {}
+
+        with ThreadPoolExecutor(workers) as _exec:
+            _running = {}
+
+            def _submit(name: str):
+                _fn, _deps = self._tasks[name]
+                _running[_exec.submit(_fn, *[_results[i] for i in _deps])] = name
+
+            def _settle(name: str):
+                '''
+                    Marks task done, starting dependents which got all their
+                    inputs, while skipping those, which lost any of them
+                '''
+                _stack = [name]
+                while _stack:
+                    _done = _stack.pop()
+                    for i in _dependents[_done]:
+                        _pending[i].discard(_done)
+                        if _pending[i]:
+                            continue
+
+                        if all(j in _results for j in self._tasks[i][1]):
+                            _submit(i)
+                        else:
+                            _stack.append(i)
+
+            for i in _required:
+                if not _pending[i]:
+                    _submit(i)
+
+            while _running:
+                _done, _ = wait(_running, return_when=FIRST_COMPLETED)
+                for i in _done:
+                    _name = _running.pop(i)
+                    try:
+                        _results[_name] = i.result()
+                    except Exception as e:
+                        _errors[_name] = e
+
+                    _settle(_name)
+
+        return _results, _errors
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
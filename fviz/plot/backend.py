@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+
+from typing import Any
+from importlib import import_module
+
+
+def _load(name: str) -> Any:
+    '''
+        Imports module of plotting stack, after selecting non-interactive
+        Agg backend, as plots are only ever written to files
+    '''
+    import matplotlib
+    matplotlib.use('Agg')
+
+    return import_module(name)
+
+
+class LazyModule:
+    '''
+        Stands for a module, which gets imported on first attribute access,
+        so that importing plot modules ( and with them `fviz.main` ) doesn't pull
+        in matplotlib & seaborn ( along with pandas, scipy ), until something
+        is actually plotted
+    '''
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str) -> Any:
+        # not yet initialised, say while being copied
+        if attr in ('_name', '_module'):
+            raise AttributeError(attr)
+
+        if self._module is None:
+            self._module = _load(self._name)
+
+        return getattr(self._module, attr)
+
+
+plt = LazyModule('matplotlib.pyplot')
+sns = LazyModule('seaborn')
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -1,24 +1,22 @@
 #!/usr/bin/python3
 
-from ..model.comments import Comments
-import seaborn as sns
-from matplotlib import pyplot as plt
+from typing import List, Tuple
+from .backend import plt, sns
 
 
-def plotTopXPeersWithMostCommentedPostsByUser(data: Comments, title: str, sink: str) -> bool:
+def plotTopXPeersWithMostCommentedPostsByUser(data: List[Tuple[str, int]], title: str, sink: str) -> bool:
     '''
-        Finds out those facebook profiles who are
+        Given those facebook profiles who are
         mostly involved in this person's
-        comment history, and plots them
+        comment history, plots them
         with their name & respective count of involvements
     '''
     if not data:
         return False
 
     try:
-        _topXPeers = data.topXPeersWithMostInvolvementInComments()
-        _x = [i[0] for i in _topXPeers]
-        _y = [i[1] for i in _topXPeers]
+        _x = [i[0] for i in data]
+        _y = [i[1] for i in data]
 
         with plt.style.context("dark_background"):
             fig = plt.Figure(
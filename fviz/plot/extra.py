@@ -1,79 +1,56 @@
 #!/usr/bin/python3
 
 from typing import Dict, Tuple, List
-from copy import deepcopy
-from ..model.reactions import Reactions
-from ..model.comments import Comments
-from ..model.messenger import Messenger
+from ..model.events import EventLog, REACTION, COMMENT, MESSAGE
+from ..model.histogram import Axis, histogram2D
+from ..model.buckets import QUARTERS, weekLabel, quarterLabel
+from ..model.topk import topK
 from math import ceil
-from matplotlib import pyplot as plt
-import seaborn as sns
-from collections import Counter
+from .backend import plt, sns
+from .heatmap import drawHeatMap
+import numpy as np
 
 
-def _mergeWeeklyFacebookActivites(reactions: Reactions, comments: Comments) -> Dict[str, Dict[str, int]]:
-    '''
-        Given seperate weekly likes & reactions activity and
-        comments actvity on Facebook for an user, we can merge them together
-        and generate a common data structure holding all like, reaction, comment
-        based activities for this user
-    '''
-    _buffer = deepcopy(reactions.weekToQuarterOfDayAndCount)
-
-    for k, v in comments.weekToQuarterOfDayAndCount.items():
-        if k not in _buffer:
-            _buffer[k] = v
-        else:
-            _tmp = _buffer[k]
-
-            for _iK, _iV in v.items():
-                _tmp[_iK] = _tmp.get(_iK, 0) + _iV
-
-    return _buffer
-
-
-def _prepareDataForPlottingLikeReactionCommentBasedActivities(data: Dict[str, Dict[str, int]]) -> Tuple[List[List[int]], List[str], List[str]]:
+def prepareDataForPlottingLikeReactionCommentBasedActivities(events: EventLog) -> Tuple[np.ndarray, List[str], List[str]]:
     '''
         For plotting weekly activity ( facebook likes, reactions, comments ) heatmap with
         granularity of quarter of day level, data is prepared here
 
-        We need a 2D array holding actual data to be plotted, tick labels
-        along both X axis and Y axis
+        Likes, reactions & comments are binned together into quarter of day x week
+        count matrix, returned along with week & quarter of day labels, used as
+        tick labels along X axis and Y axis
     '''
-    _x = list(reversed(data.keys()))
-    _y = ['00:00 - 05:59', '06:00 - 11:59', '12:00 - 17:59', '18:00 - 23:59']
+    _mask = events.mask(REACTION, COMMENT)
+    _weeks = events.buckets.weeks[_mask]
+    _quarters = events.buckets.quarters[_mask]
 
-    _buffer = [[] for i in range(len(_y))]
+    _x = Axis.distinct(_weeks, weekLabel)
+    _y = Axis.span(0, len(QUARTERS) - 1, quarterLabel)
 
-    for k in _x:
-        _v = data[k]
+    return histogram2D(_quarters, _y, _weeks, _x), _x.labels(), _y.labels()
 
-        for i, j in enumerate(_y):
-            _buffer[i].append(_v.get(j, 0))
 
-    return _buffer, _x, _y
-
-
-def plotWeeklyHeatMapWithLikesReactionsComments(reactions: Reactions, comments: Comments, title: str, sink: str) -> bool:
+def plotWeeklyHeatMapWithLikesReactionsComments(data: Tuple[np.ndarray, List[str], List[str]], title: str, sink: str, raster: bool = False) -> bool:
     '''
-        Plotting weekly facebook activity data ( likes, reactions, comments )
-        as heatmap, where along X axis active week identifiers are plotted
+        Plotting weekly facebook activity data ( likes, reactions, comments, see
+        `prepareDataForPlottingLikeReactionCommentBasedActivities` ) as heatmap, where along X axis active week identifiers are plotted
         and along Y axis quarters of a day are kept. Cells hold visual
         information on how to interpret which quarter was mostly eventful
         in a certain week.
+
+        With `raster` set, cells are drawn as rasterized image ( see `drawHeatMap` )
     '''
     def _stripData(_frm: int, _to: int):
         '''
             Stripping subset of data from large 2D dataset
             and tick labels along X axis, given start and end index
         '''
-        return [i[_frm: _to] for i in _data], _x[_frm: _to]
+        return _data[:, _frm: _to], _x[_frm: _to]
 
     try:
-        _data, _x, _y = _prepareDataForPlottingLikeReactionCommentBasedActivities(
-            _mergeWeeklyFacebookActivites(reactions, comments))
+        _data, _x, _y = data
 
-        if not (_data and _x and _y):
+        if not (_data.size and len(_x) and len(_y)):
             raise Exception('Unable to prepare data !')
 
         _frm = 0
@@ -84,16 +61,19 @@ def plotWeeklyHeatMapWithLikesReactionsComments(reactions: Reactions, comments:
             1,
             figsize=(185, 4 * (ceil(len(_x) / 52) + 16)),
             dpi=100)
+        if len(_x) <= 52:
+            _axes = [_axes]
 
         for i in _axes:
 
             _tmpData, _tmpX = _stripData(_frm, _to)
 
-            sns.heatmap(
+            drawHeatMap(
                 _tmpData,
+                i,
                 cmap='PuBu',
                 lw=1.0,
-                ax=i)
+                raster=raster)
 
             i.set_xticklabels(
                 _tmpX,
@@ -128,54 +108,39 @@ def plotWeeklyHeatMapWithLikesReactionsComments(reactions: Reactions, comments:
         return False
 
 
-def _mergeAllFacebookPeerActivityCount(reactions: Reactions, comments: Comments, messenger: Messenger, exclude: List[str]) -> Dict[str, int]:
+def _mergeAllFacebookPeerActivityCount(events: EventLog, exclude: List[str]) -> Dict[str, int]:
     '''
         For each of like, reaction, comment & messaging - facebook activities,
         we'll accumuate #-of times this account owner has interacted with
         some other facebook profile & return that as an associative array.
     '''
-    _buffer = {}
-
-    for i in [reactions.peerToReactionCount, comments.peerToCommentCount, messenger.peerToMessageCount]:
-        for k, v in i.items():
-            if k in exclude:
-                continue
+    return events.peerCounts((REACTION, COMMENT, MESSAGE), exclude)
 
-            _buffer[k] = _buffer.get(k, 0) + v
 
-    return _buffer
-
-
-def _topXHighlyInteractedFacebookPeers(reactions: Reactions, comments: Comments, messenger: Messenger, exclude: List[str], x: int) -> List[Tuple[str, int]]:
+def topXHighlyInteractedFacebookPeers(events: EventLog, exclude: List[str], x: int) -> List[Tuple[str, int]]:
     '''
         Get top X highly interacted facebook profiles, in terms of likes, reactions, comments, chatting
     '''
-    return Counter(_mergeAllFacebookPeerActivityCount(reactions,
-                                                      comments,
-                                                      messenger,
-                                                      exclude)).most_common(x)
+    return topK(_mergeAllFacebookPeerActivityCount(events, exclude).items(),
+                x, key=lambda e: e[1])
 
 
-def plotTopXHighlyInteractedFacebookPeers(reactions: Reactions, comments: Comments, messenger: Messenger, exclude: List[str], x: int, title: str, sink: str) -> bool:
+def plotTopXHighlyInteractedFacebookPeers(data: List[Tuple[str, int]], title: str, sink: str) -> bool:
     '''
-        Given all data extracted from facebook activities of a certain person
-        under inspection ( i.e. whose profile being analysed ), it'll first calculate
-        how many number of times each profile was interacted with ( finally we'll exclude `self` interactions ),
-        which is then used for computing top X most interacted profiles ( may be personal account/ page etc. ),
-        which is plotted in form of a nice bar plot
+        Given top X most interacted profiles ( may be personal account/ page etc. ), computed
+        from all facebook activities of a certain person under inspection ( i.e. whose profile
+        being analysed, see `topXHighlyInteractedFacebookPeers` ), along with how many number of times
+        each of them was interacted with, plots them in form of a nice bar plot
     '''
-    if not (reactions and comments and messenger):
+    if not data:
         return False
 
     try:
-        _data = _topXHighlyInteractedFacebookPeers(reactions, comments,
-                                                   messenger, exclude, x)
-
         sns.set(style='darkgrid')
         fig = plt.Figure(figsize=(16, 9), dpi=100)
 
-        sns.barplot(x=list(map(lambda e: e[1], _data)),
-                    y=list(map(lambda e: e[0], _data)),
+        sns.barplot(x=list(map(lambda e: e[1], data)),
+                    y=list(map(lambda e: e[0], data)),
                     orient='h', ax=fig.gca(), palette='Blues_d')
 
         fig.gca().set_xlabel('#-of times interacted with')
@@ -3,18 +3,18 @@
 from ..model.friends import Friends
 from typing import Tuple, List
 from datetime import timedelta
-import seaborn as sns
-from matplotlib import pyplot as plt
+from .backend import plt, sns
 from math import ceil
 
 
-def _prepareDataForPlottingMonthlyFriendsCreated(friends: Friends) -> Tuple[List[str], List[int]]:
+def prepareDataForPlottingMonthlyFriendsCreated(friends: Friends) -> Tuple[List[str], List[int]]:
     '''
         Prepares data to be plotted along X & 
-        Y axis for #-of friends created monthly
+        Y axis for #-of friends created monthly, None
+        if there's no friend ( say, in given time window )
     '''
-    if not friends:
-        return None, None
+    if not (friends and friends.count):
+        return None
 
     _start, _end = friends.getTimeFrame
     _x = []
@@ -30,18 +30,18 @@ def _prepareDataForPlottingMonthlyFriendsCreated(friends: Friends) -> Tuple[List
     return _x, _y
 
 
-def plotMonthlyFriendsCreated(friends: Friends, title: str, sink: str) -> bool:
+def plotMonthlyFriendsCreated(data: Tuple[List[str], List[int]], title: str, sink: str) -> bool:
     '''
-        Given friends created and when created data, plots them as
-        friends created per month in form of a line plot, seperating 
+        Given friends created and when created data ( see `prepareDataForPlottingMonthlyFriendsCreated` ),
+        plots them as friends created per month in form of a line plot, seperating
         each year into different axes
     '''
-    if not friends:
+    if not data:
         return False
 
     try:
 
-        _x, _y = _prepareDataForPlottingMonthlyFriendsCreated(friends)
+        _x, _y = data
 
         with plt.style.context("dark_background"):
             _fig, _axes = plt.subplots(
@@ -50,6 +50,8 @@ def plotMonthlyFriendsCreated(friends: Friends, title: str, sink: str) -> bool:
                 figsize=(40, ceil(len(_x)/12) * 10),
                 dpi=100
             )
+            if len(_x) <= 12:
+                _axes = [_axes]
 
             _start = 0
             _end = 12
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+
+from typing import Any
+import numpy as np
+from .backend import sns
+
+
+def drawHeatMap(data: np.ndarray, ax: Any, cmap: str, lw: float, raster: bool = False):
+    '''
+        Draws count matrix as heatmap on given axes, along with colorbar,
+        where first row is kept on top & a tick is placed at center of each cell
+
+        By default each cell is drawn as a vector rectangle ( by seaborn ), so that
+        size of vector output & rendering time grow with #-of cells. With `raster` set,
+        all cells are drawn as single mesh, which gets embedded as an image even
+        in vector output, whose cost depends only on image resolution
+    '''
+    if not raster:
+        sns.heatmap(data, cmap=cmap, lw=lw, ax=ax)
+        return
+
+    _rows, _columns = data.shape
+    _mesh = ax.pcolormesh(data,
+                          cmap=cmap,
+                          edgecolors='white',
+                          linewidth=lw,
+                          rasterized=True)
+    ax.figure.colorbar(_mesh, ax=ax)
+
+    ax.set_xlim(0, _columns)
+    ax.set_ylim(_rows, 0)
+    ax.set_xticks(np.arange(_columns) + .5)
+    ax.set_yticks(np.arange(_rows) + .5)
+    for i in ax.spines.values():
+        i.set_visible(False)
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -1,8 +1,7 @@
 #!/usr/bin/python3
 
 from typing import List, Tuple, Dict
-from matplotlib import pyplot as plt
-import seaborn as sns
+from .backend import plt, sns
 from ..model.messenger import Messenger
 from itertools import chain
 from math import ceil
@@ -50,7 +49,7 @@ def plotTopXBusyChats(data: List[Tuple[str, int]], title: str, sink: str) -> boo
         return False
 
 
-def _prepareDataForTopXPrivateChatsWithHighestContributonFromYou(messenger: Messenger, x: int, participant: str) -> Tuple[List[str], List[float], List[str], List[str]]:
+def prepareDataForTopXPrivateChatsWithHighestContributonFromYou(messenger: Messenger, x: int, participant: str) -> Tuple[List[str], List[float], List[str], List[str]]:
     '''
         Preparing data to be plotted as grouped bar plot, for top X private
         chats, where you've high participation
@@ -69,21 +68,19 @@ def _prepareDataForTopXPrivateChatsWithHighestContributonFromYou(messenger: Mess
     return _x, _y, _hue, _names
 
 
-def plotTopXPrivateChatsWithHighestContributonFromYou(messenger: Messenger, x: int, participant: str, title: str, sink: str) -> bool:
+def plotTopXPrivateChatsWithHighestContributonFromYou(data: Tuple[List[str], List[float], List[str], List[str]], title: str, sink: str) -> bool:
     '''
         Plotting top X private chats, where this user is having highest contribution,
-        in terms of # -of messages transacted, as grouped bar plot, where each pair of labels
+        in terms of # -of messages transacted ( see `prepareDataForTopXPrivateChatsWithHighestContributonFromYou` ),
+        as grouped bar plot, where each pair of labels
         along X axis denote a chat happened between them, where left one is this facebook user, and
         other one is his/ her chat peer.
     '''
-    if not messenger:
+    if not data:
         return False
 
     try:
-        _x, _y, _hue, _names = _prepareDataForTopXPrivateChatsWithHighestContributonFromYou(
-            messenger,
-            x,
-            participant)
+        _x, _y, _hue, _names = data
 
         with plt.style.context('dark_background'):
             fig = plt.Figure(
@@ -99,7 +96,7 @@ def plotTopXPrivateChatsWithHighestContributonFromYou(messenger: Messenger, x: i
 
             _names = list(
                 chain.from_iterable(
-                    zip(*[_names[i:i+2] for i in range(0, x * 2, 2)])))
+                    zip(*[_names[i:i+2] for i in range(0, len(_names), 2)])))
 
             for j, k in enumerate(fig.gca().patches):
                 fig.gca().text(k.get_x() + k.get_width() / 2,
@@ -130,7 +127,7 @@ def plotTopXPrivateChatsWithHighestContributonFromYou(messenger: Messenger, x: i
         return False
 
 
-def _prepareDataForChatThreadsWithLowestContributonFromYou(messenger: Messenger, x: int, participant: str) -> Tuple[List[str], List[float], List[str], List[str]]:
+def prepareDataForChatThreadsWithLowestContributonFromYou(messenger: Messenger, x: int, participant: str) -> Tuple[List[str], List[float], List[str], List[str]]:
     '''
         Preparing data to be plotted as grouped bar plot, 
         for private facebook chat threads where you've lowest contribution
@@ -149,21 +146,19 @@ def _prepareDataForChatThreadsWithLowestContributonFromYou(messenger: Messenger,
     return _x, _y, _hue, _names
 
 
-def plotPrivateChatThreadsWithLowestContributonFromYou(messenger: Messenger, x: int, participant: str, title: str, sink: str) -> bool:
+def plotPrivateChatThreadsWithLowestContributonFromYou(data: Tuple[List[str], List[float], List[str], List[str]], title: str, sink: str) -> bool:
     '''
         Plotting private facebook chat threads, where this user is having lowest contribution,
-        in terms of # -of messages transacted, as grouped bar plot, where each pair of labels
+        in terms of # -of messages transacted ( see `prepareDataForChatThreadsWithLowestContributonFromYou` ),
+        as grouped bar plot, where each pair of labels
         along X axis denote a chat happened between them, where left one is this facebook user, and
         other one is his/ her chat peer.
     '''
-    if not messenger:
+    if not data:
         return False
 
     try:
-        _x, _y, _hue, _names = _prepareDataForChatThreadsWithLowestContributonFromYou(
-            messenger,
-            x,
-            participant)
+        _x, _y, _hue, _names = data
 
         with plt.style.context('dark_background'):
             fig = plt.Figure(
@@ -179,7 +174,7 @@ def plotPrivateChatThreadsWithLowestContributonFromYou(messenger: Messenger, x:
 
             _names = list(
                 chain.from_iterable(
-                    zip(*[_names[i:i+2] for i in range(0, x * 2, 2)])))
+                    zip(*[_names[i:i+2] for i in range(0, len(_names), 2)])))
 
             for j, k in enumerate(fig.gca().patches):
                 fig.gca().text(k.get_x() + k.get_width() / 2,
@@ -210,7 +205,7 @@ def plotPrivateChatThreadsWithLowestContributonFromYou(messenger: Messenger, x:
         return False
 
 
-def _prepareDataForTopChatThreadEachWeek(messenger: Messenger) -> Tuple[List[str], List[float], List[str], List[str]]:
+def prepareDataForTopChatThreadEachWeek(messenger: Messenger) -> Tuple[List[str], List[float], List[str], List[str]]:
     '''
         Prepares data for plotting grouped bar chat, for weekly
         top private chat thread.
@@ -252,17 +247,17 @@ def _prepareDataForTopChatThreadEachWeek(messenger: Messenger) -> Tuple[List[str
     return _x, _y, _hue, _names
 
 
-def plotTopChatThreadEachWeek(messenger: Messenger, title: str, sink: str) -> bool:
+def plotTopChatThreadEachWeek(data: Tuple[List[str], List[float], List[str], List[str]], title: str, sink: str) -> bool:
     '''
         Plotting top facebook private chat thread on each week
-        when this user was active. This is plotted as a grouped
-        bar chart.
+        when this user was active ( see `prepareDataForTopChatThreadEachWeek` ).
+        This is plotted as a grouped bar chart.
     '''
-    if not messenger:
+    if not data:
         return False
 
     try:
-        _x, _y, _hue, _names = _prepareDataForTopChatThreadEachWeek(messenger)
+        _x, _y, _hue, _names = data
 
         sns.set(style='darkgrid')
         _fig, _axes = plt.subplots(
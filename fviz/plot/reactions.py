@@ -1,14 +1,19 @@
 #!/usr/bin/python3
 
 from typing import Dict, List, Tuple
-from matplotlib import pyplot as plt
-import seaborn as sns
+from .backend import plt, sns
+from .heatmap import drawHeatMap
+import numpy as np
 from ..model.reactions import Reactions
-from datetime import date, timedelta, time, datetime
+from ..model.histogram import Axis, histogram2D
+from ..model.buckets import dayLabel, weekLabel, monthLabel, weekSpan
+from ..model.topk import groupedTopK
+from datetime import timedelta, datetime, date
 from math import ceil
-from collections import Counter
 from itertools import chain
 
+_WEEKDAYS = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
 
 def plotReactionCount(data: Dict[str, int], title: str, sink: str) -> bool:
     '''
@@ -62,50 +67,42 @@ def plotPeerToReactionCount(data: Dict[str, int], title: str, sink: str) -> bool
         return False
 
 
-def _prepareHeatMapData(reactions: Reactions) -> Tuple[List[List[int]], List[date], List[str]]:
+def prepareHeatMapData(reactions: Reactions) -> Tuple[np.ndarray, List[date], List[str]]:
     '''
         Generates heatmap data, depicting user activity on facebook over whole period of time
         i.e. on which date he/ she put which reaction on a facebook post how many number of times
-    '''
-    _dates = []
-
-    _start, _end = [i.date() for i in reactions.getTimeFrame]
-    while _start <= _end:
-        _dates.append(_start)
-        _start += timedelta(hours=24)
 
-    _reactionTypes = sorted(list(reactions.reactionTypes))
-    _groupedByDate = reactions.dateToReactionTypeAndCount
-
-    buffer = [[] for i in _reactionTypes]
-
-    for i, k in enumerate(_reactionTypes):
-        _tmp = buffer[i]
+        Returns reaction type x date count matrix, along with date & reaction type labels
+    '''
+    _days = reactions.buckets.days
+    _codes, _names = reactions.reactionCodes
 
-        for j in _dates:
-            _tmp.append(_groupedByDate.get(j, {}).get(k, 0))
+    _dates = Axis.span(_days.min(), _days.max(), dayLabel)
+    _reactionTypes = Axis.span(0, len(_names) - 1, lambda e: _names[e])
 
-    return buffer, _dates, _reactionTypes
+    return histogram2D(_codes, _reactionTypes, _days, _dates), _dates.labels(), _reactionTypes.labels()
 
 
-def plotReactionsOverTimeAsHeatMap(data: Reactions, title: str, sink: str) -> bool:
+def plotReactionsOverTimeAsHeatMap(data: Tuple[np.ndarray, List[date], List[str]], title: str, sink: str, raster: bool = False) -> bool:
     '''
         Plots user activity as heatmap showing all reactions
-        given by user on facebook posts over time. Each 365 day
-        time span is plotted in its own figure - generating a new image.
+        given by user on facebook posts over time ( see `prepareHeatMapData` ).
+        Each 365 day time span is plotted in its own figure - generating a new image.
+
+        With `raster` set, cells are drawn as rasterized image ( see `drawHeatMap` )
     '''
     def _stripData(_frm: int, _to: int):
         '''
             Stripping subset of data from large 2D dataset
             given start and end index
         '''
-        return [i[_frm: _to] for i in _buffer], _dates[_frm: _to]
+        return _buffer[:, _frm: _to], _dates[_frm: _to]
 
     if not data:
         return False
 
     try:
-        _buffer, _dates, _reactionTypes = _prepareHeatMapData(data)
+        _buffer, _dates, _reactionTypes = data
         _start = 0
         _end = 365
 
@@ -115,11 +112,12 @@ def plotReactionsOverTimeAsHeatMap(data: Reactions, title: str, sink: str) -> bo
 
             _tmpBuffer, _tmpDates = _stripData(_start, _end)
 
-            sns.heatmap(
+            drawHeatMap(
                 _tmpBuffer,
+                fig.gca(),
                 cmap='YlGnBu',
                 lw=.75,
-                ax=fig.gca())
+                raster=raster)
 
             fig.gca().set_xticklabels(
                 [k.strftime('%d %b, %Y') for k in _tmpDates],
@@ -153,64 +151,48 @@ def plotReactionsOverTimeAsHeatMap(data: Reactions, title: str, sink: str) -> bo
         return False
 
 
-def _prepareWeeklyReactionHeatMapData(reactions: Reactions) -> Tuple[List[List[int]], List[str], List[str]]:
+def prepareWeeklyReactionHeatMapData(reactions: Reactions) -> Tuple[np.ndarray, List[str], List[str]]:
     '''
         Groups reactions by their week of happening and builds a 2D array
         holding information on which weekday of which week of which year
         how many reactions were recorded ( tries to capture all reaction type
         activities on facebook )
 
-        Along with that also returns a list of possible week names
-        spanning across time frame of dataset, which is going to be
-        used as ticklabels of X axis.
+        Along with that also returns labels of all weeks
+        spanning across time frame of dataset, which are
+        going to be used as ticklabels of X axis.
 
         For Y axis ticklabels, we'll be using week day names i.e. Sunday, Monday etc.
     '''
-    _weeks = []
-    _start, _end = [i.date() for i in reactions.getTimeFrame]
+    _buckets = reactions.buckets
 
-    while _start <= _end:
-        _weeks.append('Week {}, {}'.format(
-            int(_start.strftime('%W'),
-                base=10) + 1,
-            _start.strftime('%Y')))
-        _start += timedelta(days=7)
-
-    if 'Week {}, {}'.format(int(_end.strftime('%W'), base=10) + 1, _end.strftime('%Y')) not in _weeks:
-        _weeks.append('Week {}, {}'.format(
-            int(_end.strftime('%W'), base=10) + 1, _end.strftime('%Y')))
-
-    _groupedByWeek = reactions.weekToWeekDayAndReactionCount
-    _buffer = [[] for i in range(7)]
-
-    for i in range(7):
-        _tmp = _buffer[i]
+    _weeks = Axis(weekSpan(_buckets.days.min(), _buckets.days.max()), weekLabel)
+    _weekDays = Axis.span(0, 6, lambda e: _WEEKDAYS[e])
 
-        for j in _weeks:
-            _tmp.append(_groupedByWeek.get(j, {}).get(i, 0))
+    return histogram2D(_buckets.weekDays, _weekDays, _buckets.weeks, _weeks), _weeks.labels(), _weekDays.labels()
 
-    return _buffer, _weeks, ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
 
-
-def plotWeeklyReactionHeatMap(data: Reactions, title: str, sink: str) -> bool:
+def plotWeeklyReactionHeatMap(data: Tuple[np.ndarray, List[str], List[str]], title: str, sink: str, raster: bool = False) -> bool:
     '''
-        Plotting like(s) and reaction(s) on facebook data as github style
-        activity heatmap, where along Y-axis we keep week day names
+        Plotting like(s) and reaction(s) on facebook data ( see `prepareWeeklyReactionHeatMapData` )
+        as github style activity heatmap, where along Y-axis we keep week day names
         and along X-axis we keep week identifiers. And in cells we put accumulated
         reaction count that day of that week, considering all reaction types.
+
+        With `raster` set, cells are drawn as rasterized image ( see `drawHeatMap` )
     '''
-    def _stripData(_frm: int, _to: int) -> Tuple[List[List[int]], List[str]]:
+    def _stripData(_frm: int, _to: int) -> Tuple[np.ndarray, List[str]]:
         '''
             Stripping subset of data from large 2D dataset
             given start and end index
         '''
-        return [i[_frm: _to] for i in _buffer], _weeks[_frm: _to]
+        return _buffer[:, _frm: _to], _weeks[_frm: _to]
 
     if not data:
         return False
 
     try:
-        _buffer, _weeks, _weekDays = _prepareWeeklyReactionHeatMapData(data)
+        _buffer, _weeks, _weekDays = data
         _start = 0
         _end = 52
 
@@ -219,16 +201,19 @@ def plotWeeklyReactionHeatMap(data: Reactions, title: str, sink: str) -> bool:
             1,
             figsize=(60, 4 * (ceil(len(_weeks) / 52) + 15)),
             dpi=100)
+        if len(_weeks) <= 52:
+            _axes = [_axes]
 
         for i in _axes:
 
             _tmpBuffer, _tmpWeeks = _stripData(_start, _end)
 
-            sns.heatmap(
+            drawHeatMap(
                 _tmpBuffer,
+                i,
                 cmap='YlGnBu',
                 lw=.75,
-                ax=i)
+                raster=raster)
 
             i.set_xticklabels(
                 _tmpWeeks,
@@ -268,18 +253,17 @@ def _getTopXPeersGroupedByMonth(reactions: Reactions,
         liked/ reacted by this actor ) with corresponding
         like and reaction count for each month
     '''
+    _codes, _names = reactions.peerCodes
+    _valid = _codes >= 0
 
-    def _worker(_month: str):
-        return Counter(filter(
-            lambda e: e,
-            [reactions.getReactionByIndex(i).peer for i in groupedByMonth[_month]])).most_common(x)
+    _top = dict([(monthLabel(k), [(_names[i], j) for i, j in v])
+                 for k, v in groupedTopK(reactions.buckets.months[_valid], _codes[_valid], x).items()])
 
-    groupedByMonth = reactions.groupByMonth
-    return dict([(k, _worker(k)) for k in groupedByMonth.keys()])
+    return dict([(k, _top.get(k, [])) for k in reactions.groupByMonth.keys()])
 
 
-def _prepareDataForPlottingGroupedBarChartWithTopXPeers(reactions: Reactions,
-                                                        x: int = 3) -> Tuple[List[str], List[int], List[str], List[str]]:
+def prepareDataForPlottingGroupedBarChartWithTopXPeers(reactions: Reactions,
+                                                       x: int = 3) -> Tuple[List[str], List[int], List[str], List[str]]:
     '''
         Preparing data piece by piece for plotting grouped bar chart
         showing top X profiles whose posts were mostly liked and
@@ -307,18 +291,17 @@ def _prepareDataForPlottingGroupedBarChartWithTopXPeers(reactions: Reactions,
     return _x, _y, _hue, _names
 
 
-def plotTopXPeersByMonth(data: Reactions, title: str, sink: str) -> bool:
+def plotTopXPeersByMonth(data: Tuple[List[str], List[int], List[str], List[str]], title: str, sink: str) -> bool:
     '''
         Plotting top X profiles whose posts were mostly liked and reacted by
         this actor over time frame of this data set, per month basis. Here for simplicity
-        keeping X=3.
+        keeping X=3 ( see `prepareDataForPlottingGroupedBarChartWithTopXPeers` ).
     '''
     if not data:
         return False
 
     try:
-        _x, _y, _hue, _names = _prepareDataForPlottingGroupedBarChartWithTopXPeers(
-            data, x=3)
+        _x, _y, _hue, _names = data
 
         sns.set(style='darkgrid')
         _fig, _axes = plt.subplots(
@@ -326,6 +309,8 @@ def plotTopXPeersByMonth(data: Reactions, title: str, sink: str) -> bool:
             1,
             figsize=(18, 36),
             dpi=100)
+        if len(_x) <= 36:
+            _axes = [_axes]
 
         _start = 0
         _end = 36
@@ -372,7 +357,7 @@ def plotTopXPeersByMonth(data: Reactions, title: str, sink: str) -> bool:
         return False
 
 
-def _prepareDataForPlottingLinePlot(reactions: Reactions) -> Tuple[List[str], List[int]]:
+def prepareDataForPlottingLinePlot(reactions: Reactions) -> Tuple[List[str], List[int]]:
     '''
         Preparing data for plotting line plot showing user activity in minute of day over whole
         time frame of dataset. Returns 1440 element lengthy two data sets, one for plotting across
@@ -395,16 +380,16 @@ def _prepareDataForPlottingLinePlot(reactions: Reactions) -> Tuple[List[str], Li
     return _x, _y
 
 
-def plotAccumulatedUserActivityInEachMinuteOfDay(data: Reactions, title: str, sink: str) -> bool:
+def plotAccumulatedUserActivityInEachMinuteOfDay(data: Tuple[List[str], List[int]], title: str, sink: str) -> bool:
     '''
-        Maps all likes and reactions onto 24 hr span i.e. 1440 minutes of a day
-        and keeps count of them, which is plotted as a line plot
+        Given all likes and reactions mapped onto 24 hr span i.e. 1440 minutes of a day
+        ( see `prepareDataForPlottingLinePlot` ), plots their count as a line plot
     '''
     if not data:
         return False
 
     try:
-        _x, _y = _prepareDataForPlottingLinePlot(data)
+        _x, _y = data
 
         sns.set(style='darkgrid')
 
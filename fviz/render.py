@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+
+from typing import Any, Callable
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from os import cpu_count
+from .pipeline import processContext
+
+
+def _initWorker():
+    '''
+        Rendering workers draw on non-interactive canvas only, starting
+        with same style, irrespective of which plots ran earlier in same worker
+    '''
+    import matplotlib
+    matplotlib.use('Agg')
+
+    import seaborn as sns
+    sns.set(style='darkgrid')
+
+
+class Renderer:
+    '''
+        Renders plots, given their prepared data, in a pool of worker processes,
+        so that only plot data crosses process boundary, never models
+
+        Can be asked to render from several threads at once, where with
+        single worker, plots are rendered in calling process, one at a time,
+        after setting it up same way as worker processes
+    '''
+
+    def __init__(self, workers: int = None):
+        self.workers = workers or cpu_count() or 1
+        self._exec = None
+        self._lock = Lock()
+        self._ready = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._exec:
+            self._exec.shutdown()
+            self._exec = None
+
+    @property
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if not self._exec:
+                self._exec = ProcessPoolExecutor(self.workers,
+                                                 mp_context=processContext(),
+                                                 initializer=_initWorker)
+
+            return self._exec
+
+    def render(self, plot: Callable[..., bool], data: Any, *args: Any) -> bool:
+        '''
+            Renders plot, passing it prepared data along with rest
+            of arguments ( usually title & sink ), returning its success
+        '''
+        if self.workers == 1:
+            # pyplot isn't thread safe
+            with self._lock:
+                if not self._ready:
+                    _initWorker()
+                    self._ready = True
+
+                return plot(data, *args)
+
+        return bool(self._pool.submit(plot, data, *args).result())
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import List, Any, IO, Tuple
+from abc import ABC, abstractmethod
+from os import walk, stat
+from os.path import exists, join, abspath, relpath, getsize
+from io import TextIOWrapper
+from zipfile import ZipFile
+from fnmatch import fnmatch
+from json import load
+
+
+class Source(ABC):
+    '''
+        Read only view over an exported facebook data set,
+        where each data file is addressed by its member name
+        i.e. path relative to root of export ( `friends/friends.json` )
+    '''
+
+    @abstractmethod
+    def exists(self, member: str) -> bool:
+        pass
+
+    @abstractmethod
+    def open(self, member: str) -> IO[str]:
+        pass
+
+    @abstractmethod
+    def size(self, member: str) -> int:
+        '''
+            Uncompressed size of member in bytes
+        '''
+
+    @abstractmethod
+    def signature(self, member: str) -> Tuple[int, int]:
+        '''
+            Cheaply computable identity of member's content, which
+            changes when content changes
+        '''
+
+    @abstractmethod
+    def members(self, pattern: str = '*') -> List[str]:
+        pass
+
+    def load(self, member: str) -> Any:
+        '''
+            Parses JSON content of member, returning None
+            if member isn't present in this source
+        '''
+        if not self.exists(member):
+            return None
+
+        with self.open(member) as fd:
+            return load(fd)
+
+
+class DirSource(Source):
+    '''
+        Export already extracted into a directory, which
+        is the way fviz used to consume it
+
+        Absolute member names are honoured as is, so
+        that plain file paths keep working
+    '''
+
+    def __init__(self, root: str = ''):
+        self.root = root
+
+    def _path(self, member: str) -> str:
+        return join(self.root, member)
+
+    def exists(self, member: str) -> bool:
+        return exists(self._path(member))
+
+    def open(self, member: str) -> IO[str]:
+        return open(self._path(member), mode='r')
+
+    def size(self, member: str) -> int:
+        return getsize(self._path(member))
+
+    def signature(self, member: str) -> Tuple[int, int]:
+        _stat = stat(self._path(member))
+        return _stat.st_mtime_ns, _stat.st_size
+
+    def members(self, pattern: str = '*') -> List[str]:
+        _root = abspath(self.root or '.')
+        _buffer = []
+
+        for root, _, files in walk(_root):
+            for i in files:
+                _member = relpath(join(root, i), _root).replace('\\', '/')
+                if fnmatch(_member, pattern):
+                    _buffer.append(_member)
+
+        return _buffer
+
+
+class ZipSource(Source):
+    '''
+        Export read straight out of downloaded zip archive,
+        members are decompressed on demand & nothing gets written
+        to disk
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zf = None
+
+    @property
+    def zipFile(self) -> ZipFile:
+        if not self._zf:
+            self._zf = ZipFile(self.path)
+
+        return self._zf
+
+    def exists(self, member: str) -> bool:
+        try:
+            self.zipFile.getinfo(member)
+            return True
+        except KeyError:
+            return False
+
+    def open(self, member: str) -> IO[str]:
+        return TextIOWrapper(self.zipFile.open(member, mode='r'),
+                             encoding='utf-8')
+
+    def size(self, member: str) -> int:
+        return self.zipFile.getinfo(member).file_size
+
+    def signature(self, member: str) -> Tuple[int, int]:
+        _info = self.zipFile.getinfo(member)
+        return _info.CRC, _info.file_size
+
+    def members(self, pattern: str = '*') -> List[str]:
+        return [i for i in self.zipFile.namelist()
+                if not i.endswith('/') and fnmatch(i, pattern)]
+
+    def __getstate__(self):
+        # opened archive handle can't cross process boundaries
+        return {'path': self.path, '_zf': None}
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
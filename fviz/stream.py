@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+
+from typing import Any, Callable, Dict, IO
+from json import JSONDecoder, JSONDecodeError
+from re import compile as regCompile
+
+_decoder = JSONDecoder()
+_whitespace = regCompile(r'[ \t\n\r]*')
+# characters, a JSON number may still continue with
+_numberTail = regCompile(r'[0-9.eE+\-]*')
+
+
+class _Reader:
+    '''
+        Buffered reader over a JSON text stream, which
+        decodes one value at a time, pulling in more chunks
+        from underlying stream only when required
+    '''
+
+    def __init__(self, fd: IO[str], chunkSize: int):
+        self._fd = fd
+        self._chunkSize = chunkSize
+        self._buf = ''
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        '''
+            Appends next chunk to buffer, while dropping
+            already consumed part, returns False on end of stream
+        '''
+        _chunk = self._fd.read(self._chunkSize)
+        if not _chunk:
+            return False
+
+        self._buf = self._buf[self._pos:] + _chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        '''
+            Next non-whitespace character, without consuming it
+        '''
+        while True:
+            self._pos = _whitespace.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON stream')
+
+    def take(self) -> str:
+        _char = self.peek()
+        self._pos += 1
+        return _char
+
+    def expect(self, char: str):
+        if self.take() != char:
+            raise ValueError('Expected `{}` in JSON stream'.format(char))
+
+    def value(self) -> Any:
+        '''
+            Decodes next complete JSON value
+        '''
+        self.peek()
+
+        while True:
+            try:
+                _obj, _end = _decoder.raw_decode(self._buf, self._pos)
+                # a scalar ending at buffer end, or followed only by what
+                # may still be part of a number ( say `1.` of `1.0` ), may
+                # be cut short, so it's decoded again after refilling
+                if _numberTail.match(self._buf, _end).end() < len(self._buf) or not self._fill():
+                    self._pos = _end
+                    return _obj
+            except JSONDecodeError:
+                if not self._fill():
+                    raise
+
+
+def streamObject(fd: IO[str], handlers: Dict[str, Callable[[Any], None]], chunkSize: int = 1 << 16) -> Dict[str, Any]:
+    '''
+        Incrementally parses a JSON object from given text stream
+
+        For keys having a handler, if value is an array, each of its
+        elements is decoded & passed to handler one by one, without ever
+        holding whole array in memory. All other keys are decoded
+        as usual & returned as a dictionary.
+    '''
+    _reader = _Reader(fd, chunkSize)
+    _buffer = {}
+
+    _reader.expect('{')
+    if _reader.peek() == '}':
+        _reader.take()
+        return _buffer
+
+    while True:
+        _key = _reader.value()
+        _reader.expect(':')
+
+        if _key in handlers and _reader.peek() == '[':
+            _reader.take()
+
+            if _reader.peek() == ']':
+                _reader.take()
+            else:
+                while True:
+                    handlers[_key](_reader.value())
+
+                    _char = _reader.take()
+                    if _char == ']':
+                        break
+                    if _char != ',':
+                        raise ValueError('Malformed array in JSON stream')
+        else:
+            _buffer[_key] = _reader.value()
+
+        _char = _reader.take()
+        if _char == '}':
+            break
+        if _char != ',':
+            raise ValueError('Malformed object in JSON stream')
+
+    return _buffer
+
+
+if __name__ == '__main__':
+    print('It\'s not supposed to be used this way !')
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+
+from datetime import datetime
+import numpy as np
+from fviz.model.buckets import TimeBuckets, weekSpan, dayLabel, weekLabel, monthLabel, minuteLabel
+
+
+def _timestamps() -> np.ndarray:
+    # every ~17 hours, over couple of years, in milliseconds
+    return np.arange(1546300800, 1609459200, 61237, dtype=np.int64) * 1000
+
+
+def test_buckets_match_datetime():
+    _stamps = _timestamps()
+    _buckets = TimeBuckets(_stamps)
+    _times = [datetime.fromtimestamp(i / 1000) for i in _stamps.tolist()]
+
+    assert [dayLabel(i) for i in _buckets.days] == [i.date() for i in _times]
+    assert [weekLabel(i) for i in _buckets.weeks] ==\
+        ['Week {}, {}'.format(int(i.strftime('%W')) + 1, i.year) for i in _times]
+    assert _buckets.weekDays.tolist() == [int(i.strftime('%w')) for i in _times]
+    assert [monthLabel(i) for i in _buckets.months] == [i.strftime('%b, %Y') for i in _times]
+    assert _buckets.quarters.tolist() == [i.hour // 6 for i in _times]
+    assert [minuteLabel(i) for i in _buckets.minutes] == [i.time().replace(second=0) for i in _times]
+
+
+def test_week_span_covers_all_days():
+    _buckets = TimeBuckets(_timestamps())
+    _span = weekSpan(_buckets.days.min(), _buckets.days.max())
+
+    assert _span.tolist() == sorted(_span.tolist())
+    assert set(_buckets.weeks.tolist()) <= set(_span.tolist())
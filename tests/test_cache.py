@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+
+from zipfile import ZipFile
+from json import dumps
+from fviz.cache import Cache
+
+
+def _export(tmp_path, name: str, reactions: list, album: dict = None) -> str:
+    _src = str(tmp_path / name)
+    with ZipFile(_src, mode='w') as zf:
+        zf.writestr('likes_and_reactions/posts_and_comments.json', dumps({'reactions': reactions}))
+        zf.writestr('photos_and_videos/album.json', dumps(album or {}))
+
+    return _src
+
+
+def test_round_trip(tmp_path):
+    _cache = Cache(str(tmp_path / 'cache'))
+    _key = _cache.key(_export(tmp_path, 'export.zip', []))
+
+    assert _cache.load(_key) is None
+    assert _cache.store(_key, ({'a': 1}, [1, 2]))
+    assert _cache.load(_key) == ({'a': 1}, [1, 2])
+    assert (_cache.hits, _cache.misses) == (1, 1)
+
+    assert _cache.storeIndex('Some One', {'b': 2})
+    assert _cache.loadIndex('Some One') == {'b': 2}
+
+    assert _cache.clear() == 2
+    assert _cache.load(_key) is None and _cache.loadIndex('Some One') is None
+
+
+def test_key_depends_on_members_read_and_options(tmp_path):
+    _cache = Cache(str(tmp_path / 'cache'))
+    _key = _cache.key(_export(tmp_path, 'a.zip', []))
+
+    # same content under different name, with unused members changed
+    assert _cache.key(_export(tmp_path, 'b.zip', [], {'photos': []})) == _key
+    assert _cache.key(_export(tmp_path, 'c.zip', [{'title': 'x'}])) != _key
+    assert _cache.key(_export(tmp_path, 'a.zip', []), True) != _key
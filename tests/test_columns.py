@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+
+from pickle import dumps, loads
+from fviz.model.message import Message
+from fviz.model.columns import MessageColumns
+
+
+def _messages():
+    return [Message('A', 1.5, 'hi', 'Generic'),
+            Message('B', 2.0, None, 'Share'),
+            Message('A', 3.25, 'there', 'Generic')]
+
+
+def test_contents_of_objectified_messages_are_loaded_lazily():
+    _columns = MessageColumns.fromMessages(_messages())
+
+    assert _columns.timestamps.tolist() == [1500, 2000, 3250]
+    assert [_columns.names[i] for i in _columns.senders] == ['A', 'B', 'A']
+    assert _columns._text is None
+
+    assert [_columns.content(i) for i in range(3)] == ['hi', None, 'there']
+    assert _columns.take(range(1, 3)).content(1) == 'there'
+
+
+def test_lazy_columns_survive_pickling():
+    _columns = loads(dumps(MessageColumns.fromMessages(_messages())))
+
+    assert _columns._text is None
+    assert _columns.message(2).content == 'there'
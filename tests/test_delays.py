@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+
+from math import isnan
+import numpy as np
+import pytest
+from fviz.model.delays import Delays
+
+
+@pytest.mark.parametrize('timestamps', [[], [5]])
+def test_no_delays(timestamps):
+    _delays = Delays(timestamps)
+
+    assert len(_delays) == 0
+    assert _delays.total == 0
+    assert isnan(_delays.mean)
+    assert isnan(_delays.median)
+    assert isnan(_delays.percentile(90))
+    assert _delays.cumulativePercentage.size == 0
+
+
+def test_single_delay():
+    _delays = Delays([5, 12])
+
+    assert _delays.total == 7
+    assert _delays.mean == 7
+    assert _delays.median == 7
+    assert _delays.percentile(0) == _delays.percentile(100) == 7
+    assert _delays.cumulativePercentage.tolist() == [100]
+
+
+def test_matches_numpy():
+    _timestamps = [40, 10, 25, 25, 90, 91, 3]
+    _expected = np.abs(np.diff(_timestamps))
+    _delays = Delays(_timestamps)
+
+    assert _delays.mean == pytest.approx(_expected.mean())
+    for q in (0, 10, 50, 75, 99, 100):
+        assert _delays.percentile(q) == pytest.approx(np.percentile(_expected, q))
+    assert _delays.cumulativePercentage[-1] == pytest.approx(100)
@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+
+from json import dumps
+from datetime import datetime
+from fviz.source import DirSource
+from fviz.model.friends import Friends
+from fviz.model.events import EventLog
+from fviz.model.peers import PeerIndex, FRIEND
+
+
+def _friends(tmp_path) -> Friends:
+    (tmp_path / 'friends.json').write_text(dumps({'friends': [
+        {'name': 'B', 'timestamp': int(datetime(2020, 3, 1).timestamp())},
+        {'name': 'A', 'timestamp': int(datetime(2020, 1, 1).timestamp())},
+        {'name': 'C', 'timestamp': int(datetime(2020, 2, 1).timestamp())}
+    ]}))
+
+    return Friends.fromJSON('friends.json', DirSource(str(tmp_path)))
+
+
+def test_peers_built_only_on_first_access(tmp_path, monkeypatch):
+    _built = []
+    _fromModels = PeerIndex.fromModels
+    monkeypatch.setattr(PeerIndex, 'fromModels',
+                        staticmethod(lambda *e: _built.append(e) or _fromModels(*e)))
+
+    _events = EventLog.fromModels(friends=_friends(tmp_path))
+    assert len(_events) == 3
+    assert list(_events.timestamps) == sorted(_events.timestamps)
+    assert len(_events.buckets.quarters) == 3
+    assert not _built
+
+    assert _events.peerCounts((FRIEND,), exclude=['B']) == {'A': 1, 'C': 1}
+    assert [_events.peerIndex.name(i) for i in _events.peers] == ['A', 'C', 'B']
+    assert len(_built) == 1
+
+
+def test_empty_event_log():
+    _events = EventLog.fromModels()
+
+    assert len(_events) == 0
+    assert _events.peerCounts((FRIEND,)) == {}
@@ -0,0 +1,30 @@
+#!/usr/bin/python3
+
+from json import dumps
+from datetime import datetime
+from fviz.source import DirSource
+from fviz.model.friends import Friends
+from fviz.plot.friends import prepareDataForPlottingMonthlyFriendsCreated
+
+
+def _friends(tmp_path) -> Friends:
+    (tmp_path / 'friends.json').write_text(dumps({'friends': [
+        {'name': 'B', 'timestamp': int(datetime(2020, 3, 1).timestamp())},
+        {'name': 'A', 'timestamp': int(datetime(2020, 1, 1).timestamp())}
+    ]}))
+
+    return Friends.fromJSON('friends.json', DirSource(str(tmp_path)))
+
+
+def test_monthly_friends(tmp_path):
+    _x, _y = prepareDataForPlottingMonthlyFriendsCreated(_friends(tmp_path))
+
+    assert _x[0] == 'Jan, 2020' and _x[-1] == 'Mar, 2020'
+    assert sum(_y) == 2
+
+
+def test_no_friends_in_time_window(tmp_path):
+    _window = _friends(tmp_path).between(datetime(2021, 1, 1), None)
+
+    assert _window.count == 0
+    assert prepareDataForPlottingMonthlyFriendsCreated(_window) is None
@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+
+from argparse import Namespace
+from os import walk
+from os.path import join, relpath, basename
+import sys
+from zipfile import ZipFile
+from json import dumps
+import pytest
+from fviz.main import _buildPipeline, _getCMD, _sourcesOf, _PLOTS, _SOURCES
+from fviz.cache import Cache
+from fviz.extract import MANIFEST
+
+_EXPORT = {
+    'likes_and_reactions/posts_and_comments.json': {'reactions': [
+        {'title': 'Me likes Peer\'s post.', 'timestamp': 1580000000,
+         'data': [{'reaction': {'reaction': 'LIKE', 'actor': 'Me'}}]}
+    ]},
+    'friends/friends.json': {'friends': [{'name': 'Peer', 'timestamp': 1570000000}]},
+    'comments/comments.json': {'comments': [
+        {'title': 'Me commented on Peer\'s post.', 'timestamp': 1590000000,
+         'data': [{'comment': {'comment': 'x', 'author': 'Me'}}]}
+    ]},
+    'messages/inbox/peer_1/message_1.json': {
+        'title': 'Peer', 'participants': [{'name': 'Peer'}, {'name': 'Me'}], 'is_still_participant': True,
+        'messages': [{'sender_name': 'Me', 'timestamp_ms': 1590000000000, 'content': 'x', 'type': 'Generic'}]
+    },
+    'messages/inbox/peer_2/message_1.json': {
+        'title': 'Other', 'participants': [{'name': 'Other'}, {'name': 'Me'}], 'is_still_participant': True,
+        'messages': [{'sender_name': 'Other', 'timestamp_ms': 1580000000000, 'content': 'y', 'type': 'Generic'}]
+    },
+    'photos_and_videos/album.json': {}
+}
+
+# top level directories of export, each plot is expected to extract
+_EXPECTED = {
+    'reactionCount': {'likes_and_reactions'},
+    'topCommentedPeers': {'comments'},
+    'busiestChats': {'messages'},
+    'activityOnEachQuarterOfDay': {'likes_and_reactions', 'comments'},
+    'highlyInteractedPeers': {'likes_and_reactions', 'comments', 'messages'},
+    # friends don't record actor, which is taken from reactions
+    'monthlyFriendingRate': {'friends', 'likes_and_reactions'}
+}
+
+
+class _Renderer:
+    '''
+        Keeps data of plots asked to be rendered, by their
+        sink file name, instead of drawing them
+    '''
+
+    def __init__(self):
+        self.rendered = {}
+
+    def render(self, plot, data, title, sink, *extra) -> bool:
+        self.rendered[basename(sink)] = repr(data)
+        return True
+
+
+def _args(tmp_path, extractAt: str = None) -> Namespace:
+    _src = str(tmp_path / 'export.zip')
+    with ZipFile(_src, mode='w') as zf:
+        for k, v in _EXPORT.items():
+            zf.writestr(k, dumps(v))
+
+    return Namespace(src=_src,
+                     extractAt=extractAt,
+                     sink=str(tmp_path / 'plots'),
+                     noCache=True,
+                     cache=str(tmp_path / 'cache'),
+                     clearCache=False,
+                     backend='thread',
+                     workers=1,
+                     columnar=False,
+                     incremental=False,
+                     since=None,
+                     until=None,
+                     raster=[])
+
+
+@pytest.mark.parametrize('plot', [i[0] for i in _PLOTS])
+def test_plot_requires_only_its_sources(plot, tmp_path):
+    _models = set([j for i in _PLOTS if i[0] == plot for k in i[2] for j in _sourcesOf(k)])
+    _withActor = [i[0] for i in _SOURCES if i[3]]
+
+    _pipeline, _targets = _buildPipeline(_args(tmp_path), None, [plot])
+    _required = _pipeline.required(_targets)
+    _parsed = set([i[0] for i in _SOURCES if 'parsed.{}'.format(i[0]) in _required])
+
+    # plots drawn only from sources without actor, take it from first one having
+    assert _parsed == (_models if _models & set(_withActor) else _models | {_withActor[0]})
+
+
+@pytest.mark.parametrize('plot', sorted(_EXPECTED))
+def test_only_extracts_sources_of_selected_plots(plot, tmp_path):
+    _sink = tmp_path / 'extracted'
+    _pipeline, _ = _buildPipeline(_args(tmp_path, str(_sink)), None, [plot])
+
+    _results, _errors = _pipeline.run(['source'])
+    assert not _errors
+
+    _extracted = set([relpath(join(root, i), _sink).split('/')[0]
+                      for root, _, files in walk(_sink) for i in files if i != MANIFEST])
+    assert _extracted == _EXPECTED[plot]
+
+
+def test_store_only_when_all_sources_are_required(tmp_path):
+    _, _targets = _buildPipeline(_args(tmp_path), None, ['busiestChats'])
+    assert 'store' not in _targets
+
+    _, _targets = _buildPipeline(_args(tmp_path), None, [i[0] for i in _PLOTS])
+    assert 'store' in _targets
+
+
+def test_only_restricts_extraction_and_pipeline(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['fviz',
+                                      _args(tmp_path).src,
+                                      str(tmp_path / 'extracted'),
+                                      str(tmp_path / 'plots'),
+                                      '--no-cache',
+                                      '--backend', 'thread',
+                                      '--only', 'topCommentedPeers,busiestChats'])
+    _parsed = _getCMD()
+    assert _parsed.plots == ['topCommentedPeers', 'busiestChats']
+
+    _renderer = _Renderer()
+    _pipeline, _targets = _buildPipeline(_parsed, _renderer, _parsed.plots)
+    _results, _errors = _pipeline.run(_targets)
+    assert not _errors
+
+    assert set(_renderer.rendered) == set([i[5].format('Me') for i in _PLOTS if i[0] in _parsed.plots])
+    assert set([i for i in _results if i.startswith('parsed.')]) == {'parsed.comments', 'parsed.messenger'}
+    assert not any(i[0] in _results for i in _PLOTS if i[0] not in _parsed.plots)
+
+    _extracted = set([relpath(join(root, i), tmp_path / 'extracted').split('/')[0]
+                      for root, _, files in walk(tmp_path / 'extracted') for i in files if i != MANIFEST])
+    assert _extracted == {'comments', 'messages'}
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    _cached = _args(tmp_path)
+    _cached.noCache = False
+    _plots = [i[0] for i in _PLOTS]
+
+    _renderer = _Renderer()
+    _pipeline, _targets = _buildPipeline(_cached, _renderer, _plots)
+    _results, _errors = _pipeline.run(_targets)
+    assert not _errors and _results['store']
+    assert len(Cache(_cached.cache).entries) == 1
+
+    def _fail(*args):
+        raise Exception('Parsed despite cache hit')
+
+    monkeypatch.setattr('fviz.main._SOURCES', tuple([(i[0], _fail, *i[2:]) for i in _SOURCES]))
+    _hit = _Renderer()
+    _pipeline, _targets = _buildPipeline(_cached, _hit, _plots)
+    _results, _errors = _pipeline.run(_targets)
+
+    assert not _errors and _results['cached']
+    assert len(_hit.rendered) == len(_PLOTS)
+    assert _hit.rendered == _renderer.rendered
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+from pickle import dumps, loads
+from types import MappingProxyType
+import numpy as np
+import pytest
+from fviz.model.memo import Memoized, memoized, stats, resetStats
+
+
+class _Records(Memoized):
+
+    def __init__(self, records):
+        self.records = records
+        self.computed = 0
+
+    @memoized('records')
+    def counts(self):
+        self.computed += 1
+        return {'total': len(self.records), 'values': list(self.records)}
+
+    @memoized('records')
+    def values(self):
+        return np.array(self.records)
+
+
+def test_computed_once_while_records_stay_same():
+    _records = _Records([1, 2, 3])
+
+    assert _records.counts is _records.counts
+    assert _records.computed == 1
+
+
+def test_invalidated_when_record_list_changes():
+    _records = _Records([1, 2, 3])
+    assert _records.counts['total'] == 3
+
+    # grown in place
+    _records.records.append(4)
+    assert _records.counts['total'] == 4
+    assert _records.computed == 2
+
+    # replaced
+    _records.records = [5]
+    assert _records.counts['values'] == (5,)
+    assert _records.computed == 3
+
+    _records.invalidate()
+    assert _records.counts['total'] == 1
+    assert _records.computed == 4
+
+
+def test_memoized_values_are_read_only():
+    _records = _Records([1, 2, 3])
+
+    assert isinstance(_records.counts, MappingProxyType)
+    assert _records.counts['values'] == (1, 2, 3)
+    with pytest.raises(TypeError):
+        _records.counts['total'] = 0
+    with pytest.raises(ValueError):
+        _records.values[0] = 0
+
+
+def test_memoized_values_never_cross_pickle():
+    _records = _Records([1, 2, 3])
+    _records.counts
+
+    _copy = loads(dumps(_records))
+    assert '_memo' not in _copy.__dict__ and '_memoLock' not in _copy.__dict__
+    assert _copy.counts['total'] == 3
+    assert _copy.computed == 2
+
+
+def test_hits_and_misses():
+    resetStats()
+    _records = _Records([1, 2, 3])
+    for _ in range(3):
+        _records.counts
+
+    assert stats()['_Records.counts'] == (2, 1)
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+
+from json import dumps
+from fviz.source import DirSource
+from fviz.model.messages import MessagesHeader
+
+
+def _thread(tmp_path, messages):
+    (tmp_path / 'message_1.json').write_text(dumps({
+        'title': 'Peer',
+        'participants': [{'name': 'Peer'}, {'name': 'Me'}],
+        'is_still_participant': True,
+        'messages': messages
+    }))
+
+    return MessagesHeader.fromJSON(['message_1.json'], DirSource(str(tmp_path)))
+
+
+def test_header_of_empty_thread(tmp_path):
+    _header = _thread(tmp_path, [])
+
+    assert _header.count == 0
+    assert _header.timespan is None
+    assert not _header.isLoaded
+
+
+def test_header_matches_loaded_thread(tmp_path):
+    _header = _thread(tmp_path, [
+        {'sender_name': 'Me', 'timestamp_ms': 3000, 'content': 'c', 'type': 'Generic'},
+        {'sender_name': 'Peer', 'timestamp_ms': 1000, 'content': 'a', 'type': 'Generic'},
+        {'sender_name': 'Peer', 'timestamp_ms': 2000, 'content': 'b', 'type': 'Generic'}
+    ])
+
+    assert _header.count == 3
+    assert _header.name == 'Peer <-> Me'
+    assert not _header.isLoaded
+
+    assert _header.timespan == _header.thread.timespan
+    assert _header.thread.count == _header.count
+    assert _header.isLoaded
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+
+from json import dumps
+from pickle import dumps as pickleDumps, loads as pickleLoads
+from random import Random
+from functools import reduce
+from operator import mul
+from concurrent.futures import ThreadPoolExecutor
+from fviz.source import DirSource
+from fviz.model.messenger import Messenger
+from fviz.model.events import EventLog
+from fviz.model.peers import MESSAGE
+
+_WEEK = 7 * 24 * 3600 * 1000
+
+
+def _inbox(tmp_path, threads):
+    '''
+        Writes chat threads, given as title -> ( participants, messages ),
+        into an inbox, returning their paths along with source
+    '''
+    for k, (participants, messages) in threads.items():
+        (tmp_path / k).mkdir()
+        (tmp_path / k / 'message_1.json').write_text(dumps({
+            'title': k,
+            'participants': [{'name': i} for i in participants],
+            'is_still_participant': True,
+            'messages': messages
+        }))
+
+    return [['{}/message_1.json'.format(i)] for i in threads], DirSource(str(tmp_path))
+
+
+def _chats(seed: int, count: int, weeks: int):
+    '''
+        Private chats with random activity over given weeks, where many
+        weeks are one sided, so that they tie with score 0
+    '''
+    _random = Random(seed)
+    _threads = {}
+
+    for i in range(count):
+        _peer = 'Peer {}'.format(i)
+        _messages = []
+        for j in _random.sample(range(weeks), weeks // 2):
+            for k in range(_random.randint(1, 4)):
+                _messages.append({'sender_name': _random.choice([_peer, 'Me']),
+                                  'timestamp_ms': j * _WEEK + k * 1000,
+                                  'content': 'x',
+                                  'type': 'Generic'})
+
+        _threads['peer_{}'.format(i)] = (['Me', _peer], sorted(_messages, key=lambda e: -e['timestamp_ms']))
+
+    return _threads
+
+
+def test_owner_is_common_to_private_chats(tmp_path):
+    _paths, _source = _inbox(tmp_path, {
+        'group': (['A', 'B', 'C'], []),
+        'a': (['A', 'Me'], []),
+        'b': (['Me', 'B'], [])
+    })
+
+    assert Messenger.findOwner(_paths, _source) == 'Me'
+
+
+def test_owner_of_single_private_chat_is_unknown(tmp_path):
+    _paths, _source = _inbox(tmp_path, {'a': (['A', 'Me'], [])})
+
+    assert Messenger.findOwner(_paths, _source) is None
+    assert Messenger.findOwner([], _source) is None
+
+
+def test_weekly_buckets_built_once_under_concurrent_access(tmp_path):
+    _paths, _source = _inbox(tmp_path, _chats(7, 12, 40))
+    _expected = Messenger.fromJSON(_paths, _source, backend='thread').topChatThreadPerWeek
+
+    for _ in range(5):
+        _messenger = Messenger.fromJSON(_paths, _source, backend='thread')
+        with ThreadPoolExecutor(8) as _exec:
+            _weekly = list(_exec.map(lambda e: _messenger.weeklyBuckets, range(8)))
+
+        assert all(i is _weekly[0] for i in _weekly)
+        assert _messenger.topChatThreadPerWeek == _expected
+
+
+def test_aggregates_only_cross_pickle_as_snapshot(tmp_path):
+    _paths, _source = _inbox(tmp_path, _chats(3, 6, 20))
+    _messenger = Messenger.fromJSON(_paths, _source, backend='thread')
+    _expected = _messenger.topChatThreadPerWeek
+
+    _copy = pickleLoads(pickleDumps(_messenger))
+    assert _copy._weekly is None and _copy._winners is None
+    assert _copy.topChatThreadPerWeek == _expected
+
+    _copy, _aggregates = pickleLoads(pickleDumps((_messenger, _messenger.aggregates)))
+    _copy.restore(_aggregates)
+    assert all(j in _copy.inbox for i in _copy._weekly.values() for j in i)
+    assert _copy.topChatThreadPerWeek == _expected
+
+
+def test_update_matches_fresh_parse_with_tied_weeks(tmp_path):
+    (tmp_path / 'v1').mkdir()
+    (tmp_path / 'v2').mkdir()
+    _old = _chats(11, 10, 30)
+    _new = _chats(13, 10, 30)
+    # half of chat threads change, while a new one shows up, in between
+    _current = dict([(k, _new[k] if i % 2 else v) for i, (k, v) in enumerate(_old.items())])
+    _current['peer_0_'] = (['Me', 'Peer X'], _new['peer_0'][1])
+    _changed = [k for i, k in enumerate(_old) if i % 2] + ['peer_0_']
+
+    _paths, _source = _inbox(tmp_path / 'v1', _old)
+    _previous = Messenger.fromJSON(_paths, _source, backend='thread')
+    _previous.weeklyBuckets
+
+    _paths, _source = _inbox(tmp_path / 'v2', dict(sorted(_current.items())))
+    _parsed = Messenger.fromJSON([[i] for i in sorted('{}/message_1.json'.format(i) for i in _changed)],
+                                 _source,
+                                 backend='thread')
+    _previous.update([i for i in _previous.inbox if i.title in _changed], _parsed.inbox)
+
+    _fresh = Messenger.fromJSON(_paths, _source, backend='thread')
+    assert _previous.topChatThreadPerWeek == _fresh.topChatThreadPerWeek
+    # there're weeks, where top chat thread is tied with others
+    assert any([reduce(mul, i.values(), 1) for i in v.values()].count(_fresh._winners[k][0]) > 1
+               for k, v in _fresh.weeklyBuckets.items())
+
+
+def test_columnar_and_object_messages_give_same_aggregates(tmp_path):
+    _threads = _chats(5, 8, 25)
+    _threads['group'] = (['Peer 1', 'Me', 'Peer 2'],
+                         [{'sender_name': 'Peer 2', 'timestamp_ms': 3 * _WEEK, 'type': 'Share'},
+                          {'sender_name': 'Me', 'timestamp_ms': 2 * _WEEK, 'content': 'y', 'type': 'Generic'},
+                          {'sender_name': 'Peer 1', 'timestamp_ms': _WEEK, 'type': 'Call'}])
+    _paths, _source = _inbox(tmp_path, _threads)
+
+    _objects, _columns = [Messenger.fromJSON(_paths, _source, backend='thread', columnar=i)
+                          for i in (False, True)]
+
+    for i in (_objects, _columns):
+        assert i.count == len(_threads)
+    assert _objects.owner == _columns.owner == 'Me'
+    assert _objects.timespan == _columns.timespan
+    assert _objects.topXBusiestChats() == _columns.topXBusiestChats()
+    assert dict(_objects.peerToMessageCount) == dict(_columns.peerToMessageCount)
+    assert _objects.topChatThreadPerWeek == _columns.topChatThreadPerWeek
+    assert _objects.topXPrivateChatsWithHighestContributionFromParticipant(5, 'Me') ==\
+        _columns.topXPrivateChatsWithHighestContributionFromParticipant(5, 'Me')
+    assert _objects.topXPrivateChatsWithLowestContributionFromParticipant(5, 'Me') ==\
+        _columns.topXPrivateChatsWithLowestContributionFromParticipant(5, 'Me')
+
+    _objects, _columns = [EventLog.fromModels(messenger=i) for i in (_objects, _columns)]
+    assert _objects.timestamps.tolist() == _columns.timestamps.tolist()
+    assert [_objects.subtypeNames[i] for i in _objects.subtypes] ==\
+        [_columns.subtypeNames[i] for i in _columns.subtypes]
+    assert _objects.peerCounts((MESSAGE,)) == _columns.peerCounts((MESSAGE,))
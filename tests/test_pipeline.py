@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+from threading import Lock
+import pytest
+from fviz.pipeline import Pipeline
+
+
+def test_tasks_get_results_of_dependencies_in_order():
+    _pipeline = Pipeline()
+    _pipeline.add('a', lambda: 2)
+    _pipeline.add('b', lambda: 3)
+    _pipeline.add('c', lambda a, b: a - b, 'a', 'b')
+    _pipeline.add('d', lambda c, a: c * a, 'c', 'a')
+
+    _results, _errors = _pipeline.run()
+    assert not _errors
+    assert _results == {'a': 2, 'b': 3, 'c': -1, 'd': -2}
+
+
+def test_only_required_tasks_run_once():
+    _runs = []
+    _lock = Lock()
+
+    def _task(name, value):
+        def _run(*args):
+            with _lock:
+                _runs.append(name)
+            return value
+
+        return _run
+
+    _pipeline = Pipeline()
+    _pipeline.add('shared', _task('shared', 1))
+    _pipeline.add('x', _task('x', 2), 'shared')
+    _pipeline.add('y', _task('y', 3), 'shared')
+    _pipeline.add('z', _task('z', 4))
+
+    assert _pipeline.required(['x', 'y']) == {'shared', 'x', 'y'}
+    _results, _ = _pipeline.run(['x', 'y'])
+    assert sorted(_runs) == ['shared', 'x', 'y']
+    assert 'z' not in _results
+
+
+def test_dependents_of_failed_task_are_skipped():
+    def _fail():
+        raise ValueError('broken')
+
+    _pipeline = Pipeline()
+    _pipeline.add('ok', lambda: 1)
+    _pipeline.add('broken', _fail)
+    _pipeline.add('after', lambda e: e, 'broken')
+    _pipeline.add('afterAll', lambda a, b: a, 'ok', 'after')
+    _pipeline.add('unaffected', lambda e: e + 1, 'ok')
+
+    _results, _errors = _pipeline.run()
+    assert list(_errors) == ['broken']
+    assert _results == {'ok': 1, 'unaffected': 2}
+
+
+def test_graph_is_acyclic_by_construction():
+    _pipeline = Pipeline()
+    _pipeline.add('a', lambda: 1)
+
+    with pytest.raises(ValueError):
+        _pipeline.add('a', lambda: 2)
+    with pytest.raises(ValueError):
+        _pipeline.add('b', lambda e: e, 'c')
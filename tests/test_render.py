@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+from subprocess import run
+from io import BytesIO
+import sys
+import numpy as np
+from fviz.render import Renderer
+from fviz.plot.backend import plt
+from fviz.plot.heatmap import drawHeatMap
+
+
+def _plot(data, title, sink) -> bool:
+    _fig, _ax = plt.subplots()
+    _ax.bar(range(len(data)), data)
+    _ax.set_title(title)
+    _fig.savefig(sink)
+    plt.close(_fig)
+    return True
+
+
+def _svg(data: np.ndarray, raster: bool) -> str:
+    _fig, _ax = plt.subplots()
+    drawHeatMap(data, _ax, 'Blues', .5, raster=raster)
+    _buffer = BytesIO()
+    _fig.savefig(_buffer, format='svg')
+    plt.close(_fig)
+    return _buffer.getvalue().decode()
+
+
+def test_plotting_stack_imported_lazily():
+    _code = 'import sys, fviz.main; print(any(i in sys.modules for i in ("matplotlib", "seaborn")))'
+
+    assert run([sys.executable, '-c', _code], capture_output=True, text=True).stdout.strip() == 'False'
+
+
+def test_single_job_renders_in_calling_process(tmp_path):
+    with Renderer(1) as _renderer:
+        assert _renderer.render(_plot, [1, 3, 2], 'Title', str(tmp_path / 'plot.png'))
+        assert _renderer._exec is None
+
+    assert (tmp_path / 'plot.png').stat().st_size
+
+
+def test_rasterized_heatmap_cells_drawn_as_single_image():
+    _data = np.random.RandomState(0).randint(0, 10, size=(7, 60))
+
+    _vector, _raster = _svg(_data, False), _svg(_data, True)
+    # one vector path per cell, unless rasterized
+    assert _vector.count('<path') >= _data.size
+    assert _raster.count('<path') < _data.size // 4
+    assert _raster.count('<image') == _vector.count('<image') + 1
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+from io import StringIO
+from json import dumps, loads
+import pytest
+from fviz.stream import streamObject
+
+
+def _stream(text: str, chunkSize: int):
+    _items = []
+    _rest = streamObject(StringIO(text), {'messages': _items.append}, chunkSize=chunkSize)
+    return _rest, _items
+
+
+@pytest.mark.parametrize('chunkSize', range(1, 12))
+@pytest.mark.parametrize('text', [
+    '{"n":123456,"messages":[1.0,2,300000]}',
+    '{"messages":[-1.5e10,2.25E-3,1e+2,-0],"n":-1.5e10}',
+    '{"messages":[{"content":"a, b"},"x",true,null,[1,2]],"title":"t"}',
+    '{"messages":[],"n":7}',
+    '{ "n" : 1.5 , "messages" : [ 10 , 20.5 ] }'
+])
+def test_matches_json_at_every_chunk_size(text, chunkSize):
+    _expected = loads(text)
+
+    _rest, _items = _stream(text, chunkSize)
+
+    assert _items == _expected.pop('messages')
+    assert _rest == _expected
+
+
+@pytest.mark.parametrize('chunkSize', range(1, 8))
+def test_number_split_at_chunk_boundary(chunkSize):
+    _numbers = [1.0, -1.5e10, 123456, 0.000125, 2e-308]
+
+    _, _items = _stream(dumps({'messages': _numbers}), chunkSize)
+
+    assert _items == _numbers
+
+
+@pytest.mark.parametrize('chunkSize', [1, 3, 1 << 16])
+def test_empty_object(chunkSize):
+    assert _stream('{}', chunkSize) == ({}, [])
+
+
+@pytest.mark.parametrize('text', [
+    '{"messages":[1,2',
+    '{"messages":[1 2]}',
+    '{"n":1 "messages":[]}'
+])
+def test_malformed(text):
+    with pytest.raises(ValueError):
+        _stream(text, 2)
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+
+import numpy as np
+import pytest
+from fviz.model.topk import topK, bottomK, topKIndices, groupedTopK
+
+
+@pytest.mark.parametrize('k', [0, 1, 3, 10, 50])
+def test_matches_stable_sort(k):
+    _counts = np.random.RandomState(k).randint(0, 5, size=40)
+    _items = list(enumerate(_counts.tolist()))
+
+    assert topKIndices(_counts, k).tolist() == np.argsort(-_counts, kind='stable')[:k].tolist()
+    assert topK(_items, k, key=lambda e: e[1]) == sorted(_items, key=lambda e: -e[1])[:k]
+    assert bottomK(_items, k, key=lambda e: e[1]) == sorted(_items, key=lambda e: e[1])[:k]
+
+
+def test_grouped_top_k_breaks_ties_on_first_appearance():
+    _groups = np.array([0, 0, 0, 0, 1, 1, 1])
+    _keys = np.array([3, 1, 1, 3, 2, 0, 2])
+
+    assert groupedTopK(_groups, _keys, 1) == {0: [(3, 2)], 1: [(2, 2)]}
+    assert groupedTopK(_groups, _keys, 5) == {0: [(3, 2), (1, 2)], 1: [(2, 2), (0, 1)]}
+    assert groupedTopK(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), 3) == {}